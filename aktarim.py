@@ -0,0 +1,196 @@
+"""Kayıtlı oturumları analiz araçları için dışa aktarır.
+
+Kullanım: python aktarim.py cikti.npz [--oturum 3] [--sensor BMP280] [--alan sicaklik] [--bas 60 --son 120]
+
+Biçim dosya uzantısından seçilir: .csv, .npy (tek yapılı dizi), .npz (sütun
+başına bir dizi) ya da .parquet (pyarrow kuruluysa). Satırlar (oturum,
+zaman) indeksi üzerinden zaman sırasıyla okunur ve sabit boyutlu parçalar
+halinde doğrudan NumPy dizilerine alınır; milyonlarca satırlık bir oturumda
+da bellek kullanımı parça boyutuyla sınırlıdır. Zamanlar oturumun ilk
+örneğinden itibaren saniyedir.
+"""
+import argparse
+import itertools
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+from veritabani import KAYIT_DOSYASI, SENSOR_ALANLARI, tablo_adi, oturum_araligi
+
+BICIMLER = ("csv", "npy", "npz", "parquet")
+PARCA = 100_000  # satır
+
+
+def veri_tipi(alanlar):
+    return np.dtype([("zaman", "f8"), ("sensor_id", "i8")] + [(alan, "f8") for alan in alanlar])
+
+
+def parcalar(conn, sensor, oturum, alanlar, bas, son, t0=0.0, parca=PARCA, limit=-1):
+    """[bas, son] aralığındaki satırları en fazla parca satırlık yapılı dizilerle döndürür.
+
+    bas/son kayıttaki (monotonic) zamanlardır, dönen zaman sütunu t0'a
+    göredir. Tek imleç (oturum, zaman) indeksinde ilerler, satırlar Python
+    listesinde biriktirilmeden np.fromiter ile diziye yazılır; boş (NULL)
+    değerler NaN olur.
+    """
+    tip = veri_tipi(alanlar)
+    imlec = conn.execute(
+        f"SELECT zaman - ?, sensor_id, {', '.join(alanlar)} FROM {tablo_adi(sensor)} "
+        f"WHERE oturum=? AND zaman>=? AND zaman<=? ORDER BY zaman LIMIT ?",
+        (t0, oturum, bas, son, limit))
+    while True:
+        dizi = np.fromiter(itertools.islice(imlec, parca), dtype=tip)
+        if not len(dizi):
+            return
+        yield dizi
+
+
+def disa_aktar(conn, dosya, oturum, sensor="BMP280", alanlar=None, bas=None, son=None,
+               bicim=None, parca=PARCA, sikistir=False, ilerleme=None):
+    """Bir oturumun sensör tablosunu dosyaya yazar, yazılan satır sayısını döndürür.
+
+    bas/son oturum başından itibaren saniyedir (None: baştan/sona kadar),
+    alanlar verilmezse sensörün bütün alanları yazılır. ilerleme verilirse
+    her parçadan sonra ilerleme(yazılan, toplam) çağrılır. Geçersiz sensör,
+    alan, biçim ya da boş oturum için ValueError yükselir.
+    """
+    if sensor not in SENSOR_ALANLARI:
+        raise ValueError(f"Bilinmeyen sensör: {sensor}")
+    alanlar = list(alanlar or SENSOR_ALANLARI[sensor])
+    bilinmeyen = [alan for alan in alanlar if alan not in SENSOR_ALANLARI[sensor]]
+    if bilinmeyen:
+        raise ValueError(f"{sensor} alanı değil: {', '.join(bilinmeyen)}")
+    bicim = bicim or os.path.splitext(dosya)[1].lstrip(".").lower()
+    if bicim not in BICIMLER:
+        raise ValueError(f"Desteklenmeyen biçim: {bicim!r} ({', '.join(BICIMLER)})")
+
+    t0, t_son = oturum_araligi(conn, oturum)
+    if t0 is None:
+        raise ValueError(f"Oturum #{oturum} boş ya da yok")
+    ilk = t0 if bas is None else t0 + bas
+    sonuncu = t_son if son is None else t0 + son
+    # kayıt sürerken eklenen satırlar sayıma uysun diye okuma bu sayıyla sınırlanır
+    toplam, = conn.execute(f"SELECT COUNT(*) FROM {tablo_adi(sensor)} WHERE oturum=? AND zaman>=? AND zaman<=?",
+                           (oturum, ilk, sonuncu)).fetchone()
+
+    def akis():
+        yazilan = 0
+        for dizi in parcalar(conn, sensor, oturum, alanlar, ilk, sonuncu, t0, parca, toplam):
+            yield dizi
+            yazilan += len(dizi)
+            if ilerleme is not None:
+                ilerleme(yazilan, toplam)
+
+    yazici = {"csv": _csv_yaz, "npy": _npy_yaz, "npz": _npz_yaz, "parquet": _parquet_yaz}[bicim]
+    return yazici(dosya, akis(), veri_tipi(alanlar), toplam, sikistir)
+
+
+def _csv_yaz(dosya, akis, tip, toplam, sikistir):
+    # np.savetxt satır satır biçimler; parça tek % işlemiyle yazılır. %r Python float'ının
+    # geri okununca aynı değeri veren en kısa yazımıdır, CSV'de hassasiyet kaybolmaz
+    satir = ",".join(["%r"] * len(tip.names)) + "\n"
+    yazilan = 0
+    with open(dosya, "w", newline="") as f:
+        f.write(",".join(tip.names) + "\n")
+        for dizi in akis:
+            sutunlar = [dizi[ad].tolist() for ad in tip.names]
+            f.write((satir * len(dizi)) % tuple(itertools.chain.from_iterable(zip(*sutunlar))))
+            yazilan += len(dizi)
+    return yazilan
+
+
+def _baslik_yaz(f, tip, adet):
+    np.lib.format.write_array_header_1_0(f, {
+        "descr": np.lib.format.dtype_to_descr(tip), "fortran_order": False, "shape": (adet,)})
+
+
+def _npy_yaz(dosya, akis, tip, toplam, sikistir):
+    # satır sayısı baştan bilindiğinden başlık önce yazılır, parçalar arkasına eklenir
+    yazilan = 0
+    with open(dosya, "wb") as f:
+        _baslik_yaz(f, tip, toplam)
+        for dizi in akis:
+            f.write(dizi.tobytes())
+            yazilan += len(dizi)
+    return yazilan
+
+
+def _npz_yaz(dosya, akis, tip, toplam, sikistir):
+    # önce geçici bir .npy'ye tek geçişte yazılır, sonra her sütun bundan parça parça
+    # zip'e akıtılır; np.load(dosya)["sicaklik"] gibi sütun adıyla okunur
+    klasor = os.path.dirname(os.path.abspath(dosya))
+    sikistirma = zipfile.ZIP_DEFLATED if sikistir else zipfile.ZIP_STORED
+    with tempfile.TemporaryDirectory(dir=klasor) as gecici:
+        ara = os.path.join(gecici, "ara.npy")
+        yazilan = _npy_yaz(ara, akis, tip, toplam, sikistir)
+        with open(ara, "rb") as kaynak, zipfile.ZipFile(dosya, "w", sikistirma, allowZip64=True) as zf:
+            np.lib.format.read_magic(kaynak)
+            np.lib.format.read_array_header_1_0(kaynak)
+            veri_basi = kaynak.tell()
+            for ad in tip.names:
+                kaynak.seek(veri_basi)
+                with zf.open(f"{ad}.npy", "w", force_zip64=True) as f:
+                    _baslik_yaz(f, tip[ad], yazilan)
+                    for i in range(0, yazilan, PARCA):
+                        dizi = np.fromfile(kaynak, dtype=tip, count=min(PARCA, yazilan - i))
+                        f.write(np.ascontiguousarray(dizi[ad]).tobytes())
+    return yazilan
+
+
+def _parquet_yaz(dosya, akis, tip, toplam, sikistir):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet için pyarrow gerekli (pip install pyarrow)") from None
+    sema = pa.schema([(ad, pa.from_numpy_dtype(tip[ad])) for ad in tip.names])
+    yazilan = 0
+    # her parça ayrı bir satır grubu olur
+    with pq.ParquetWriter(dosya, sema, compression="zstd" if sikistir else "snappy") as yazici:
+        for dizi in akis:
+            yazici.write_table(pa.Table.from_arrays([pa.array(dizi[ad]) for ad in tip.names], schema=sema))
+            yazilan += len(dizi)
+    return yazilan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cikti", help="çıktı dosyası (.csv, .npy, .npz, .parquet)")
+    parser.add_argument("--db", default=KAYIT_DOSYASI, help="telemetri veritabanı")
+    parser.add_argument("--oturum", type=int, help="oturum numarası (verilmezse en son oturum)")
+    parser.add_argument("--sensor", choices=list(SENSOR_ALANLARI), default="BMP280")
+    parser.add_argument("--alan", action="append", help="yazılacak alan (birden fazla verilebilir, varsayılan hepsi)")
+    parser.add_argument("--bas", type=float, help="oturum başından itibaren başlangıç (s)")
+    parser.add_argument("--son", type=float, help="oturum başından itibaren bitiş (s)")
+    parser.add_argument("--bicim", choices=BICIMLER, help="uzantı yerine biçim")
+    parser.add_argument("--parca", type=int, default=PARCA, help="parça boyutu (satır)")
+    parser.add_argument("--sikistir", action="store_true", help="npz'yi deflate, parquet'i zstd ile sıkıştır")
+    args = parser.parse_args()
+
+    try:
+        conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+        oturum = args.oturum
+        if oturum is None:
+            oturum, = conn.execute("SELECT MAX(id) FROM oturumlar").fetchone()
+        baslangic = time.perf_counter()
+
+        def ilerleme(yazilan, toplam):
+            print(f"\r{yazilan}/{toplam} satır", end="", file=sys.stderr, flush=True)
+
+        yazilan = disa_aktar(conn, args.cikti, oturum, args.sensor, args.alan, args.bas, args.son,
+                             args.bicim, args.parca, args.sikistir, ilerleme)
+    except (ValueError, OSError, sqlite3.Error) as e:
+        sys.exit(f"Dışa aktarılamadı: {e}")
+    sure = time.perf_counter() - baslangic
+    print(file=sys.stderr)
+    print(f"Oturum #{oturum}: {yazilan} satır {args.cikti} dosyasına yazıldı "
+          f"({sure:.2f} s, {yazilan / max(sure, 1e-9):.0f} satır/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Oturum dışa aktarma ölçümü.
+
+Kullanım: python benchmarks/bench_aktarim.py [--adet 2000000] [--parca 100000]
+
+Geçici bir telemetri.db'ye --adet satırlık bir BMP280 oturumu yazar ve
+aktarim.py ile her biçime (pyarrow yoksa Parquet atlanır) ayrı süreçlerde
+dışa aktarır. Her biçim için süre, satır/s, dosya boyutu ve sürecin en
+yüksek bellek kullanımı (maxrss) raporlanır; karşılaştırma için bütün
+satırları fetchall ile okuyup np.save ile yazan yol da ölçülür. Parçalı
+aktarımda bellek, satır sayısından bağımsız kalmalıdır.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import resource
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+import numpy as np  # noqa: E402
+
+from veritabani import TELEMETRI_GOCLERI, baglan  # noqa: E402
+
+
+def oturum_olustur(dosya, adet, hiz=1000.0):
+    conn = baglan(dosya, TELEMETRI_GOCLERI)
+    conn.execute("INSERT INTO oturumlar (baslangic, baslangic_monotonic, aciklama) VALUES (?, 0, 'bench')",
+                 (time.time(),))
+    rng = np.random.default_rng(0)
+    for i in range(0, adet, 100_000):
+        n = min(100_000, adet - i)
+        zaman = (np.arange(i, i + n) / hiz).tolist()
+        sicaklik = (20 + rng.normal(0, 0.5, n)).tolist()
+        basinc = (1013 + rng.normal(0, 2, n)).tolist()
+        yukseklik = (100 + rng.normal(0, 5, n)).tolist()
+        conn.executemany("INSERT INTO bmp280 (oturum, zaman, sensor_id, sicaklik, basinc, yukseklik) "
+                         "VALUES (1, ?, 0, ?, ?, ?)", zip(zaman, sicaklik, basinc, yukseklik))
+    conn.commit()
+    conn.close()
+
+
+def tek_olcum(db, cikti, bicim, parca):
+    import aktarim
+    conn = sqlite3.connect(f"file:{db}?mode=ro", uri=True)
+    bas = time.perf_counter()
+    if bicim == "fetchall":
+        satirlar = conn.execute("SELECT zaman, sensor_id, sicaklik, basinc, yukseklik FROM bmp280 "
+                                "WHERE oturum=1 ORDER BY zaman").fetchall()
+        np.save(cikti, np.array(satirlar, dtype=np.float64))
+        yazilan = len(satirlar)
+    else:
+        yazilan = aktarim.disa_aktar(conn, cikti, 1, "BMP280", parca=parca)
+    sure = time.perf_counter() - bas
+    print(json.dumps({"sure": sure, "satir": yazilan,
+                      "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adet", type=int, default=2_000_000, help="oturumdaki satır sayısı")
+    parser.add_argument("--parca", type=int, default=100_000, help="parça boyutu (satır)")
+    parser.add_argument("--tek", nargs=3, metavar=("DB", "CIKTI", "BICIM"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.tek:
+        tek_olcum(*args.tek, args.parca)
+        return
+
+    klasor = tempfile.mkdtemp()
+    try:
+        db = os.path.join(klasor, "telemetri.db")
+        bas = time.perf_counter()
+        oturum_olustur(db, args.adet)
+        print(f"{args.adet} satırlık oturum {time.perf_counter() - bas:.1f} s'de oluşturuldu "
+              f"({os.path.getsize(db) / 2 ** 20:.0f} MB)")
+
+        bicimler = [("fetchall + np.save", "fetchall", "npy"), ("csv", "csv", "csv"), ("npy", "npy", "npy"),
+                    ("npz", "npz", "npz")]
+        if importlib.util.find_spec("pyarrow") is not None:
+            bicimler.append(("parquet", "parquet", "parquet"))
+        else:
+            print("pyarrow kurulu değil, Parquet atlanıyor")
+        print(f"{'':20s}{'süre (s)':>10s}{'satır/s':>12s}{'dosya (MB)':>12s}{'maxrss (MB)':>13s}")
+        for ad, bicim, uzanti in bicimler:
+            cikti = os.path.join(klasor, f"cikti.{uzanti}")
+            sonuc = subprocess.run([sys.executable, os.path.abspath(__file__), "--parca", str(args.parca),
+                                    "--tek", db, cikti, bicim], capture_output=True, text=True, check=True)
+            olcum = json.loads(sonuc.stdout.strip().splitlines()[-1])
+            print(f"{ad:20s}{olcum['sure']:10.2f}{olcum['satir'] / olcum['sure']:12.0f}"
+                  f"{os.path.getsize(cikti) / 2 ** 20:12.1f}{olcum['rss']:13.0f}")
+            os.remove(cikti)
+    finally:
+        shutil.rmtree(klasor, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Soğuk açılış süresi ölçümü.
+
+Kullanım: python benchmarks/bench_baslangic.py [--tekrar 5]
+
+Her ölçüm yeni bir Python sürecinde (modül önbelleği soğuk) ekran dışı
+(offscreen) çalışır: main modülünün içe aktarılması, giriş penceresinin
+kurulup ilk kez çizilmesi, ana pencerenin kurulup ilk kez çizilmesi ve
+sonradan kurulan sayfaların ilk seçilişi ayrı ayrı ölçülür. Derlenmiş
+arayüz sınıflarıyla ve UI_DOSYALARINDAN=1 ile (.ui dosyaları loadUi ile
+okunarak) açılış karşılaştırılır, süreç başına medyanlar raporlanır.
+Veritabanları geçici bir klasörde oluşturulur.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ASAMALAR = ["import", "QApplication", "LoginWindow", "MainWindow", "sayfa geçişi (ilk)", "toplam"]
+
+
+def tek_olcum():
+    baslangic = time.perf_counter()
+    sys.path.insert(0, KOK)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sureler = {}
+
+    def olc(ad, islev):
+        bas = time.perf_counter()
+        sonuc = islev()
+        sureler[ad] = (time.perf_counter() - bas) * 1000
+        return sonuc
+
+    main = olc("import", lambda: __import__("main"))
+    from PyQt5.QtWidgets import QApplication
+    app = olc("QApplication", lambda: QApplication(sys.argv))
+
+    def goster(pencere):
+        pencere.show()
+        app.processEvents()  # ilk çizim
+        return pencere
+
+    giris = olc("LoginWindow", lambda: goster(main.LoginWindow()))
+    giris.close()
+    pencere = olc("MainWindow", lambda: goster(main.MainWindow()))
+
+    def sayfalari_gez():
+        for i in range(1, pencere.side_menu.count()):
+            pencere.side_menu.setCurrentRow(i)
+            app.processEvents()
+    olc("sayfa geçişi (ilk)", sayfalari_gez)
+    sureler["toplam"] = (time.perf_counter() - baslangic) * 1000
+
+    pencere.close()
+    main.hepsini_kapat()
+    print(json.dumps(sureler))
+
+
+def olcumler(ortam, tekrar):
+    sonuclar = []
+    for _ in range(tekrar):
+        klasor = tempfile.mkdtemp()
+        for dosya in ("login.ui", "main.ui"):
+            shutil.copy(os.path.join(KOK, dosya), klasor)
+        cikti = subprocess.run([sys.executable, os.path.abspath(__file__), "--tek"], cwd=klasor,
+                               env=dict(os.environ, **ortam), capture_output=True, text=True, check=True)
+        sonuclar.append(json.loads(cikti.stdout.strip().splitlines()[-1]))
+        shutil.rmtree(klasor, ignore_errors=True)
+    return {asama: statistics.median(s[asama] for s in sonuclar) for asama in ASAMALAR}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tekrar", type=int, default=5, help="mod başına süreç sayısı")
+    parser.add_argument("--tek", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.tek:
+        tek_olcum()
+        return
+
+    modlar = [("derlenmiş", {"UI_DOSYALARINDAN": "0"}), (".ui dosyaları", {"UI_DOSYALARINDAN": "1"})]
+    sonuclar = [(ad, olcumler(ortam, args.tekrar)) for ad, ortam in modlar]
+    print(f"{args.tekrar} süreç medyanı (ms)")
+    print(f"{'':22s}" + "".join(f"{ad:>16s}" for ad, _ in sonuclar))
+    for asama in ASAMALAR:
+        print(f"{asama:22s}" + "".join(f"{sonuc[asama]:16.1f}" for _, sonuc in sonuclar))
+
+
+if __name__ == "__main__":
+    main()
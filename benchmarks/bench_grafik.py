@@ -0,0 +1,50 @@
+"""Grafik sayfası çizim hızı ölçümü.
+
+Kullanım: python benchmarks/bench_grafik.py [--hiz 100] [--sure 3600]
+
+Halka tamponu verilen hız ve sürede üretilmiş BMP280 verisiyle doldurur,
+her pencere uzunluğu için ekran dışı (offscreen) çizim FPS'ini raporlar.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from grafik import GrafikSayfasi  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hiz", type=float, default=100, help="örnek/s")
+    parser.add_argument("--sure", type=float, default=3600, help="tampondaki geçmiş (s)")
+    parser.add_argument("--kare", type=int, default=60, help="pencere başına çizilecek kare")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)  # noqa: F841
+    n = int(args.hiz * args.sure)
+    sayfa = GrafikSayfasi(kapasite=n)
+    sayfa.resize(1200, 800)
+    sayfa.show()
+
+    zaman = np.arange(n) / args.hiz
+    sayfa.tampon.ekle(zaman, np.vstack([25 + np.sin(zaman / 10), 1013 + np.cos(zaman / 60),
+                                        100 + 5 * np.sin(zaman / 30)]))
+    print(f"Tamponda {n} örnek ({args.sure:g} s, {args.hiz:g} Hz)")
+    for i in range(sayfa.pencere_combo.count()):
+        sayfa.pencere_combo.setCurrentIndex(i)
+        baslangic = time.perf_counter()
+        for _ in range(args.kare):
+            sayfa.yeniden_ciz()
+            sayfa.repaint()
+        fps = args.kare / (time.perf_counter() - baslangic)
+        print(f"Pencere {sayfa.pencere_combo.currentText():>6}: {fps:6.0f} FPS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""İşleme hattı performans ölçümü.
+
+Kullanım: python benchmarks/bench_isleme.py [--adet 100000] [--paket 100]
+
+Gürültülü ve aykırı değerli sentetik BMP280 basınç verisini varsayılan
+işleme hattından (aykırı değer atma → barometrik yükseklik → medyan → EMA,
+dikey hız → EMA) geçirir. Tek dizi olarak, okuyucu paketleri boyunda
+parçalar halinde ve örnek sözlükleri üzerinden işleme sürelerini, ayrıca
+aşama başına süreleri raporlar.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from isleme import (varsayilan_hat, AykiriAtici, BarometrikYukseklik, Medyan,  # noqa: E402
+                    UstelOrtalama, HareketliOrtalama, DikeyHiz)
+
+
+def veri_uret(adet, hiz=100.0, tohum=0):
+    rastgele = np.random.default_rng(tohum)
+    zaman = np.arange(adet) / hiz
+    basinc = 1013.25 - 0.01 * zaman + rastgele.normal(0, 0.02, adet)
+    aykiri = rastgele.random(adet) < 0.001
+    basinc[aykiri] += rastgele.normal(0, 20, aykiri.sum())
+    return zaman, basinc
+
+
+def sure_olc(islev, tekrar=5):
+    en_iyi = float("inf")
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        islev()
+        en_iyi = min(en_iyi, time.perf_counter() - baslangic)
+    return en_iyi * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adet", type=int, default=100000)
+    parser.add_argument("--paket", type=int, default=100, help="okuyucu paket boyu (örnek)")
+    args = parser.parse_args()
+
+    zaman, basinc = veri_uret(args.adet)
+
+    def tek_dizi():
+        varsayilan_hat().isle_dizi({"zaman": zaman, "basinc": basinc})
+
+    def paketler():
+        hat = varsayilan_hat()
+        for bas in range(0, args.adet, args.paket):
+            hat.isle_dizi({"zaman": zaman[bas:bas + args.paket], "basinc": basinc[bas:bas + args.paket]})
+
+    ornekler = [{"sensor": "BMP280", "zaman": t, "basinc": p}
+                for t, p in zip(zaman.tolist(), basinc.tolist())]
+
+    def sozlukler():
+        hat = varsayilan_hat()
+        for bas in range(0, args.adet, args.paket):
+            hat.isle(ornekler[bas:bas + args.paket])
+
+    print(f"{args.adet} örnek, paket {args.paket}")
+    print(f"Tek dizi          : {sure_olc(tek_dizi):8.2f} ms")
+    print(f"Paketler (dizi)   : {sure_olc(paketler):8.2f} ms")
+    print(f"Paketler (sözlük) : {sure_olc(sozlukler, 1):8.2f} ms")
+    print("Aşamalar (tek dizi):")
+    for asama in (AykiriAtici(), BarometrikYukseklik(), Medyan(5), HareketliOrtalama(5),
+                  UstelOrtalama(0.2), DikeyHiz()):
+        print(f"  {type(asama).__name__:20s}: {sure_olc(lambda: (asama.sifirla(), asama.isle(zaman, basinc))):8.2f} ms")
+
+    hat = varsayilan_hat()
+    sonuc = hat.isle_dizi({"zaman": zaman, "basinc": basinc})
+    print(f"Atılan aykırı     : {hat.adimlar[0][2][0].atilan}")
+    print(f"Yükseklik         : {sonuc['baro_yukseklik'][0]:.2f} → {sonuc['baro_yukseklik'][-1]:.2f} m, "
+          f"ortalama dikey hız {np.mean(sonuc['dikey_hiz'][args.adet // 10:]):.3f} m/s")
+
+
+if __name__ == "__main__":
+    main()
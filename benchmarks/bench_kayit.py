@@ -0,0 +1,62 @@
+"""TelemetriKaydedici ekleme hızı ölçümü.
+
+Kullanım: python benchmarks/bench_kayit.py [--hiz 1000] [--sure 5]
+
+Verilen hızda (0 = olabildiğince hızlı) BMP280 örnekleri üretir, geçici bir
+veritabanına kaydeder ve saniyedeki kayıt sayısını ile kayıp örnekleri raporlar.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kayit import TelemetriKaydedici  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hiz", type=float, default=1000, help="örnek/s, 0 = sınırsız")
+    parser.add_argument("--sure", type=float, default=5, help="ölçüm süresi (s)")
+    parser.add_argument("--paket", type=int, default=20, help="ekle() başına örnek sayısı")
+    parser.add_argument("--aralik", type=int, default=200, help="yazma aralığı (ms)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        dosya = os.path.join(klasor, "bench.db")
+        kaydedici = TelemetriKaydedici(dosya, aralik_ms=args.aralik, aciklama="benchmark")
+        kaydedici.start()
+
+        gonderilen = 0
+        baslangic = time.perf_counter()
+        while time.perf_counter() - baslangic < args.sure:
+            zaman = time.monotonic()
+            kaydedici.ekle([{"sensor": "BMP280", "zaman": zaman, "sicaklik": 25.0 + i * 1e-3,
+                             "basinc": 1013.25, "yukseklik": 100.0} for i in range(args.paket)])
+            gonderilen += args.paket
+            if args.hiz:
+                bekle = baslangic + gonderilen / args.hiz - time.perf_counter()
+                if bekle > 0:
+                    time.sleep(bekle)
+        uretim_suresi = time.perf_counter() - baslangic
+        kaydedici.durdur(bekle=True)
+        toplam_sure = time.perf_counter() - baslangic
+
+        conn = sqlite3.connect(dosya)
+        yazilan = conn.execute("SELECT COUNT(*) FROM bmp280").fetchone()[0]
+        conn.close()
+
+    print(f"Gönderilen      : {gonderilen} örnek ({gonderilen / uretim_suresi:.0f} örnek/s)")
+    print(f"Yazılan         : {yazilan} örnek")
+    print(f"Kayıp           : {gonderilen - yazilan}")
+    print(f"Kayıt hızı      : {yazilan / toplam_sure:.0f} örnek/s "
+          f"(son boşaltma dahil {toplam_sure:.2f} s)")
+    if kaydedici.hata:
+        print(f"Hata            : {kaydedici.hata}")
+
+
+if __name__ == "__main__":
+    main()
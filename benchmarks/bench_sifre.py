@@ -0,0 +1,102 @@
+"""Şifre özetleme maliyeti ölçümü.
+
+Kullanım: python benchmarks/bench_sifre.py [--hedef 250]
+
+scrypt (r=8, p=1) için farklı n değerlerinde ve PBKDF2-SHA256 için farklı
+tekrar sayılarında tek doğrulamanın süresini ölçer, hedef giriş süresini
+aşmayan en yüksek maliyeti önerir. Ardından geçici bir kullanıcı
+veritabanında girişi Veritabani thread'i üzerinden çalıştırıp bu sırada
+Qt olay döngüsünün en uzun ne kadar bloklandığını raporlar.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QTimer  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+import sifre  # noqa: E402
+from veritabani import Veritabani, KULLANICI_GOCLERI, kullanici_ekle, kullanici_dogrula  # noqa: E402
+
+
+def dogrulama_suresi(ozet, tekrar=3):
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        sifre.sifre_dogrula("parola", ozet)
+        sureler.append(time.perf_counter() - baslangic)
+    return statistics.median(sureler) * 1000
+
+
+def olay_dongusu_olc(app, ayarlar):
+    """Giriş sürerken GUI thread'inin en uzun bloklanma süresini (ms) döndürür."""
+    sifre.SCRYPT_AYARLARI = ayarlar
+    dosya = os.path.join(tempfile.mkdtemp(), "users.db")
+    vt = Veritabani(dosya, KULLANICI_GOCLERI)
+    vt.bekle(kullanici_ekle, "kullanici", "parola")
+
+    son_tik = [time.perf_counter()]
+    en_uzun = [0.0]
+    sonuc = {}
+
+    def tik():
+        simdi = time.perf_counter()
+        en_uzun[0] = max(en_uzun[0], simdi - son_tik[0])
+        son_tik[0] = simdi
+
+    def bitti(basarili):
+        sonuc["sure"] = time.perf_counter() - baslangic
+        sonuc["basarili"] = basarili
+        app.quit()
+
+    zamanlayici = QTimer()
+    zamanlayici.timeout.connect(tik)
+    zamanlayici.start(5)
+    baslangic = time.perf_counter()
+    vt.gonder(kullanici_dogrula, "kullanici", "parola", geri=bitti)
+    app.exec_()
+    zamanlayici.stop()
+    vt.kapat()
+    return sonuc["sure"] * 1000, en_uzun[0] * 1000, sonuc["basarili"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hedef", type=float, default=250, help="hedef giriş süresi (ms)")
+    args = parser.parse_args()
+
+    onerilen = None
+    if sifre.SCRYPT_VAR:
+        print("scrypt (r=8, p=1):")
+        for us in range(12, 18):
+            ayarlar = {"n": 2 ** us, "r": 8, "p": 1}
+            sure = dogrulama_suresi(sifre.sifre_ozeti("parola", ayarlar))
+            bellek = 128 * ayarlar["r"] * ayarlar["n"] / 2 ** 20
+            isaret = ""
+            if sure <= args.hedef:
+                onerilen = ayarlar
+                isaret = " ✓"
+            print(f"  n=2^{us:<2d} {bellek:5.0f} MB : {sure:8.1f} ms{isaret}")
+    print("PBKDF2-SHA256:")
+    for tekrar in (100000, 300000, 600000, 1200000):
+        sure = dogrulama_suresi(sifre.sifre_ozeti("parola", tekrar=tekrar))
+        print(f"  {tekrar:>8d} tekrar : {sure:8.1f} ms{' ✓' if sure <= args.hedef else ''}")
+
+    print(f"Hedef {args.hedef:g} ms, mevcut ayar: {sifre.SCRYPT_AYARLARI}")
+    if onerilen:
+        print(f"Önerilen scrypt ayarı: {onerilen}")
+        app = QApplication(sys.argv)
+        sure, blok, basarili = olay_dongusu_olc(app, onerilen)
+        print(f"Önerilen ayarla giriş: {sure:.1f} ms (başarılı: {basarili}), "
+              f"olay döngüsünün en uzun beklemesi {blok:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
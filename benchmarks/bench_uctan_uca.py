@@ -0,0 +1,126 @@
+"""Uçtan uca veri alma performans ölçümü.
+
+Kullanım: python benchmarks/bench_uctan_uca.py [--hiz 500] [--sure 10] [--bozuk 0.01] [--asyncio]
+
+Simülatörü bir pty'ye bağlar, YerIstasyonu'nu ekran dışı (offscreen) Qt ile
+başlatıp o porta bağlar ve okuma → çözümleme → gösterim yolunu ölçer:
+çerçeve/s, çerçeve başına çözümleme süresi, uçtan uca gecikme yüzdelikleri,
+kayıp çerçeveler ve zaman içinde bellek (RSS) kullanımı.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from PyQt5.QtCore import QTimer  # noqa: E402
+
+from protokol import CerceveCozucu  # noqa: E402
+from simulator import SensorSimulatoru, pty_ac  # noqa: E402
+
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def cozumleme_suresi(bicim, adet=20000):
+    """Simülatör çerçevelerinden oluşan tamponu tek seferde çözüp µs/çerçeve döndürür."""
+    simulator = SensorSimulatoru(None, bicim=bicim)
+    tampon = b"".join(simulator.cerceve(i, time.monotonic()) for i in range(adet))
+    cozucu = CerceveCozucu(maks_uzunluk=len(tampon))
+    baslangic = time.perf_counter()
+    ornekler, _ = cozucu.besle(tampon)
+    return (time.perf_counter() - baslangic) / len(ornekler) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hiz", type=float, default=500, help="çerçeve/s")
+    parser.add_argument("--sure", type=float, default=10, help="ölçüm süresi (s)")
+    parser.add_argument("--titreme", type=float, default=0.1)
+    parser.add_argument("--bozuk", type=float, default=0.0, help="bozuk çerçeve oranı (0-1)")
+    parser.add_argument("--bicim", choices=("json", "ikili"), default="json",
+                        help="ikili çerçevelerde zaman damgası olmadığından gecikme ölçülmez")
+    parser.add_argument("--profil", default="Yüksek hız", help="bağlantı profili")
+    parser.add_argument("--asyncio", action="store_true", help="asyncio motoruyla oku")
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp())  # arayüz çalışma klasöründe telemetri.db açar
+    app = QApplication(sys.argv)
+    from main import YerIstasyonu
+    istasyon = YerIstasyonu()
+
+    master, _, yol = pty_ac()
+    istasyon.port_combo.addItem(yol)
+    istasyon.port_combo.setCurrentText(yol)
+    istasyon.profil_combo.setCurrentText(args.profil)
+    istasyon.profil_uygula(args.profil)
+    istasyon.async_checkbox.setChecked(args.asyncio)
+
+    gecikmeler = []
+    alinan = [0]
+
+    def olc(ornekler):
+        simdi = time.monotonic()
+        alinan[0] += len(ornekler)
+        gecikmeler.extend(simdi - ornek["t"] for ornek in ornekler if "t" in ornek)
+
+    istasyon.merkez.veri_geldi.connect(olc)
+    simulator = SensorSimulatoru(master, args.hiz, args.titreme, args.bozuk, args.bicim, args.sure)
+    rss = [(0.0, rss_mb())]
+    baslangic = [0.0]
+
+    def baslat(_port):
+        baslangic[0] = time.monotonic()
+        simulator.start()
+
+    def rss_ornekle():
+        rss.append((time.monotonic() - baslangic[0], rss_mb()))
+
+    def bitir():
+        if simulator.is_alive():
+            return
+        istasyon.baglantiyi_kes(bekle=True)
+        istasyon.port_izleyiciyi_durdur()
+        app.quit()
+
+    istasyon.merkez.baglandi.connect(baslat)
+    rss_timer = QTimer()
+    rss_timer.timeout.connect(rss_ornekle)
+    rss_timer.start(1000)
+    bitis_timer = QTimer()
+    bitis_timer.timeout.connect(bitir)
+    bitis_timer.start(500)
+    istasyon.port_baglan()
+    app.exec_()
+
+    gecen = time.monotonic() - baslangic[0]
+    gecikme = np.array(gecikmeler) * 1000
+    print(f"Hedef hız        : {args.hiz:g} çerçeve/s, {args.sure:g} s, "
+          f"motor: {'asyncio' if args.asyncio else 'thread'}")
+    print(f"Gönderilen       : {simulator.gonderilen} ({simulator.bozulan} bozuk)")
+    print(f"Alınan           : {alinan[0]} ({alinan[0] / gecen:.0f} çerçeve/s)")
+    print(f"Kayıp            : {simulator.gonderilen - alinan[0]} "
+          f"({simulator.gonderilen - simulator.bozulan - alinan[0]} bozuk olmayan)")
+    print(f"Çözümleme        : JSON {cozumleme_suresi('json'):.2f} µs/çerçeve, "
+          f"ikili {cozumleme_suresi('ikili'):.2f} µs/çerçeve")
+    if len(gecikme):
+        p50, p90, p99 = np.percentile(gecikme, [50, 90, 99])
+        print(f"Uçtan uca gecikme: p50 {p50:.2f} ms, p90 {p90:.2f} ms, "
+              f"p99 {p99:.2f} ms, maks {gecikme.max():.2f} ms")
+    print("RSS (MB)         : " + ", ".join(f"{t:.0f}s={m:.1f}" for t, m in rss))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Edinim sunucusu yayın ölçümü.
+
+Kullanım: python benchmarks/bench_yayin.py [--hiz 1000] [--sure 10] [--istemci 3] [--yuk 200]
+
+Simülatörü ve sunucu.py'yi ayrı süreçlerde başlatır (sunucu simülatörün
+pty'sini okur) ve yayın soketine birkaç istemci bağlar. Normal istemciler
+geleni hemen çözer; "yavaş" istemci her okumadan sonra --yuk ms bekleyerek
+aşırı yüklenmiş bir arayüzü taklit eder. Her istemci için alınan örnek
+oranı ve uçtan uca gecikme (sunucunun okuma anından istemcinin çözdüğü
+ana) yüzdelikleri, ayrıca sunucunun yavaş istemci için attığı paketler
+raporlanır; yavaş istemci varken de normal istemcilerin kayıpsız ve düşük
+gecikmeyle alması beklenir.
+"""
+import argparse
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+import numpy as np  # noqa: E402
+
+from yayin import YayinCozucu  # noqa: E402
+
+
+class Istemci(threading.Thread):
+    def __init__(self, yol, yuk_ms=0):
+        super().__init__(daemon=True)
+        self.soket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.soket.connect(yol)
+        self.yuk_ms = yuk_ms
+        self.cozucu = YayinCozucu()
+        self.alinan = 0
+        self.gecikmeler = []
+
+    def run(self):
+        while True:
+            veri = self.soket.recv(4096 if self.yuk_ms else 65536)
+            if not veri:
+                break
+            ornekler, _ = self.cozucu.besle(veri)
+            simdi = time.monotonic()
+            self.alinan += len(ornekler)
+            self.gecikmeler.extend(simdi - ornek["zaman"] for ornek in ornekler)
+            if self.yuk_ms:
+                time.sleep(self.yuk_ms / 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hiz", type=float, default=1000, help="çerçeve/s")
+    parser.add_argument("--sure", type=float, default=10, help="ölçüm süresi (s)")
+    parser.add_argument("--istemci", type=int, default=3, help="normal istemci sayısı")
+    parser.add_argument("--yuk", type=float, default=200, help="yavaş istemcinin okuma başına beklemesi (ms), 0 kapatır")
+    parser.add_argument("--tampon", type=int, default=64, help="sunucunun istemci başına tamponu (KB)")
+    args = parser.parse_args()
+
+    klasor = tempfile.mkdtemp()
+    yol = os.path.join(klasor, "yayin.sock")
+    # simülatör ayrı süreçte: aynı süreçte istemci thread'leriyle GIL için yarışmasın
+    simulator = subprocess.Popen(
+        [sys.executable, os.path.join(KOK, "simulator.py"), "--hiz", str(args.hiz), "--sure", str(args.sure),
+         "--bicim", "ikili", "--bekle"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    port = re.search(r"portu: (\S+)", simulator.stdout.readline()).group(1)
+    sunucu = subprocess.Popen(
+        [sys.executable, os.path.join(KOK, "sunucu.py"), "--port", port, "--profil", "Yüksek hız",
+         "--soket", yol, "--tampon", str(args.tampon), "--durum", "0"],
+        cwd=klasor, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    while not os.path.exists(yol):
+        if sunucu.poll() is not None:
+            sys.exit(sunucu.stdout.read())
+        time.sleep(0.05)
+
+    istemciler = [Istemci(yol) for _ in range(args.istemci)]
+    if args.yuk:
+        istemciler.append(Istemci(yol, args.yuk))
+    for istemci in istemciler:
+        istemci.start()
+    time.sleep(0.5)  # sunucu porta bağlansın
+
+    simulator.stdin.write("\n")
+    simulator.stdin.flush()
+    gonderilen = int(re.search(r"(\d+) çerçeve gönderildi", simulator.communicate()[0]).group(1))
+    time.sleep(0.5)  # yoldaki son paketler
+    sunucu.send_signal(2)
+    cikti = sunucu.communicate(timeout=10)[0]
+
+    print(f"{gonderilen} çerçeve gönderildi ({args.hiz:g} Hz, {args.sure:g} s)")
+    for i, istemci in enumerate(istemciler):
+        ad = f"yavaş ({args.yuk:g} ms)" if istemci.yuk_ms else f"istemci {i + 1}"
+        gecikme = np.array(istemci.gecikmeler or [np.nan]) * 1000
+        print(f"  {ad:16s}: {istemci.alinan:7d} örnek (%{100 * istemci.alinan / max(gonderilen, 1):5.1f}), "
+              f"gecikme p50 {np.percentile(gecikme, 50):6.2f} ms, p99 {np.percentile(gecikme, 99):7.2f} ms, "
+              f"maks {gecikme.max():8.2f} ms")
+    yayin = re.findall(r"Yayın: .*", cikti)
+    print(f"Sunucu: {yayin[-1] if yayin else cikti.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import time
+from functools import partial
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from olcum import Olcum, ADET_SINIRLARI
+from seri_okuyucu import SeriOkuyucu, ADRES_ONEKLERI
+from tekrar import TekrarOynatici, KAYIT_ONEKI
+
+
+HATA_ADLARI = {"crc": "CRC", "cozme": "çözme", "json": "JSON", "tasma": "taşma"}
+
+
+class PortDurumu:
+    """Tek bir portun hız ve hata sayaçları."""
+
+    def __init__(self, port, secenekler=None):
+        self.port = port
+        self.secenekler = secenekler or {}  # port_ac argümanları, yeniden bağlanmak için
+        self.bagli = False
+        self.kapatiliyor = False
+        self.cerceve_hizi = 0.0
+        self.bayt_hizi = 0.0
+        self.islenen = 0
+        self.dusurulen = 0
+        self.hata = 0  # bağlantı/okuma hataları
+        self.hatalar = {}  # çözücünün türe göre çerçeve hataları
+        self.arayuz = Olcum()  # GUI thread'inde: kuyruk derinliği ve gecikme (teslim_edildi)
+
+    def ozet(self):
+        durum = "bağlı" if self.bagli else "bağlanıyor"
+        cerceve_hatalari = ", ".join(f"{HATA_ADLARI.get(tur, tur)} {sayi}"
+                                     for tur, sayi in self.hatalar.items() if sayi)
+        return (f"{self.port} ({durum}): {self.cerceve_hizi:.0f} çerçeve/s, "
+                f"{self.bayt_hizi:.0f} B/s | {self.islenen} işlendi, "
+                f"{self.dusurulen} düştü, {sum(self.hatalar.values())} çerçeve hatası"
+                + (f" ({cerceve_hatalari})" if cerceve_hatalari else "")
+                + (f", {self.hata} okuma hatası" if self.hata else ""))
+
+
+class EdinimMerkezi(QObject):
+    """Birden fazla seri portu aynı anda okuyan veri toplama merkezi.
+
+    Her port kendi okuyucu thread'inde okunur: seri portlar varsayılan
+    olarak SeriOkuyucu ile, tcp://, udp:// ve pipe:// adresleri ya da
+    asenkron=True istendiğinde AsyncOkuyucu ile, kayit:// adresleri
+    kaydedilmiş oturumu yeniden oynatan TekrarOynatici ile. Okuyuculardan gelen
+    örnekler okuyucu thread'inde port bilgisiyle etiketlenir, doğrudan
+    alıcılara (ör. kaydedici) iletilir, ayarlanmışsa portun işleme hattından
+    geçirilir (türetilen kanallar örneğe eklenir) ve sensör tipine göre
+    gruplanıp sinyallerle arayüze gönderilir. Bir portun yükü diğerlerini
+    beklemez.
+    """
+    veri_geldi = pyqtSignal(list)  # tüm portlardan gelen örnekler
+    sensor_verisi = pyqtSignal(str, list)  # sensör tipi, o sensörün örnekleri
+    ham_veri = pyqtSignal(str, list)
+    hata = pyqtSignal(str, str)
+    baglandi = pyqtSignal(str)
+    kapandi = pyqtSignal(str)
+    koptu = pyqtSignal(str, dict)  # bağlı okuyucu port_kapat çağrılmadan bitti; port, port_ac argümanları
+    durum_degisti = pyqtSignal(str)  # port; saniyede bir, hız ölçümüyle birlikte
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.okuyucular = {}
+        self.durumlar = {}
+        self._alicilar = []
+        self._ham_veri_acik = True
+        self._isleme_fabrikasi = None
+        self._hatlar = {}  # port -> IslemeHatti, yalnızca o portun thread'inde kullanılır
+
+    def bagli_mi(self, port):
+        return port in self.okuyucular
+
+    def portlar(self):
+        return list(self.okuyucular)
+
+    def alici_ekle(self, alici):
+        # alıcı okuyucu thread'lerinden çağrılır, thread güvenli olmalıdır
+        self._alicilar = self._alicilar + [alici]
+
+    def alici_cikar(self, alici):
+        self._alicilar = [a for a in self._alicilar if a is not alici]
+
+    def teslim_edildi(self, ornekler):
+        """veri_geldi'yi GUI thread'inde işleyen alıcı her pakette çağırır.
+
+        Okuyucunun gönderdiği ama henüz işlenmemiş paket sayısı (kuyruk) ve
+        örneğin okunduğu andan buraya kadar geçen süre (gecikme) ölçülür;
+        kayıttan oynatmada zamanlar kayıttaki özgün zaman olduğundan gecikme
+        ölçülmez.
+        """
+        port = ornekler[0].get("port")
+        durum = self.durumlar.get(port)
+        okuyucu = self.okuyucular.get(port)
+        if durum is None or okuyucu is None:
+            return
+        durum.arayuz.say("paket")
+        kuyruk = okuyucu.olcum.sayaclar.get("paket", 0) - durum.arayuz.sayaclar["paket"]
+        durum.arayuz.ekle("kuyruk", max(kuyruk, 0), ADET_SINIRLARI)
+        if not port.startswith(KAYIT_ONEKI) and "zaman" in ornekler[-1]:
+            durum.arayuz.ekle("gecikme", time.monotonic() - ornekler[-1]["zaman"])
+
+    def olcumler(self):
+        """Port başına hız, okuyucu ve arayüz ölçümlerinin JSON'a yazılabilir anlık görüntüsü."""
+        sonuc = {}
+        for port, durum in list(self.durumlar.items()):
+            okuyucu = self.okuyucular.get(port)
+            sonuc[port] = {"bagli": durum.bagli, "cerceve_hizi": durum.cerceve_hizi,
+                           "bayt_hizi": durum.bayt_hizi, "hatalar": dict(durum.hatalar),
+                           "okuyucu": okuyucu.olcum.sozluk() if okuyucu is not None else None,
+                           "arayuz": durum.arayuz.sozluk()}
+        return sonuc
+
+    def olcumleri_sifirla(self):
+        for port, durum in self.durumlar.items():
+            durum.arayuz.sifirla()
+            okuyucu = self.okuyucular.get(port)
+            if okuyucu is not None:
+                okuyucu.olcum.sifirla()
+
+    def ham_veri_ayarla(self, acik):
+        self._ham_veri_acik = acik
+        for okuyucu in self.okuyucular.values():
+            okuyucu.ham_veri_acik = acik
+
+    def isleme_ayarla(self, fabrika):
+        # fabrika() her port için durumu ayrı yeni bir IslemeHatti döndürür; None işlemeyi kapatır
+        self._isleme_fabrikasi = fabrika
+        self._hatlar = {}
+
+    def port_ac(self, port, toplu_okuma=True, asenkron=False, **ayarlar):
+        if port in self.okuyucular:
+            return
+        if port.startswith(KAYIT_ONEKI):
+            sinif = TekrarOynatici
+        elif asenkron or port.startswith(ADRES_ONEKLERI):
+            from tasima import AsyncOkuyucu  # asyncio yalnızca gerektiğinde yüklenir, açılışı ~50 ms uzatıyordu
+            sinif = AsyncOkuyucu
+        else:
+            sinif = SeriOkuyucu
+        try:
+            okuyucu = sinif(port, toplu_okuma=toplu_okuma, parent=self, **ayarlar)
+        except Exception as e:  # geçersiz adres ya da ayar; GUI slotundan hata kaçmasın
+            self.hata.emit(port, f"Bağlantı hatası: {str(e)}")
+            return
+        okuyucu.ham_veri_acik = self._ham_veri_acik
+        okuyucu.veri_geldi.connect(partial(self._yonlendir, port, okuyucu.olcum), Qt.DirectConnection)
+        okuyucu.baglandi.connect(self._baglandi)
+        okuyucu.tik_istatistik.connect(partial(self._tik_istatistik, port))
+        okuyucu.hiz_istatistik.connect(partial(self._hiz_istatistik, port))
+        okuyucu.hata_istatistik.connect(partial(self._hata_istatistik, port))
+        okuyucu.ham_veri.connect(partial(self.ham_veri.emit, port))
+        okuyucu.hata.connect(partial(self._hata, port))
+        okuyucu.finished.connect(partial(self._okuyucu_bitti, port, okuyucu))
+        self.okuyucular[port] = okuyucu
+        self.durumlar[port] = PortDurumu(port, dict(toplu_okuma=toplu_okuma, asenkron=asenkron, **ayarlar))
+        okuyucu.start()
+
+    def port_kapat(self, port, bekle=False):
+        okuyucu = self.okuyucular.get(port)
+        if okuyucu is None:
+            return
+        self.durumlar[port].kapatiliyor = True
+        okuyucu.durdur()
+        if bekle:
+            okuyucu.wait()
+
+    def hepsini_kapat(self, bekle=False):
+        for port in list(self.okuyucular):
+            self.port_kapat(port, bekle)
+
+    def _yonlendir(self, port, olcum, ornekler):
+        # okuyucu thread'inde çalışır, olcum okuyucunun kendi ölçüm nesnesidir
+        gruplar = {}
+        for ornek in ornekler:
+            ornek["port"] = port
+            gruplar.setdefault(ornek.get("sensor"), []).append(ornek)
+        if self._alicilar:
+            baslangic = time.perf_counter()
+            for alici in self._alicilar:
+                alici(ornekler)
+            olcum.ekle("alicilar", time.perf_counter() - baslangic)
+        hat = self._hatlar.get(port)
+        if hat is None and self._isleme_fabrikasi is not None:
+            hat = self._hatlar[port] = self._isleme_fabrikasi()
+        if hat is not None:
+            baslangic = time.perf_counter()
+            try:
+                hat.isle(ornekler)
+            except Exception:  # slottan kaçan hata uygulamayı sonlandırır; paket işlenmeden gösterilir
+                olcum.say("isleme_hatasi")
+            olcum.ekle("isleme", time.perf_counter() - baslangic)
+        self.veri_geldi.emit(ornekler)
+        for sensor, grup in gruplar.items():
+            self.sensor_verisi.emit(sensor, grup)
+
+    def _baglandi(self, port):
+        if port in self.durumlar:
+            self.durumlar[port].bagli = True
+        self.baglandi.emit(port)
+
+    def _tik_istatistik(self, port, islenen, dusurulen):
+        durum = self.durumlar.get(port)
+        if durum is not None:
+            durum.islenen += islenen
+            durum.dusurulen += dusurulen
+
+    def _hiz_istatistik(self, port, cerceve_hizi, bayt_hizi):
+        durum = self.durumlar.get(port)
+        if durum is not None:
+            durum.cerceve_hizi = cerceve_hizi
+            durum.bayt_hizi = bayt_hizi
+            self.durum_degisti.emit(port)
+
+    def _hata_istatistik(self, port, hatalar, yeni, son_hata):
+        # hız bildiriminden hemen önce gelir; gürültülü hatta log saniyede bir satırla sınırlı kalır
+        durum = self.durumlar.get(port)
+        if durum is not None:
+            durum.hatalar = hatalar
+        if yeni:
+            self.hata.emit(port, f"{son_hata} (son 1 sn'de {yeni} çerçeve hatası)")
+
+    def _hata(self, port, mesaj):
+        durum = self.durumlar.get(port)
+        if durum is not None:
+            durum.hata += 1
+        self.hata.emit(port, mesaj)
+
+    def _okuyucu_bitti(self, port, okuyucu):
+        durum = None
+        if self.okuyucular.get(port) is okuyucu:
+            del self.okuyucular[port]
+            durum = self.durumlar.pop(port)
+            self._hatlar.pop(port, None)
+        okuyucu.deleteLater()
+        self.kapandi.emit(port)
+        if durum is not None and durum.bagli and not durum.kapatiliyor:
+            self.koptu.emit(port, durum.secenekler)
@@ -0,0 +1,372 @@
+import math
+from functools import partial
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QApplication, QSlider
+from PyQt5.QtCore import QTimer, Qt, QPointF, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF, QFont
+
+from olcum import olculur
+from veritabani import KAYIT_DOSYASI, telemetri_veritabani, oturumlari_listele, oturum_araligi
+from sorgu import sorgula, zarf
+
+# Grafik sayfasında çizilen BMP280 kanalları: (alan, başlık, birim, renk)
+KANALLAR = [
+    ("sicaklik", "🌡️ Sıcaklık", "°C", "#E74C3C"),
+    ("basinc", "🔵 Basınç", "hPa", "#3498DB"),
+    ("yukseklik", "🏔️ Yükseklik", "m", "#2ECC71"),
+]
+
+ALANLAR = ["zaman"] + [alan for alan, *_ in KANALLAR]  # ekle'nin okuduğu sütunlar
+
+PENCERELER = [("10 s", 10), ("1 dk", 60), ("10 dk", 600), ("1 saat", 3600), ("Tümü", 0)]
+
+
+class HalkaTampon:
+    """Sabit boyutlu NumPy halka tamponu.
+
+    Zaman ve kanal değerleri önceden ayrılmış dizilerde tutulur; kapasite
+    dolunca en eski örneklerin üzerine yazılır. Bellek kullanımı oturum
+    uzunluğundan bağımsızdır.
+    """
+
+    def __init__(self, kapasite, kanal_sayisi):
+        self.kapasite = kapasite
+        self.zaman = np.zeros(kapasite)
+        self.degerler = np.zeros((kanal_sayisi, kapasite))
+        self.yaz = 0  # bir sonraki yazılacak konum
+        self.sayi = 0
+
+    def __len__(self):
+        return self.sayi
+
+    def ekle(self, zaman, degerler):
+        """zaman: (n,), degerler: (kanal_sayisi, n) boyutlu diziler."""
+        n = len(zaman)
+        if n >= self.kapasite:  # yalnızca son kapasite kadarı sığar
+            zaman = zaman[-self.kapasite:]
+            degerler = degerler[:, -self.kapasite:]
+            n = self.kapasite
+        bas = self.yaz
+        son = bas + n
+        if son <= self.kapasite:
+            self.zaman[bas:son] = zaman
+            self.degerler[:, bas:son] = degerler
+        else:
+            ilk = self.kapasite - bas
+            self.zaman[bas:] = zaman[:ilk]
+            self.degerler[:, bas:] = degerler[:, :ilk]
+            self.zaman[:n - ilk] = zaman[ilk:]
+            self.degerler[:, :n - ilk] = degerler[:, ilk:]
+        self.yaz = son % self.kapasite
+        self.sayi = min(self.sayi + n, self.kapasite)
+
+    def son_zaman(self):
+        return self.zaman[self.yaz - 1] if self.sayi else None
+
+    def sirali(self):
+        """Eskiden yeniye sıralı (zaman, degerler) kopyasını döndürür."""
+        if self.sayi < self.kapasite:
+            return self.zaman[:self.sayi], self.degerler[:, :self.sayi]
+        return (np.concatenate((self.zaman[self.yaz:], self.zaman[:self.yaz])),
+                np.concatenate((self.degerler[:, self.yaz:], self.degerler[:, :self.yaz]), axis=1))
+
+    def temizle(self):
+        self.yaz = 0
+        self.sayi = 0
+
+
+def min_max_seyrelt(x, y, piksel):
+    """Piksel başına düşen noktaları o aralığın min ve max değerine indirger.
+
+    Görünen nokta sayısı piksel sayısının iki katını aşmıyorsa veri olduğu
+    gibi döner; aşıyorsa her piksel sütunu için iki nokta üretilir, böylece
+    tepe değerler kaybolmadan çizilecek nokta sayısı sabit kalır.
+    """
+    n = len(y)
+    if n <= 2 * piksel:
+        return x, y
+    baslar = np.linspace(0, n, piksel + 1).astype(np.intp)[:-1]
+    enler = np.minimum.reduceat(y, baslar)
+    ekler = np.maximum.reduceat(y, baslar)
+    xs = np.repeat(x[baslar], 2)
+    ys = np.empty(2 * piksel)
+    ys[0::2] = enler
+    ys[1::2] = ekler
+    return xs, ys
+
+
+def polygon_olustur(x, y):
+    # QPointF listesi kurmak yerine QPolygonF'nin belleğine doğrudan yazılır
+    n = len(x)
+    poligon = QPolygonF(n)
+    if n:
+        ptr = poligon.data()
+        ptr.setsize(n * 2 * np.dtype(np.float64).itemsize)
+        dizi = np.frombuffer(ptr, dtype=np.float64)
+        dizi[0::2] = x
+        dizi[1::2] = y
+    return poligon
+
+
+class GrafikWidget(QWidget):
+    """Tek bir kanalı QPainter ile çizen hafif grafik."""
+
+    def __init__(self, baslik, birim, renk):
+        super().__init__()
+        self.baslik = baslik
+        self.birim = birim
+        self.renk = QColor(renk)
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.pencere = 60.0
+        self.setMinimumHeight(150)
+
+    def veri_ayarla(self, x, y, pencere):
+        # x: son örneğe göre saniye cinsinden zaman (<= 0)
+        self.x = x
+        self.y = y
+        self.pencere = pencere
+        self.update()
+
+    @olculur("grafik_boyama")
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#2C3E50"))
+        sol, ust, sag, alt = 70, 30, 15, 25
+        genislik = max(1, self.width() - sol - sag)
+        yukseklik = max(1, self.height() - ust - alt)
+
+        painter.setPen(QColor("white"))
+        painter.setFont(QFont("Arial", 11, QFont.Bold))
+        son_deger = f"{self.y[-1]:.2f} {self.birim}" if len(self.y) else f"-- {self.birim}"
+        painter.drawText(10, 20, f"{self.baslik}: {son_deger}")
+
+        painter.setPen(QPen(QColor("#34495E"), 1))
+        for i in range(5):
+            cizgi_y = ust + yukseklik * i / 4
+            painter.drawLine(QPointF(sol, cizgi_y), QPointF(sol + genislik, cizgi_y))
+
+        if len(self.y) == 0:
+            painter.end()
+            return
+
+        x, y = min_max_seyrelt(self.x, self.y, genislik)
+        en, ek = float(y.min()), float(y.max())
+        if ek - en < 1e-9:
+            en, ek = en - 0.5, ek + 0.5
+
+        painter.setFont(QFont("Arial", 9))
+        painter.setPen(QColor("#BDC3C7"))
+        for i in range(5):
+            deger = ek - (ek - en) * i / 4
+            painter.drawText(5, int(ust + yukseklik * i / 4) + 4, f"{deger:.2f}")
+        painter.drawText(sol, self.height() - 6, f"-{self.pencere:g} s")
+        painter.drawText(sol + genislik - 20, self.height() - 6, "0 s")
+
+        px = sol + (x + self.pencere) / self.pencere * genislik
+        py = ust + (ek - y) / (ek - en) * yukseklik
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(QPen(self.renk, 1.5))
+        painter.drawPolyline(polygon_olustur(px, py))
+        painter.end()
+
+
+class GrafikSayfasi(QWidget):
+    """Sıcaklık, basınç ve yüksekliği canlı ya da kayıttan çizen sayfa.
+
+    Canlı örnekler halka tampona eklenir; yeniden çizim ekran tazeleme
+    hızına bağlı bir zamanlayıcıyla yapılır ve yalnızca yeni veri geldiyse
+    ve sayfa görünürse tetiklenir. Kaynak olarak kayıtlı bir oturum
+    seçilirse görünen aralık sorgu katmanından piksel sayısı kadar noktayla
+    okunur, saatlerce süren bir oturumda da okunan satır sayısı sabittir.
+    Sorgular telemetri veritabanı thread'inde çalışır; sonuç gelmeden
+    istenen yeni çizimler birleştirilip tek sorguyla yapılır.
+    """
+    hata = pyqtSignal(str)  # başarısız kayıt sorgusu, sahibi loglar
+
+    def __init__(self, kapasite=100 * 3600, dosya=KAYIT_DOSYASI):
+        super().__init__()
+        self.tampon = HalkaTampon(kapasite, len(KANALLAR))
+        self.kirli = False
+        self.dosya = dosya
+        self.veritabani = None
+        self.oturum_araligi = None
+        self._sorgu_bekliyor = False
+        self._sorgu_kirli = False
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        ust_layout = QHBoxLayout()
+        baslik = QLabel("📈 Grafikler")
+        baslik.setStyleSheet("QLabel { color: white; font-size: 24px; font-weight: bold; }")
+        self.pencere_combo = QComboBox()
+        for ad, saniye in PENCERELER:
+            self.pencere_combo.addItem(ad, saniye)
+        self.pencere_combo.setCurrentIndex(1)
+        self.pencere_combo.setStyleSheet("""
+            QComboBox {
+                background-color: #2C3E50;
+                border: 2px solid #3498DB;
+                border-radius: 5px;
+                padding: 6px;
+                color: white;
+                font-size: 14px;
+            }
+        """)
+        # yeniden_ciz @olculur ile sarıldığından PyQt sinyalin int argümanını da geçirir, lambda keser
+        self.pencere_combo.currentIndexChanged.connect(lambda _: self.yeniden_ciz())
+        self.kaynak_combo = QComboBox()
+        self.kaynak_combo.setStyleSheet(self.pencere_combo.styleSheet())
+        self.kaynak_combo.addItem("Canlı", None)
+        self.kaynak_combo.currentIndexChanged.connect(self.kaynak_degisti)
+        self.konum_slider = QSlider(Qt.Horizontal)
+        self.konum_slider.setRange(0, 1000)
+        self.konum_slider.setValue(1000)
+        self.konum_slider.setToolTip("Kayıtta görünen pencerenin bitişi")
+        self.konum_slider.setVisible(False)
+        self.konum_slider.valueChanged.connect(lambda _: self.yeniden_ciz())
+        ust_layout.addWidget(baslik)
+        ust_layout.addStretch()
+        ust_layout.addWidget(QLabel("Kaynak:"))
+        ust_layout.addWidget(self.kaynak_combo)
+        ust_layout.addWidget(QLabel("Pencere:"))
+        ust_layout.addWidget(self.pencere_combo)
+        layout.addLayout(ust_layout)
+        layout.addWidget(self.konum_slider)
+
+        self.grafikler = []
+        for _, ad, birim, renk in KANALLAR:
+            grafik = GrafikWidget(ad, birim, renk)
+            self.grafikler.append(grafik)
+            layout.addWidget(grafik)
+
+        # çizimi ekran tazeleme hızıyla sınırla
+        ekran = QApplication.primaryScreen()
+        tazeleme = ekran.refreshRate() if ekran else 60.0
+        self.cizim_timer = QTimer(self)
+        self.cizim_timer.timeout.connect(self.cizim_tiki)
+        self.cizim_timer.start(int(1000 / max(1.0, tazeleme)))
+
+    @olculur("grafik_ekle")
+    def ekle(self, ornekler):
+        satirlar = []
+        for ornek in ornekler:
+            if ornek.get("sensor") != "BMP280":
+                continue
+            try:
+                satirlar.append(tuple(math.nan if ornek[alan] is None else float(ornek[alan])
+                                      for alan in ALANLAR))
+            except (KeyError, TypeError, ValueError):
+                continue  # eksik ya da sayısal olmayan alanlı örnek çizilmez
+        if not satirlar:
+            return
+        dizi = np.array(satirlar, dtype=np.float64).T
+        son = self.tampon.son_zaman()
+        if son is not None and dizi[0, 0] < son:  # zaman geriye gitti (kayıtta geri sarma)
+            self.tampon.temizle()
+        self.tampon.ekle(dizi[0], dizi[1:])
+        self.kirli = True
+
+    def temizle(self):
+        self.tampon.temizle()
+        self.yeniden_ciz()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.oturumlari_yenile()
+
+    def oturumlari_yenile(self):
+        if self.veritabani is None:
+            self.veritabani = telemetri_veritabani(self.dosya)
+        self.veritabani.gonder(oturumlari_listele, geri=self._oturumlar_geldi)
+
+    def _oturumlar_geldi(self, oturumlar):
+        secili = self.kaynak_combo.currentData()
+        self.kaynak_combo.blockSignals(True)
+        while self.kaynak_combo.count() > 1:
+            self.kaynak_combo.removeItem(1)
+        for oturum, _, aciklama, sure in oturumlar:
+            self.kaynak_combo.addItem(f"Kayıt #{oturum} ({sure:.0f} s) {aciklama}", oturum)
+        indeks = self.kaynak_combo.findData(secili)
+        self.kaynak_combo.setCurrentIndex(max(indeks, 0))
+        self.kaynak_combo.blockSignals(False)
+        if indeks < 0:
+            self.kaynak_degisti()
+
+    def kaynak_degisti(self):
+        oturum = self.kaynak_combo.currentData()
+        self.oturum_araligi = None
+        self.konum_slider.setVisible(False)
+        if oturum is None:
+            self.yeniden_ciz()
+            return
+        self.veritabani.gonder(oturum_araligi, oturum, ["BMP280"], geri=partial(self._aralik_geldi, oturum))
+
+    def _aralik_geldi(self, oturum, aralik):
+        bas, son = aralik
+        if oturum != self.kaynak_combo.currentData() or bas is None:
+            return
+        self.oturum_araligi = (oturum, bas, son)
+        self.konum_slider.setVisible(True)
+        self.yeniden_ciz()
+
+    def cizim_tiki(self):
+        if self.kirli and self.isVisible() and self.oturum_araligi is None:
+            self.yeniden_ciz()
+
+    @olculur("grafik_hazirlama")
+    def yeniden_ciz(self):
+        if self.oturum_araligi is not None:
+            self.kayittan_ciz()
+            return
+        self.kirli = False
+        pencere = self.pencere_combo.currentData()
+        zaman, degerler = self.tampon.sirali()
+        if len(zaman):
+            if not pencere:
+                pencere = max(zaman[-1] - zaman[0], 1.0)
+            bas = np.searchsorted(zaman, zaman[-1] - pencere)
+            x = zaman[bas:] - zaman[-1]
+            degerler = degerler[:, bas:]
+        else:
+            x = zaman
+            pencere = pencere or 60.0
+        for grafik, y in zip(self.grafikler, degerler):
+            grafik.veri_ayarla(x, y, pencere)
+
+    def kayittan_ciz(self):
+        if self._sorgu_bekliyor:
+            self._sorgu_kirli = True
+            return
+        oturum, ilk, son = self.oturum_araligi
+        sure = max(son - ilk, 1.0)
+        pencere = self.pencere_combo.currentData()
+        if not pencere or pencere > sure:
+            pencere = sure
+        bitis = ilk + pencere + (sure - pencere) * self.konum_slider.value() / 1000
+        piksel = max(grafik.width() for grafik in self.grafikler)
+        self._sorgu_bekliyor = True
+        self.veritabani.gonder(sorgula, "BMP280", oturum, bitis - pencere, bitis, piksel,
+                               geri=partial(self._sorgu_geldi, pencere, bitis),
+                               hata=self._sorgu_hatasi)
+
+    def _sorgu_geldi(self, pencere, bitis, sonuc):
+        self._sorgu_bekliyor = False
+        if self._sorgu_kirli:  # bu arada pencere/konum değişti, son hali çizilsin
+            self._sorgu_kirli = False
+            if self.oturum_araligi is not None:
+                self.kayittan_ciz()
+                return
+        if self.oturum_araligi is None:
+            return
+        for grafik, (alan, *_) in zip(self.grafikler, KANALLAR):
+            x, y = zarf(sonuc, alan)
+            x = x - bitis
+            gecerli = (x >= -pencere) & (x <= 0) & ~np.isnan(y)  # kovanın ortası pencere dışına taşabilir
+            grafik.veri_ayarla(x[gecerli], y[gecerli], pencere)
+
+    def _sorgu_hatasi(self, hata):
+        self._sorgu_bekliyor = False
+        self._sorgu_kirli = False
+        self.hata.emit(f"Grafik sorgusu başarısız: {hata}")
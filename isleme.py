@@ -0,0 +1,244 @@
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+DENIZ_SEVIYESI_HPA = 1013.25
+
+
+def _ileri_doldur(y, son):
+    """NaN değerleri bir önceki geçerli değerle doldurur (son: önceki paketten)."""
+    gecersiz = np.isnan(y)
+    if not gecersiz.any():
+        return y
+    y = np.concatenate(([son], y))
+    indeks = np.where(np.isnan(y), 0, np.arange(len(y)))
+    return y[np.maximum.accumulate(indeks)][1:]
+
+
+def _pencere_medyani(pencereler):
+    # tek uzunluklu pencerede tam sıralama yerine yalnızca ortadaki eleman seçilir
+    n = pencereler.shape[1]
+    if n % 2:
+        return np.partition(pencereler, n // 2, axis=1)[:, n // 2]
+    return np.median(pencereler, axis=1)
+
+
+class Asama:
+    """Tek kanallık akış aşaması: isle(zaman, y) aynı uzunlukta dizi döndürür.
+
+    Aşamalar paketler arasında durum taşır; ardışık paketlerin çıktısı
+    tüm veriyi tek seferde işlemekle aynıdır.
+    """
+
+    def isle(self, zaman, y):
+        raise NotImplementedError
+
+    def sifirla(self):
+        pass
+
+
+class _Pencereli(Asama):
+    # son (pencere - 1) örnek bir sonraki pakete taşınır, ilk pakette ilk değer tekrarlanır
+    def __init__(self, pencere):
+        self.pencere = pencere
+        self._gecmis = None
+
+    def _genislet(self, y):
+        if self._gecmis is None:
+            sonlu = y[np.isfinite(y)]
+            self._gecmis = np.full(self.pencere - 1, sonlu[0] if len(sonlu) else y[0])
+        x = np.concatenate((self._gecmis, y))
+        self._gecmis = x[len(x) - (self.pencere - 1):]
+        return x
+
+    def sifirla(self):
+        self._gecmis = None
+
+
+class HareketliOrtalama(_Pencereli):
+    def isle(self, zaman, y):
+        x = self._genislet(y)
+        toplam = np.cumsum(np.concatenate(([0.0], x)))
+        return (toplam[self.pencere:] - toplam[:-self.pencere]) / self.pencere
+
+
+class Medyan(_Pencereli):
+    def isle(self, zaman, y):
+        return _pencere_medyani(sliding_window_view(self._genislet(y), self.pencere))
+
+
+class AykiriAtici(_Pencereli):
+    """Hampel filtresi: son pencere örneğin medyanından esik × MAD'den fazla
+    sapan değeri medyanla değiştirir. Atılan örnekler 'atilan'da sayılır.
+
+    MAD en az cozunurluk (sensörün bir basamağı) kabul edilir; yuvarlanmış
+    değerlerde pencerenin çoğu aynıyken MAD sıfır olur ve bir basamaklık
+    değişim de aykırı sayılırdı.
+    """
+
+    def __init__(self, pencere=15, esik=4.0, cozunurluk=0.01):
+        super().__init__(pencere)
+        self.esik = esik
+        self.cozunurluk = cozunurluk
+        self.atilan = 0
+
+    def isle(self, zaman, y):
+        pencereler = sliding_window_view(self._genislet(y), self.pencere)
+        medyan = _pencere_medyani(pencereler)
+        mad = np.maximum(1.4826 * _pencere_medyani(np.abs(pencereler - medyan[:, None])), self.cozunurluk)
+        aykiri = np.abs(y - medyan) > self.esik * mad
+        self.atilan += int(np.count_nonzero(aykiri))
+        return np.where(aykiri, medyan, y)
+
+
+class UstelOrtalama(Asama):
+    """EMA: y[k] = (1 - alfa) * y[k-1] + alfa * x[k].
+
+    Özyineleme kapalı biçimde, b = 1 - alfa için
+    y[k] = b^k * (b * y[-1] + alfa * Σ x[j] / b^j) olarak cumsum ile
+    hesaplanır. b^-k taşmasın diye paket, b^-k < 1e150 kalacak uzunlukta
+    bloklara bölünür. Durum ilk sonlu değerle başlar, sonraki NaN girişler
+    bir önceki çıktıyla doldurulur; tek bir NaN filtreyi kalıcı bozmaz.
+    """
+
+    def __init__(self, alfa=0.2):
+        self.alfa = alfa
+        b = 1.0 - alfa
+        self._blok = max(1, int(150 * math.log(10) / -math.log(b))) if 0 < b < 1 else None
+        self._son = None
+
+    def isle(self, zaman, y):
+        if self._blok is None:  # alfa = 1
+            return y
+        if self._son is not None and not math.isfinite(self._son):
+            self._son = None
+        y = _ileri_doldur(y, math.nan if self._son is None else self._son)
+        cikti = np.full(len(y), math.nan)
+        ilk = 0
+        if self._son is None:
+            sonlu = np.flatnonzero(np.isfinite(y))
+            if not len(sonlu):
+                return cikti
+            ilk = int(sonlu[0])
+            self._son = y[ilk]
+        b = 1.0 - self.alfa
+        for bas in range(ilk, len(y), self._blok):
+            parca = y[bas:bas + self._blok]
+            us = b ** np.arange(len(parca))
+            cikti[bas:bas + len(parca)] = us * (b * self._son + self.alfa * np.cumsum(parca / us))
+            self._son = cikti[bas + len(parca) - 1]
+        return cikti
+
+    def sifirla(self):
+        self._son = None
+
+
+class BarometrikYukseklik(Asama):
+    """Basınçtan (hPa) uluslararası standart atmosfer formülüyle yükseklik (m)."""
+
+    def __init__(self, deniz_seviyesi=DENIZ_SEVIYESI_HPA):
+        self.deniz_seviyesi = deniz_seviyesi
+
+    def isle(self, zaman, y):
+        return 44330.0 * (1.0 - (y / self.deniz_seviyesi) ** (1 / 5.255))
+
+
+class DikeyHiz(Asama):
+    """Ardışık örnekler arasındaki yükseklik farkı / zaman farkı (m/s).
+
+    Zaman ilerlemeyen örneklerde (aynı damga, kayıtta geri sarma) bir
+    önceki hız tekrarlanır.
+    """
+
+    def __init__(self):
+        self._son = None  # (zaman, değer, hız)
+
+    def isle(self, zaman, y):
+        if self._son is None:
+            self._son = (zaman[0], y[0], 0.0)
+        onceki_zaman, onceki_deger, onceki_hiz = self._son
+        dt = np.diff(zaman, prepend=onceki_zaman)
+        dy = np.diff(y, prepend=onceki_deger)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            hiz = np.where(dt > 0, dy / dt, np.nan)
+        hiz = _ileri_doldur(hiz, onceki_hiz)
+        self._son = (zaman[-1], y[-1], hiz[-1])
+        return hiz
+
+    def sifirla(self):
+        self._son = None
+
+
+class IslemeHatti:
+    """Çözümleme ile gösterim arasında kanal başına zincirlenen işleme aşamaları.
+
+    ekle(giris, *asamalar, cikis=None) giris kanalını sırayla aşamalardan
+    geçirip cikis kanalına (verilmezse girişin üzerine) yazar; bir adımın
+    çıktısı sonraki adımların girişi olabilir. Girişteki NaN değerler bir
+    önceki geçerli değerle doldurulur. Tüm aşamalar paket üzerinde NumPy
+    ile çalışır, örnek başına Python döngüsü yalnızca sözlüklerden diziye
+    çevirirken yapılır.
+    """
+
+    def __init__(self, sensor="BMP280"):
+        self.sensor = sensor
+        self.adimlar = []
+        self._son_girisler = {}
+
+    def ekle(self, giris, *asamalar, cikis=None):
+        self.adimlar.append((giris, cikis or giris, list(asamalar)))
+        return self
+
+    def ham_kanallar(self):
+        uretilen, ham = set(), []
+        for giris, cikis, _ in self.adimlar:
+            if giris not in uretilen and giris not in ham:
+                ham.append(giris)
+            uretilen.add(cikis)
+        return ham
+
+    def isle_dizi(self, kanallar):
+        """kanallar: "zaman" ve ham kanalları içeren dizi sözlüğü; çıktılar eklenir."""
+        zaman = kanallar["zaman"]
+        for i, (giris, cikis, asamalar) in enumerate(self.adimlar):
+            y = kanallar[giris]
+            y = _ileri_doldur(y, self._son_girisler.get(i, np.nan))
+            self._son_girisler[i] = y[-1]
+            for asama in asamalar:
+                y = asama.isle(zaman, y)
+            kanallar[cikis] = y
+        return kanallar
+
+    def isle(self, ornekler):
+        adlar = ["zaman"] + self.ham_kanallar()
+        secili, satirlar = [], []
+        for ornek in ornekler:
+            if ornek.get("sensor") != self.sensor:
+                continue
+            try:
+                satirlar.append([math.nan if ornek[ad] is None else float(ornek[ad]) for ad in adlar])
+            except (KeyError, TypeError, ValueError):
+                continue  # eksik ya da sayısal olmayan kanallı örnek işlenmeden geçer
+            secili.append(ornek)
+        if not secili:
+            return
+        kanallar = dict(zip(adlar, np.array(satirlar, dtype=np.float64).T))
+        self.isle_dizi(kanallar)
+        for cikis in dict.fromkeys(cikis for _, cikis, _ in self.adimlar):
+            for ornek, deger in zip(secili, kanallar[cikis].tolist()):
+                ornek[cikis] = deger
+
+    def sifirla(self):
+        self._son_girisler.clear()
+        for _, _, asamalar in self.adimlar:
+            for asama in asamalar:
+                asama.sifirla()
+
+
+def varsayilan_hat(deniz_seviyesi=DENIZ_SEVIYESI_HPA):
+    """BMP280 için barometrik yükseklik ve dikey hız hattı."""
+    return (IslemeHatti("BMP280")
+            .ekle("basinc", AykiriAtici(15, 4.0, 0.01), BarometrikYukseklik(deniz_seviyesi), cikis="baro_yukseklik")
+            .ekle("baro_yukseklik", Medyan(5), UstelOrtalama(0.2))
+            .ekle("baro_yukseklik", DikeyHiz(), UstelOrtalama(0.1), cikis="dikey_hiz"))
@@ -0,0 +1,88 @@
+import queue
+import sqlite3
+import threading
+import time
+
+from veritabani import KAYIT_DOSYASI, SENSOR_ALANLARI, TELEMETRI_GOCLERI, baglan, tablo_adi, ozetleri_guncelle
+
+
+class TelemetriKaydedici(threading.Thread):
+    """Çözülen her örneği monotonic zaman damgasıyla diske yazar.
+
+    Örnekler herhangi bir thread'den ekle() ile kuyruğa atılır; kayıt
+    thread'i her aralik_ms'de kuyruğu boşaltıp sensör tablolarına tek
+    executemany ve tek commit ile yazar; aynı commit'te yazılan aralığın
+    1 sn / 1 dk / 1 sa özetleri de güncellenir. Veritabanı WAL modunda açılır.
+    """
+
+    def __init__(self, dosya=KAYIT_DOSYASI, aralik_ms=200, aciklama=""):
+        super().__init__(daemon=True)
+        self.dosya = dosya
+        self.aralik_ms = aralik_ms
+        self.aciklama = aciklama
+        self.kuyruk = queue.SimpleQueue()
+        self.oturum_id = None
+        self.kaydedilen = 0
+        self.atlanan = 0  # tablosu olmayan sensörden gelen örnekler
+        self.hata = None
+        self._dur = threading.Event()
+
+    def ekle(self, ornekler):
+        self.kuyruk.put(ornekler)
+
+    def durdur(self, bekle=False):
+        self._dur.set()
+        if bekle:
+            self.join()
+
+    def run(self):
+        try:
+            conn = baglan(self.dosya, TELEMETRI_GOCLERI)
+        except sqlite3.Error as e:
+            self.hata = str(e)
+            return
+        try:
+            cur = conn.execute(
+                "INSERT INTO oturumlar (baslangic, baslangic_monotonic, aciklama) VALUES (?, ?, ?)",
+                (time.time(), time.monotonic(), self.aciklama))
+            self.oturum_id = cur.lastrowid
+            conn.commit()
+
+            while not self._dur.wait(self.aralik_ms / 1000):
+                self._bosalt(conn)
+            self._bosalt(conn)  # durdurulurken kuyrukta kalanlar
+
+            conn.execute("UPDATE oturumlar SET bitis=? WHERE id=?", (time.time(), self.oturum_id))
+            conn.commit()
+        except sqlite3.Error as e:
+            self.hata = str(e)
+        finally:
+            conn.close()
+
+    def _bosalt(self, conn):
+        satirlar = {}
+        while True:
+            try:
+                ornekler = self.kuyruk.get_nowait()
+            except queue.Empty:
+                break
+            for ornek in ornekler:
+                alanlar = SENSOR_ALANLARI.get(ornek.get("sensor"))
+                if alanlar is None:
+                    self.atlanan += 1
+                    continue
+                satirlar.setdefault(ornek["sensor"], []).append(
+                    (self.oturum_id, ornek.get("zaman", time.monotonic()), ornek.get("sensor_id", 0))
+                    + tuple(ornek.get(alan) for alan in alanlar))
+        if not satirlar:
+            return
+        for sensor, degerler in satirlar.items():
+            alanlar = SENSOR_ALANLARI[sensor]
+            yer_tutucular = ", ".join("?" * (3 + len(alanlar)))
+            conn.executemany(
+                f"INSERT INTO {tablo_adi(sensor)} (oturum, zaman, sensor_id, {', '.join(alanlar)}) "
+                f"VALUES ({yer_tutucular})", degerler)
+            zamanlar = [satir[1] for satir in degerler]
+            ozetleri_guncelle(conn, sensor, self.oturum_id, min(zamanlar), max(zamanlar))
+            self.kaydedilen += len(degerler)
+        conn.commit()
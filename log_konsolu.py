@@ -0,0 +1,66 @@
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtCore import QTimer, QTime
+
+# Log seviyeleri, küçükten büyüğe
+HAM, BILGI, HATA = 0, 1, 2
+SEVIYELER = [("Ham veri dahil", HAM), ("Bilgi", BILGI), ("Yalnızca hatalar", HATA)]
+
+
+class LogKonsolu(QPlainTextEdit):
+    """Satır sayısı sınırlı, toplu güncellenen debug konsolu.
+
+    Mesajlar önce bir listede biriktirilir ve zamanlayıcıyla tek
+    appendPlainText çağrısında eklenir. Belge maks_satir bloğu aşınca en
+    eski satırlar Qt tarafından silinir. Ham veri satırları saniyede
+    ham_limit ile sınırlandırılır, fazlası sayılıp tek satırla özetlenir.
+    """
+
+    def __init__(self, maks_satir=1000, aralik_ms=100, ham_limit=20):
+        super().__init__()
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(maks_satir)
+        self.seviye = BILGI
+        self.ham_limit = ham_limit  # 0 = sınırsız
+        self._bekleyen = []
+        self._ham_bu_saniye = 0
+        self._atlanan_ham = 0
+        self._saniye = None
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.bosalt)
+        self.timer.start(aralik_ms)
+
+    def ham_acik(self):
+        return self.seviye <= HAM
+
+    def log(self, mesaj, seviye=BILGI):
+        if seviye < self.seviye:
+            return
+        zaman = QTime.currentTime().toString('hh:mm:ss')
+        if seviye == HAM and self.ham_limit:
+            if zaman != self._saniye:
+                self._saniye = zaman
+                self._ham_bu_saniye = 0
+            if self._ham_bu_saniye >= self.ham_limit:
+                self._atlanan_ham += 1
+                return
+            self._ham_bu_saniye += 1
+        self._bekleyen.append(f"[{zaman}] {mesaj}")
+
+    def bosalt(self):
+        if self._atlanan_ham:
+            zaman = QTime.currentTime().toString('hh:mm:ss')
+            self._bekleyen.append(f"[{zaman}] ... {self._atlanan_ham} ham veri satırı atlandı")
+            self._atlanan_ham = 0
+        if not self._bekleyen:
+            return
+        kaydirma = self.verticalScrollBar()
+        en_altta = kaydirma.value() >= kaydirma.maximum() - 2
+        # zaten silinecek satırları hiç eklememek için yalnızca sonuncular
+        self.appendPlainText("\n".join(self._bekleyen[-self.maximumBlockCount():]))
+        self._bekleyen.clear()
+        if en_altta:  # kullanıcı yukarıda okuyorsa kaydırma
+            kaydirma.setValue(kaydirma.maximum())
+
+    def seviye_ayarla(self, seviye):
+        self.seviye = seviye
@@ -1,23 +1,39 @@
+import os
 import sys
-import serial
-import json
-import sqlite3
+import time
+from functools import partial
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                           QHBoxLayout, QLabel, QComboBox, QPushButton, QTextEdit,
-                           QFrame, QStyleFactory,QMessageBox)
-from PyQt5.QtCore import QTimer, Qt, QTime
+                           QHBoxLayout, QLabel, QComboBox, QPushButton,
+                           QFrame, QStyleFactory,QMessageBox, QCheckBox,
+                           QSpinBox, QDoubleSpinBox, QSlider)
+from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QFont
-from PyQt5.uic import loadUi
-
-# Veritabanı bağlantısı ve tablo oluşturma 
-def create_database():
-    conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-    c.execute('''CREATE TABLE IF NOT EXISTS users
-                 (username TEXT PRIMARY KEY, password TEXT, remember_me INTEGER)''')
-    conn.commit()
-    conn.close()
-create_database()
+from seri_okuyucu import BAUD_HIZLARI, PROFILLER, PortIzleyici
+from edinim import EdinimMerkezi
+from kayit import TelemetriKaydedici
+from veritabani import (kullanici_veritabani, telemetri_veritabani, hepsini_kapat, oturumlari_listele,
+                        kullanici_dogrula, kullanici_ekle, hatirlanan_kullanici, hatirlamayi_kaldir)
+from tekrar import kayit_adresi
+from yayin import YAYIN_SOKETI, yayin_adresi
+from isleme import varsayilan_hat, DENIZ_SEVIYESI_HPA
+from grafik import GrafikSayfasi
+from tanilama import TanilamaSayfasi
+from olcum import ARAYUZ_OLCUMU, olculur
+from log_konsolu import LogKonsolu, SEVIYELER, HAM, BILGI, HATA
+from login_ui import Ui_LoginWindow
+from main_ui import Ui_MainWindow
+
+# Varsayılan olarak pyuic5 ile derlenmiş login_ui.py/main_ui.py kullanılır.
+# .ui dosyaları düzenlenirken yeniden derlemeden denemek için UI_DOSYALARINDAN=1.
+UI_DOSYALARINDAN = os.environ.get("UI_DOSYALARINDAN") == "1"
+
+
+def arayuz_kur(pencere, ui_dosyasi):
+    if UI_DOSYALARINDAN:
+        from PyQt5.uic import loadUi  # uic modülünün yüklenmesi de açılışa eklenmesin
+        loadUi(ui_dosyasi, pencere)
+    else:
+        pencere.setupUi(pencere)
 
 class ModernLabel(QLabel):
     def __init__(self, text):
@@ -32,9 +48,153 @@ class ModernLabel(QLabel):
                 margin: 5px;
             }
         """)
+        self._metin = text
+
+    def metin_ayarla(self, metin):
+        # metin değişmediyse setText çağrılmaz, gereksiz yeniden çizim olmaz
+        if metin != self._metin:
+            self._metin = metin
+            self.setText(metin)
+
+# Sensör kartlarında gösterilen kanallar: (alan, başlık, birim, biçim)
+SENSOR_KARTLARI = {
+    "BMP280": [
+        ("sicaklik", "🌡️ Sıcaklık", "°C", ".1f"),
+        ("basinc", "🔵 Basınç", "hPa", ".1f"),
+        ("yukseklik", "🏔️ Yükseklik", "m", ".1f"),
+        ("baro_yukseklik", "📐 Baro. Yükseklik", "m", ".1f"),
+        ("dikey_hiz", "⬆️ Dikey Hız", "m/s", ".2f"),
+    ],
+    "BNO055": [
+        ("yaw", "🧭 Yaw", "°", ".1f"),
+        ("pitch", "↕️ Pitch", "°", ".1f"),
+        ("roll", "↔️ Roll", "°", ".1f"),
+    ],
+    "NEO-M8N": [
+        ("enlem", "📍 Enlem", "°", ".6f"),
+        ("boylam", "📍 Boylam", "°", ".6f"),
+        ("irtifa", "⛰️ İrtifa", "m", ".1f"),
+        ("hiz", "🚀 Hız", "m/s", ".1f"),
+    ],
+    "Strain Gage": [
+        ("gerinim", "📊 Gerinim", "µε", ".1f"),
+    ],
+}
+
+class KartPaneli(QWidget):
+    """Bir sensörün kanallarını kartlarda gösterir.
+
+    Kartlar her örnekte değil, sabit bir hızda yalnızca son değerle
+    güncellenir; böylece veri hızı yeniden çizim maliyetine bağlı kalmaz.
+    """
+
+    def __init__(self, sensor, yenileme_hz=20):
+        super().__init__()
+        self.sensor = sensor
+        self.kanallar = SENSOR_KARTLARI[sensor]
+        self.layout = QHBoxLayout(self)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.kartlar = {}
+        for alan, baslik, birim, _ in self.kanallar:
+            kart = ModernLabel(f"{baslik}\n-- {birim}")
+            kart.setFont(QFont("Arial", 16))
+            self.layout.addWidget(kart)
+            self.kartlar[alan] = kart
+
+        self.son_degerler = {}
+        self.kirli = False
+        self.hata = None  # son biçimlendirme hatası, sahibi okuyup loglar
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.kartlari_guncelle)
+        self.yenileme_ayarla(yenileme_hz)
+
+    def yenileme_ayarla(self, hz):
+        self.timer.start(1000 // hz)
+
+    def ekle(self, ornekler):
+        # her kanal için yalnızca en son değer saklanır, aradakiler ekranda zaten görünmeyecek
+        eksik = {alan for alan, *_ in self.kanallar}
+        for ornek in reversed(ornekler):
+            if ornek.get("sensor") != self.sensor:
+                continue
+            for alan in list(eksik):
+                if alan in ornek:
+                    self.son_degerler[alan] = ornek[alan]
+                    eksik.discard(alan)
+                    self.kirli = True
+            if not eksik:
+                break
+
+    def kartlari_guncelle(self):
+        if not self.kirli:
+            return
+        baslangic = time.perf_counter()  # boş tikler ölçüme girmesin
+        self.kirli = False
+        for alan, baslik, birim, bicim in self.kanallar:
+            if alan not in self.son_degerler:
+                continue
+            try:
+                metin = f"{baslik}\n{self.son_degerler[alan]:{bicim}} {birim}"
+            except (TypeError, ValueError) as e:
+                del self.son_degerler[alan]
+                self.hata = f"Veri işleme hatası: {str(e)}"
+                continue
+            self.kartlar[alan].metin_ayarla(metin)
+        ARAYUZ_OLCUMU.ekle("kartlar", time.perf_counter() - baslangic)
+
+    def sifirla(self):
+        self.son_degerler.clear()
+        self.kirli = False
+        for alan, baslik, birim, _ in self.kanallar:
+            self.kartlar[alan].metin_ayarla(f"{baslik}\n-- {birim}")
+
+class SensorSayfasi(QWidget):
+    """BNO055, NEO-M8N ve Strain Gage için basit kart sayfası."""
+
+    def __init__(self, sensor, icon):
+        super().__init__()
+        self.sensor = sensor
+        layout = QVBoxLayout(self)
+        layout.setSpacing(20)
+        layout.setContentsMargins(20, 20, 20, 20)
+        baslik = QLabel(f"{icon} {sensor} Sensör Verileri")
+        baslik.setAlignment(Qt.AlignCenter)
+        baslik.setStyleSheet("""
+            QLabel {
+                color: white;
+                font-size: 24px;
+                font-weight: bold;
+                margin-bottom: 20px;
+            }
+        """)
+        layout.addWidget(baslik)
+        self.kart_paneli = KartPaneli(sensor)
+        layout.addWidget(self.kart_paneli)
+        self.durum_label = QLabel(f"{sensor} verisi bekleniyor...")
+        self.durum_label.setAlignment(Qt.AlignCenter)
+        self.durum_label.setStyleSheet("QLabel { color: #BDC3C7; font-size: 12px; }")
+        layout.addWidget(self.durum_label)
+        layout.addStretch()
+        self.sayac = 0
+        self.son_port = None
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.hiz_guncelle)
+        self.timer.start(1000)
+
+    def ekle(self, sensor, ornekler):
+        if sensor != self.sensor:
+            return
+        self.sayac += len(ornekler)
+        self.son_port = ornekler[-1].get("port")
+        self.kart_paneli.ekle(ornekler)
+
+    def hiz_guncelle(self):
+        if self.sayac:
+            self.durum_label.setText(f"{self.son_port}: {self.sayac} örnek/s")
+        self.sayac = 0
 
 class YerIstasyonu(QMainWindow):
-    def __init__(self):
+    def __init__(self, merkez=None):
         super().__init__()
         self.setWindowTitle("Yer İstasyonu - BMP280 Sensör Verileri")
         self.setGeometry(100, 100, 800, 600)
@@ -96,7 +256,15 @@ class YerIstasyonu(QMainWindow):
                 color: white;
                 outline: none;
             }
-            QTextEdit {
+            QSpinBox, QDoubleSpinBox {
+                background-color: #2C3E50;
+                border: 2px solid #3498DB;
+                border-radius: 5px;
+                padding: 6px;
+                color: white;
+                font-size: 14px;
+            }
+            QPlainTextEdit {
                 background-color: #2C3E50;
                 border: none;
                 border-radius: 10px;
@@ -139,125 +307,449 @@ class YerIstasyonu(QMainWindow):
                 color: #3498DB;
             }
         """)
-        self.port_layout = QHBoxLayout(self.port_frame)
-        self.port_layout.setContentsMargins(10, 10, 10, 10)
+        self.port_frame_layout = QVBoxLayout(self.port_frame)
+        self.port_frame_layout.setContentsMargins(10, 10, 10, 10)
+        self.port_layout = QHBoxLayout()
         self.port_layout.setSpacing(15)
         
         self.port_label = QLabel("📡 Port Seçiniz:")
         self.port_combo = QComboBox()
         self.port_combo.setPlaceholderText("Port Seçin...")
+        self.port_combo.setEditable(True)  # tcp://, udp://, pipe://, unix:// adresleri elle yazılabilir
+        if os.path.exists(YAYIN_SOKETI):
+            self.port_combo.addItem(yayin_adresi())  # çalışan edinim sunucusu (sunucu.py)
         self.refresh_button = QPushButton("🔄 Yenile")
         self.connect_button = QPushButton("🔌 Bağlan")
+        self.kayit_button = QPushButton("⏺ Kaydı Başlat")
+        self.toplu_checkbox = QCheckBox("Toplu okuma")
+        self.toplu_checkbox.setChecked(True)
+        self.toplu_checkbox.setToolTip("Her tikte tampondaki tüm veriyi tek seferde okur")
+        self.async_checkbox = QCheckBox("Asyncio")
+        self.async_checkbox.setToolTip("Seri portu asyncio motoruyla olay güdümlü okur "
+                                       "(tcp://, udp://, pipe:// adresleri her zaman asyncio kullanır)")
+        self.yeniden_baglan_checkbox = QCheckBox("Otomatik yeniden bağlan")
+        self.yeniden_baglan_checkbox.setToolTip("Bağlantı kendiliğinden koparsa (kablo çekilmesi, USB reset) "
+                                                "aygıt yeniden göründüğünde aynı ayarlarla tekrar bağlanır")
         
         self.port_layout.addWidget(self.port_label)
         self.port_layout.addWidget(self.port_combo)
         self.port_layout.addWidget(self.refresh_button)
+        self.port_layout.addWidget(self.toplu_checkbox)
+        self.port_layout.addWidget(self.async_checkbox)
+        self.port_layout.addWidget(self.yeniden_baglan_checkbox)
         self.port_layout.addWidget(self.connect_button)
-        
+        self.port_layout.addWidget(self.kayit_button)
+        
+        # Bağlantı ayarları (porta göre saklanır)
+        self.ayar_layout = QHBoxLayout()
+        self.ayar_layout.setSpacing(15)
+        self.profil_combo = QComboBox()
+        self.profil_combo.addItems(PROFILLER.keys())
+        self.baud_combo = QComboBox()
+        self.baud_combo.setEditable(True)
+        self.baud_combo.addItems([str(baud) for baud in BAUD_HIZLARI])
+        self.timeout_spin = QDoubleSpinBox()
+        self.timeout_spin.setRange(0.01, 5.0)
+        self.timeout_spin.setSingleStep(0.05)
+        self.timeout_spin.setSuffix(" s")
+        self.tik_spin = QSpinBox()
+        self.tik_spin.setRange(0, 1000)
+        self.tik_spin.setSuffix(" ms")
+        self.tik_spin.setSpecialValueText("Olay güdümlü")
+        
+        self.ayar_layout.addWidget(QLabel("⚙️ Profil:"))
+        self.ayar_layout.addWidget(self.profil_combo)
+        self.ayar_layout.addWidget(QLabel("Baud:"))
+        self.ayar_layout.addWidget(self.baud_combo)
+        self.ayar_layout.addWidget(QLabel("Zaman aşımı:"))
+        self.ayar_layout.addWidget(self.timeout_spin)
+        self.ayar_layout.addWidget(QLabel("Okuma aralığı:"))
+        self.ayar_layout.addWidget(self.tik_spin)
+        self.ekran_spin = QSpinBox()
+        self.ekran_spin.setRange(1, 60)
+        self.ekran_spin.setValue(20)
+        self.ekran_spin.setSuffix(" Hz")
+        self.ekran_spin.setToolTip("Sensör kartlarının yenilenme hızı")
+        self.ayar_layout.addWidget(QLabel("Ekran:"))
+        self.ayar_layout.addWidget(self.ekran_spin)
+        self.deniz_spin = QDoubleSpinBox()
+        self.deniz_spin.setRange(800.0, 1100.0)
+        self.deniz_spin.setDecimals(2)
+        self.deniz_spin.setValue(DENIZ_SEVIYESI_HPA)
+        self.deniz_spin.setSuffix(" hPa")
+        self.deniz_spin.setToolTip("Barometrik yükseklik için deniz seviyesi basıncı")
+        self.ayar_layout.addWidget(QLabel("Deniz seviyesi:"))
+        self.ayar_layout.addWidget(self.deniz_spin)
+        
+        # Kaydedilmiş oturumu yeniden oynatma
+        self.tekrar_layout = QHBoxLayout()
+        self.tekrar_layout.setSpacing(15)
+        self.oturum_combo = QComboBox()
+        self.oturum_combo.setMinimumWidth(200)
+        self.oturum_yenile_button = QPushButton("🔄")
+        self.tekrar_hiz_combo = QComboBox()
+        for ad, hiz in (("1x", 1.0), ("10x", 10.0), ("Maks", 0.0)):
+            self.tekrar_hiz_combo.addItem(ad, hiz)
+        self.konum_slider = QSlider(Qt.Horizontal)
+        self.konum_slider.setRange(0, 1000)
+        self.konum_slider.setEnabled(False)
+        self.konum_label = QLabel("0.0 / 0.0 s")
+        self.oynat_button = QPushButton("▶ Oynat")
+        
+        self.tekrar_layout.addWidget(QLabel("⏯ Kayıt:"))
+        self.tekrar_layout.addWidget(self.oturum_combo)
+        self.tekrar_layout.addWidget(self.oturum_yenile_button)
+        self.tekrar_layout.addWidget(self.tekrar_hiz_combo)
+        self.tekrar_layout.addWidget(self.konum_slider, 1)
+        self.tekrar_layout.addWidget(self.konum_label)
+        self.tekrar_layout.addWidget(self.oynat_button)
+        self.tekrar_adresi = None
+        self.tekrar_suresi = 0.0
+        
+        self.port_frame_layout.addLayout(self.port_layout)
+        self.port_frame_layout.addLayout(self.ayar_layout)
+        self.port_frame_layout.addLayout(self.tekrar_layout)
         self.layout.addWidget(self.port_frame)
+        self.port_ayarlari = {}
+        self.profil_uygula(self.profil_combo.currentText())
         
         # Sensör verileri için kartlar
-        self.data_layout = QHBoxLayout()
-        
-        self.sicaklik_label = ModernLabel("🌡️ Sıcaklık\n-- °C")
-        self.sicaklik_label.setFont(QFont("Arial", 16))
-        
-        self.basinc_label = ModernLabel("🔵 Basınç\n-- hPa")
-        self.basinc_label.setFont(QFont("Arial", 16))
-        
-        self.yukseklik_label = ModernLabel("🏔️ Yükseklik\n-- m")
-        self.yukseklik_label.setFont(QFont("Arial", 16))
-        
-        self.data_layout.addWidget(self.sicaklik_label)
-        self.data_layout.addWidget(self.basinc_label)
-        self.data_layout.addWidget(self.yukseklik_label)
-        
-        self.layout.addLayout(self.data_layout)
+        self.kart_paneli = KartPaneli("BMP280", self.ekran_spin.value())
+        self.sicaklik_label = self.kart_paneli.kartlar["sicaklik"]
+        self.basinc_label = self.kart_paneli.kartlar["basinc"]
+        self.yukseklik_label = self.kart_paneli.kartlar["yukseklik"]
+        self.layout.addWidget(self.kart_paneli)
+        
+        # Okuma istatistikleri (port başına bir satır)
+        self.durum_label = QLabel()
+        self.durum_label.setStyleSheet("QLabel { color: #BDC3C7; font-size: 12px; }")
+        self.layout.addWidget(self.durum_label)
+        self.arayuz_sayaci = 0
+        self.arayuz_hizi = 0.0
+        self.hiz_timer = QTimer()
+        self.hiz_timer.timeout.connect(self.arayuz_hizi_hesapla)
         
         # Debug alanı
-        self.debug_text = QTextEdit()
-        self.debug_text.setReadOnly(True)
+        self.log_layout = QHBoxLayout()
+        self.log_seviye_combo = QComboBox()
+        for ad, seviye in SEVIYELER:
+            self.log_seviye_combo.addItem(ad, seviye)
+        self.log_seviye_combo.setCurrentIndex(1)
+        self.ham_limit_spin = QSpinBox()
+        self.ham_limit_spin.setRange(0, 1000)
+        self.ham_limit_spin.setSuffix(" satır/s")
+        self.ham_limit_spin.setSpecialValueText("Sınırsız")
+        self.log_layout.addWidget(QLabel("📝 Log seviyesi:"))
+        self.log_layout.addWidget(self.log_seviye_combo)
+        self.log_layout.addWidget(QLabel("Ham veri limiti:"))
+        self.log_layout.addWidget(self.ham_limit_spin)
+        self.log_layout.addStretch()
+        self.layout.addLayout(self.log_layout)
+        
+        self.debug_text = LogKonsolu()
         self.debug_text.setMaximumHeight(150)
         self.debug_text.setPlaceholderText("Debug mesajları burada görünecek...")
+        self.ham_limit_spin.setValue(self.debug_text.ham_limit)
+        self.debug_text.seviye_ayarla(self.log_seviye_combo.currentData())
         self.layout.addWidget(self.debug_text)
         
-        # Serial port ve timer
-        self.serial_port = None
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.veri_oku)
+        # Veri toplama merkezi (port başına bir okuyucu thread'i) ve kayıt thread'i
+        self.merkez = merkez if merkez is not None else EdinimMerkezi(self)
+        self.merkez.ham_veri_ayarla(self.debug_text.ham_acik())
+        self.deniz_seviyesi_degisti(self.deniz_spin.value())
+        self.merkez.baglandi.connect(self.baglanti_kuruldu)
+        self.merkez.kapandi.connect(self.baglanti_kapandi)
+        self.merkez.koptu.connect(self.baglanti_koptu)
+        self.merkez.veri_geldi.connect(self.veri_oku)
+        self.merkez.ham_veri.connect(self.ham_veri_log)
+        self.merkez.hata.connect(lambda port, mesaj: self.debug_log(f"{port}: {mesaj}", HATA))
+        self.kaydedici = None
+        
+        # Takılan/çıkarılan seri aygıtlar arka planda izlenir, port listesi buna göre güncellenir
+        self.aygitlar = {}  # şu an takılı aygıtlar: ad -> kimlik
+        self.port_kimlikleri = {}  # görülmüş tüm aygıtlar, kopan bağlantının kimliği için
+        self.bekleyen_baglantilar = {}  # kimlik -> port_ac argümanları
+        self.yeniden_baglan_timer = QTimer(self)
+        self.yeniden_baglan_timer.timeout.connect(self.yeniden_baglanmayi_dene)
+        self.port_izleyici = PortIzleyici(parent=self)
+        self.port_izleyici.eklendi.connect(self.portlar_eklendi)
+        self.port_izleyici.cikarildi.connect(self.portlar_cikarildi)
+        self.port_izleyici.hata.connect(lambda mesaj: self.debug_log(mesaj, HATA))
         
         # Butonlar
         self.refresh_button.clicked.connect(self.portlari_yenile)
         self.connect_button.clicked.connect(self.port_baglan)
-        
-        self.portlari_yenile()
+        self.kayit_button.clicked.connect(self.kayit_baslat_durdur)
+        self.profil_combo.activated[str].connect(self.profil_uygula)
+        self.port_combo.currentTextChanged.connect(self.port_ayarlarini_yukle)
+        self.port_combo.currentTextChanged.connect(self.baglanti_durumunu_goster)
+        self.log_seviye_combo.currentIndexChanged.connect(self.log_seviyesi_degisti)
+        self.ham_limit_spin.valueChanged.connect(self.ham_limit_degisti)
+        self.ekran_spin.valueChanged.connect(self.kart_paneli.yenileme_ayarla)
+        self.deniz_spin.valueChanged.connect(self.deniz_seviyesi_degisti)
+        self.oturum_yenile_button.clicked.connect(self.oturumlari_yenile)
+        self.oynat_button.clicked.connect(self.oynat_durdur)
+        self.tekrar_hiz_combo.currentIndexChanged.connect(self.tekrar_hizi_degisti)
+        self.konum_slider.sliderReleased.connect(self.tekrar_konumu_degisti)
+        self.yeniden_baglan_checkbox.toggled.connect(self.yeniden_baglanma_degisti)
+        
+        self.port_izleyici.start()
+        self.oturumlari_yenile()
     
-    def debug_log(self, message):
-        self.debug_text.append(f"[{QTime.currentTime().toString('hh:mm:ss')}] {message}") # şuanki zaman alınır ve ui güncellenir
-        self.debug_text.verticalScrollBar().setValue(
-            self.debug_text.verticalScrollBar().maximum()
-        )
+    def debug_log(self, message, seviye=BILGI):
+        self.debug_text.log(message, seviye)  # konsol zamanlayıcısıyla toplu eklenir
+
+    def ham_veri_log(self, port, satirlar):
+        for satir in satirlar:
+            self.debug_log(f"Ham veri ({port}): {satir}", HAM)
+
+    def log_seviyesi_degisti(self):
+        self.debug_text.seviye_ayarla(self.log_seviye_combo.currentData())
+        self.merkez.ham_veri_ayarla(self.debug_text.ham_acik())
+
+    def ham_limit_degisti(self, limit):
+        self.debug_text.ham_limit = limit
     
     def portlari_yenile(self):
-        import serial.tools.list_ports 
-        
-        self.port_combo.clear() 
-        ports = serial.tools.list_ports.comports() # portları tarar
-        for port in ports:
-            self.port_combo.addItem(port.device) # combo box güncellenir
-            self.debug_log(f"Port bulundu: {port.device}")
-    
-    # seçili porta bağlan veya bağlantıyı kes
+        self.port_izleyici.yenile()  # sonuç portlar_eklendi/portlar_cikarildi ile gelir
+
+    def portlar_eklendi(self, aygitlar):
+        # liste baştan kurulmaz, seçili port ve elle yazılan adresler yerinde kalır
+        for port, kimlik in aygitlar.items():
+            self.aygitlar[port] = kimlik
+            self.port_kimlikleri[port] = kimlik
+            if self.port_combo.findText(port) < 0:
+                self.port_combo.addItem(port) # combo box güncellenir
+                self.debug_log(f"Port bulundu: {port}")
+        self.yeniden_baglanmayi_dene()
+
+    def portlar_cikarildi(self, portlar):
+        for port in portlar:
+            self.aygitlar.pop(port, None)
+            indeks = self.port_combo.findText(port)
+            if indeks >= 0:
+                self.port_combo.removeItem(indeks)
+            self.debug_log(f"Port çıkarıldı: {port}")
+
+    def port_izleyiciyi_durdur(self):
+        self.port_izleyici.durdur()
+        self.port_izleyici.wait()
+
+    def baglanti_koptu(self, port, secenekler):
+        # kullanıcı kesmeden biten seri port bağlantısı aygıt yeniden görününce kurulur
+        kimlik = self.port_kimlikleri.get(port)
+        if kimlik is None or not self.yeniden_baglan_checkbox.isChecked():
+            return
+        self.bekleyen_baglantilar[kimlik] = secenekler
+        self.debug_log(f"Port {port} koptu, aygıt yeniden bağlanınca bağlantı kurulacak")
+        if not self.yeniden_baglan_timer.isActive():
+            self.yeniden_baglan_timer.start(2000)
+
+    def yeniden_baglanmayi_dene(self):
+        # aygıt hemen geri gelmişse (hızlı reset) izleyici değişiklik görmeyebilir, zamanlayıcı yine dener
+        for port, kimlik in self.aygitlar.items():
+            secenekler = self.bekleyen_baglantilar.get(kimlik)
+            if secenekler is not None and port not in self.merkez.okuyucular:
+                self.debug_log(f"{port} yeniden bağlanıyor")
+                self.port_ayarlari[port] = {ad: secenekler[ad] for ad in ("baudrate", "timeout", "tik_ms")}
+                self.merkez.port_ac(port, **secenekler)
+                self.baglanti_durumunu_goster()
+        if not self.bekleyen_baglantilar:
+            self.yeniden_baglan_timer.stop()
+
+    def yeniden_baglanma_degisti(self, acik):
+        if not acik:
+            self.bekleyen_baglantilar.clear()
+            self.yeniden_baglan_timer.stop()
+
+    def profil_uygula(self, profil):
+        ayarlar = PROFILLER[profil]
+        self.baud_combo.setCurrentText(str(ayarlar["baudrate"]))
+        self.timeout_spin.setValue(ayarlar["timeout"])
+        self.tik_spin.setValue(ayarlar["tik_ms"])
+
+    def port_ayarlarini_yukle(self, port):
+        ayarlar = self.port_ayarlari.get(port)
+        if ayarlar is None:
+            return
+        self.baud_combo.setCurrentText(str(ayarlar["baudrate"]))
+        self.timeout_spin.setValue(ayarlar["timeout"])
+        self.tik_spin.setValue(ayarlar["tik_ms"])
+
+    def deniz_seviyesi_degisti(self, deger):
+        # filtre durumları sıfırlanır, her port ilk paketinde yeni hattı kurar
+        self.merkez.isleme_ayarla(partial(varsayilan_hat, deger))
+
+    def oturumlari_yenile(self):
+        telemetri_veritabani().gonder(oturumlari_listele, geri=self.oturumlari_goster)
+
+    def oturumlari_goster(self, oturumlar):
+        self.oturum_combo.clear()
+        for oturum, baslangic, aciklama, sure in oturumlar:
+            zaman = time.strftime("%d.%m.%Y %H:%M", time.localtime(baslangic))
+            self.oturum_combo.addItem(f"#{oturum} {zaman} ({sure:.0f} s) {aciklama}", oturum)
+
+    def oynatici(self):
+        return self.merkez.okuyucular.get(self.tekrar_adresi) if self.tekrar_adresi else None
+
+    def oynat_durdur(self):
+        if self.oynatici() is not None:
+            self.merkez.port_kapat(self.tekrar_adresi)
+            return
+        oturum = self.oturum_combo.currentData()
+        if oturum is None:
+            self.debug_log("Oynatılacak kayıt yok", HATA)
+            return
+        self.tekrar_adresi = kayit_adresi(oturum=oturum, hiz=self.tekrar_hiz_combo.currentData())
+        self.merkez.port_ac(self.tekrar_adresi)
+        self.oynatici().konum_degisti.connect(self.tekrar_konumu_goster)
+        self.oynat_button.setText("⏹ Durdur")
+        self.konum_slider.setEnabled(True)
+        self.debug_log(f"Oynatılıyor: oturum #{oturum}")
+
+    def tekrar_hizi_degisti(self):
+        oynatici = self.oynatici()
+        if oynatici is not None:
+            oynatici.hiz_ayarla(self.tekrar_hiz_combo.currentData())
+
+    def tekrar_konumu_degisti(self):
+        oynatici = self.oynatici()
+        if oynatici is not None:
+            oynatici.konum_ayarla(self.konum_slider.value() / 1000 * self.tekrar_suresi)
+
+    def tekrar_konumu_goster(self, konum, sure):
+        self.tekrar_suresi = sure
+        self.konum_label.setText(f"{konum:.1f} / {sure:.1f} s")
+        if not self.konum_slider.isSliderDown():
+            self.konum_slider.setValue(int(konum / sure * 1000) if sure else 0)
+
+    def baglanti_ayarlari(self):
+        return {
+            "baudrate": int(self.baud_combo.currentText()),
+            "timeout": self.timeout_spin.value(),
+            "tik_ms": self.tik_spin.value(),
+        }
+
+    # seçili porta bağlan veya bağlantıyı kes, diğer portlar etkilenmez
     def port_baglan(self):
-        if self.serial_port is None:  # bağlı değilse
+        port = self.port_combo.currentText()
+        if not self.merkez.bagli_mi(port):  # bağlı değilse
             try:
-                port = self.port_combo.currentText()
-                self.serial_port = serial.Serial(port, 9600, timeout=1)
-                self.connect_button.setText("🔌 Bağlantıyı Kes")
-                self.connect_button.setStyleSheet("""
-                    QPushButton {
-                        background-color: #E74C3C;
-                    }
-                    QPushButton:hover {
-                        background-color: #C0392B;
-                    }
-                """)
-                self.timer.start(1000)
-                self.debug_log(f"Port {port} bağlantısı başarılı")
-            except Exception as e:
-                self.debug_log(f"Bağlantı hatası: {str(e)}")
+                ayarlar = self.baglanti_ayarlari()
+            except ValueError:
+                self.debug_log(f"Geçersiz baud hızı: {self.baud_combo.currentText()}", HATA)
+                return
+            self.port_ayarlari[port] = ayarlar
+            self.merkez.port_ac(port, toplu_okuma=self.toplu_checkbox.isChecked(),
+                                asenkron=self.async_checkbox.isChecked(), **ayarlar)
+            self.baglanti_durumunu_goster()
         else:  # bağlıysa
-            self.timer.stop()
-            self.serial_port.close()
-            self.serial_port = None
+            self.merkez.port_kapat(port)
+            self.debug_log(f"Port {port} bağlantısı kesildi")
+
+    def baglanti_durumunu_goster(self):
+        bagli = self.merkez.bagli_mi(self.port_combo.currentText())
+        if bagli:
+            self.connect_button.setText("🔌 Bağlantıyı Kes")
+            self.connect_button.setStyleSheet("""
+                QPushButton {
+                    background-color: #E74C3C;
+                }
+                QPushButton:hover {
+                    background-color: #C0392B;
+                }
+            """)
+        else:
             self.connect_button.setText("🔌 Bağlan")
             self.connect_button.setStyleSheet("")
-            self.sicaklik_label.setText("🌡️ Sıcaklık\n-- °C")
-            self.basinc_label.setText("🔵 Basınç\n-- hPa")
-            self.yukseklik_label.setText("🏔️ Yükseklik\n-- m")
-            self.debug_log("Port bağlantısı kesildi")
-    
+        self.toplu_checkbox.setEnabled(not bagli)
+        self.async_checkbox.setEnabled(not bagli)
+        self.ayarlari_etkinlestir(not bagli)
 
-    def veri_oku(self):
-        if self.serial_port and self.serial_port.is_open:
-            try:
-                if self.serial_port.in_waiting:
-                    veri = self.serial_port.readline().decode().strip()
-                    self.debug_log(f"Ham veri: {veri}")
-                    try:
-                        sensor_data = json.loads(veri)
-                        self.sicaklik_label.setText(f"🌡️ Sıcaklık\n{sensor_data['sicaklik']:.1f} °C")
-                        self.basinc_label.setText(f"🔵 Basınç\n{sensor_data['basinc']:.1f} hPa")
-                        self.yukseklik_label.setText(f"🏔️ Yükseklik\n{sensor_data['yukseklik']:.1f} m")
-                    except json.JSONDecodeError as e:
-                        self.debug_log(f"JSON çözümleme hatası: {str(e)}")
-            except Exception as e:
-                self.debug_log(f"Veri okuma hatası: {str(e)}")
-
-class LoginWindow(QWidget):
+    def baglanti_kuruldu(self, port):
+        self.bekleyen_baglantilar.pop(self.port_kimlikleri.get(port), None)
+        if not self.hiz_timer.isActive():
+            self.arayuz_sayaci = 0
+            self.hiz_timer.start(1000)
+        self.debug_log(f"Port {port} bağlantısı başarılı")
+
+    def baglanti_kapandi(self, port):
+        # kullanıcı kesti ya da thread kendi kendine bitti (bağlantı hatası, kablo çekilmesi)
+        if port == self.tekrar_adresi:
+            self.tekrar_adresi = None
+            self.oynat_button.setText("▶ Oynat")
+            self.konum_slider.setEnabled(False)
+        self.baglanti_durumunu_goster()
+        if not self.merkez.portlar():
+            self.arayuzu_sifirla()
+        else:
+            self.durum_guncelle()
+
+    def baglantiyi_kes(self, bekle=False):
+        self.merkez.hepsini_kapat(bekle)
+        if bekle:
+            self.arayuzu_sifirla()
+
+    def kayit_baslat_durdur(self):
+        if self.kaydedici is None:
+            self.kaydedici = TelemetriKaydedici(aciklama=self.port_combo.currentText())
+            self.kaydedici.start()
+            # örnekler GUI thread'ine uğramadan okuyucu thread'lerinden kuyruğa girer
+            self.merkez.alici_ekle(self.kaydedici.ekle)
+            self.kayit_button.setText("⏹ Kaydı Durdur")
+            self.debug_log(f"Kayıt başladı: {self.kaydedici.dosya}")
+        else:
+            self.kaydi_durdur()
+
+    def kaydi_durdur(self, bekle=False):
+        if self.kaydedici is None:
+            return
+        self.merkez.alici_cikar(self.kaydedici.ekle)
+        self.kaydedici.durdur(bekle)
+        self.debug_log("Kayıt durduruldu")
+        self.kaydedici = None
+        self.kayit_button.setText("⏺ Kaydı Başlat")
+        self.oturumlari_yenile()
+
+    def arayuzu_sifirla(self):
+        self.hiz_timer.stop()
+        self.kart_paneli.sifirla()
+        self.durum_label.clear()
+
+    def ayarlari_etkinlestir(self, etkin):
+        for widget in (self.profil_combo, self.baud_combo, self.timeout_spin, self.tik_spin):
+            widget.setEnabled(etkin)
+
+    # arayüzün saniyede işlediği örnek sayısı, okuyucu hızına eşitse hat yetişiyor demektir
+    def arayuz_hizi_hesapla(self):
+        self.arayuz_hizi = self.arayuz_sayaci
+        self.arayuz_sayaci = 0
+        self.durum_guncelle()
+        if self.kaydedici is not None and self.kaydedici.hata:
+            self.debug_log(f"Kayıt hatası: {self.kaydedici.hata}", HATA)
+            self.kaydi_durdur()
+
+    def durum_guncelle(self):
+        satirlar = [durum.ozet() for durum in self.merkez.durumlar.values()]
+        satirlar.append(
+            f"Arayüz: {self.arayuz_hizi:.0f} örnek/s"
+            + (f" | Kayıt: {self.kaydedici.kaydedilen} örnek" if self.kaydedici else ""))
+        self.durum_label.setText("\n".join(satirlar))
+
+    # okuyucu thread'lerinden gelen örnekleri göster
+    @olculur("veri_oku")
+    def veri_oku(self, ornekler):
+        self.merkez.teslim_edildi(ornekler)
+        self.arayuz_sayaci += len(ornekler)
+        self.kart_paneli.ekle(ornekler)
+        if self.kart_paneli.hata:
+            self.debug_log(self.kart_paneli.hata, HATA)
+            self.kart_paneli.hata = None
+
+class LoginWindow(QWidget, Ui_LoginWindow):
     def __init__(self):
         super().__init__()
-        loadUi('login.ui', self)
+        arayuz_kur(self, 'login.ui')
         
         # butonlar
         self.login_btn.clicked.connect(self.login)
@@ -266,8 +758,11 @@ class LoginWindow(QWidget):
         # enter ile giriş 
         self.username.returnPressed.connect(self.login)
         self.password.returnPressed.connect(self.login)
+        self.istek_suruyor = False  # enter butonlar kapalıyken de login'i çağırır
     
     def login(self):
+        if self.istek_suruyor:
+            return
         username = self.username.text()
         password = self.password.text()
         remember = self.remember.isChecked()
@@ -275,52 +770,56 @@ class LoginWindow(QWidget):
         if not username or not password:
             QMessageBox.warning(self, "Hata", "Lütfen tüm alanları doldurun!")
             return
-            
-        conn = sqlite3.connect('users.db')
-        c = conn.cursor()
-        c.execute("SELECT * FROM users WHERE username=? AND password=?", (username, password))
-        user = c.fetchone()
-        
-        if user:
-            if remember:
-                c.execute("UPDATE users SET remember_me=0")  # önce tümünü sıfırla
-                c.execute("UPDATE users SET remember_me=1 WHERE username=?", (username,))
-                conn.commit()
-            conn.close()
-            
+        
+        # sorgu veritabanı thread'inde çalışır, sonuç gelene kadar butonlar kapalı
+        self.butonlari_etkinlestir(False)
+        kullanici_veritabani().gonder(kullanici_dogrula, username, password, remember,
+                                      geri=self.giris_sonucu, hata=self.veritabani_hatasi)
+    
+    def giris_sonucu(self, basarili):
+        self.butonlari_etkinlestir(True)
+        if basarili:
             # ana pencere
             self.main_window = MainWindow()
             self.main_window.show()
             self.close()
         else:
-            conn.close()
             QMessageBox.warning(self, "Hata", "Kullanıcı adı veya şifre hatalı!")
     
     def register(self):
+        if self.istek_suruyor:
+            return
         username = self.username.text()
         password = self.password.text()
         
         if not username or not password:
             QMessageBox.warning(self, "Hata", "Lütfen tüm alanları doldurun!")
             return
-            
-        conn = sqlite3.connect('users.db')
-        c = conn.cursor()
-        
-        try:
-            c.execute("INSERT INTO users (username, password, remember_me) VALUES (?, ?, 0)", 
-                     (username, password))
-            conn.commit()
+        
+        self.butonlari_etkinlestir(False)
+        kullanici_veritabani().gonder(kullanici_ekle, username, password,
+                                      geri=self.kayit_sonucu, hata=self.veritabani_hatasi)
+    
+    def kayit_sonucu(self, eklendi):
+        self.butonlari_etkinlestir(True)
+        if eklendi:
             QMessageBox.information(self, "Başarılı", "Kayıt başarıyla oluşturuldu!")
-        except sqlite3.IntegrityError:
+        else:
             QMessageBox.warning(self, "Hata", "Bu kullanıcı adı zaten kullanılıyor!")
-        finally:
-            conn.close()
+    
+    def veritabani_hatasi(self, hata):
+        self.butonlari_etkinlestir(True)
+        QMessageBox.critical(self, "Hata", f"Veritabanı hatası: {hata}")
+    
+    def butonlari_etkinlestir(self, etkin):
+        self.istek_suruyor = not etkin
+        self.login_btn.setEnabled(etkin)
+        self.register_btn.setEnabled(etkin)
 
-class MainWindow(QMainWindow):
+class MainWindow(QMainWindow, Ui_MainWindow):
     def __init__(self):
         super().__init__()
-        loadUi('main.ui', self)
+        arayuz_kur(self, 'main.ui')
         
         # Menü öğeleri
         menu_items = [
@@ -328,31 +827,36 @@ class MainWindow(QMainWindow):
             ("BNO055", "🔄"),
             ("NEO-M8N", "📍"),
             ("Strain Gage", "📊"),
-            ("Grafikler", "📈")
+            ("Grafikler", "📈"),
+            ("Tanılama", "🩺")
         ]
         
         for name, icon in menu_items:
             self.side_menu.addItem(f"{icon} {name}")
         
-        # BMP280 sayfası
-        self.bmp280_widget = YerIstasyonu()
+        # Tüm portları okuyan veri toplama merkezi, sayfalar örnekleri buradan alır
+        self.merkez = EdinimMerkezi(self)
+        
+        # BMP280 sayfası (bağlantı çubuğu da burada)
+        self.bmp280_widget = YerIstasyonu(self.merkez)
         self.content_stack.addWidget(self.bmp280_widget)
         
-        # diğer sensör sayfaları
-        for _ in range(4):
-            temp_widget = QWidget()
-            temp_layout = QVBoxLayout(temp_widget)
-            temp_label = QLabel("Bu özellik yakında eklenecek!")
-            temp_label.setStyleSheet("""
-                QLabel {
-                    color: white;
-                    font-size: 24px;
-                    padding: 20px;
-                }
-            """)
-            temp_label.setAlignment(Qt.AlignCenter)
-            temp_layout.addWidget(temp_label)
-            self.content_stack.addWidget(temp_widget)
+        # diğer sensör sayfaları ilk seçildiklerinde kurulur, o zamana kadar boş yer tutucu durur
+        self.sensor_sayfalari = {}
+        self.sayfa_kurucular = {}
+        for name, icon in menu_items[1:4]:
+            self.sayfa_kurucular[self.content_stack.count()] = partial(self.sensor_sayfasi_kur, name, icon)
+            self.content_stack.addWidget(QWidget())
+        
+        # Grafikler sayfası baştan kurulur, açılmadan önceki canlı veriyi de tamponlasın
+        self.grafik_widget = GrafikSayfasi()
+        self.merkez.veri_geldi.connect(self.grafik_widget.ekle)
+        self.grafik_widget.hata.connect(lambda mesaj: self.bmp280_widget.debug_log(mesaj, HATA))
+        self.content_stack.addWidget(self.grafik_widget)
+        
+        # ölçümler her zaman toplanır, tanılama sayfası yalnızca gösterir
+        self.sayfa_kurucular[self.content_stack.count()] = partial(TanilamaSayfasi, self.merkez)
+        self.content_stack.addWidget(QWidget())
         
         # Menü değişikliğini dinle
         self.side_menu.currentRowChanged.connect(self.change_page)
@@ -363,16 +867,31 @@ class MainWindow(QMainWindow):
         # İlk sayfayı seç
         self.side_menu.setCurrentRow(0)
     
+    def sensor_sayfasi_kur(self, name, icon):
+        sayfa = SensorSayfasi(name, icon)
+        self.merkez.sensor_verisi.connect(sayfa.ekle)
+        self.sensor_sayfalari[name] = sayfa
+        return sayfa
+
     def change_page(self, index):
+        kurucu = self.sayfa_kurucular.pop(index, None)
+        if kurucu is not None:
+            yer_tutucu = self.content_stack.widget(index)
+            self.content_stack.insertWidget(index, kurucu())
+            self.content_stack.removeWidget(yer_tutucu)
+            yer_tutucu.deleteLater()
         self.content_stack.setCurrentIndex(index)
+
+    def closeEvent(self, event):
+        # okuyucu thread'i çalışırken pencere yok edilmesin
+        self.bmp280_widget.port_izleyiciyi_durdur()
+        self.bmp280_widget.baglantiyi_kes(bekle=True)
+        self.bmp280_widget.kaydi_durdur(bekle=True)
+        super().closeEvent(event)
     
     def logout(self):
-        # Veritabanındaki remember_me değerini sıfırla
-        conn = sqlite3.connect('users.db')
-        c = conn.cursor()
-        c.execute("UPDATE users SET remember_me=0")
-        conn.commit()
-        conn.close()
+        # Veritabanındaki remember_me değerini sıfırla (arka planda)
+        kullanici_veritabani().gonder(hatirlamayi_kaldir)
         
         # Giriş ekranını aç
         self.login_window = LoginWindow()
@@ -381,21 +900,18 @@ class MainWindow(QMainWindow):
         # Mevcut pencereyi kapat
         self.close()
 
+def pencereyi_ac(kullanici):
+    # otomatik giriş kontrolünün sonucu, veritabanı thread'inden GUI thread'ine gelir
+    global window
+    window = MainWindow() if kullanici else LoginWindow()
+    window.show()
+
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     app.setStyle(QStyleFactory.create('Fusion'))
+    app.aboutToQuit.connect(hepsini_kapat)  # WAL içeriği kapanışta ana dosyaya yazılır
     
     # Otomatik giriş kontrolü
-    conn = sqlite3.connect('users.db')
-    c = conn.cursor()
-    c.execute("SELECT * FROM users WHERE remember_me=1")
-    user = c.fetchone()
-    conn.close()
+    kullanici_veritabani().gonder(hatirlanan_kullanici, geri=pencereyi_ac)
     
-    if user:
-        window = MainWindow()
-    else:
-        window = LoginWindow()
-    
-    window.show()
-    sys.exit(app.exec_()) 
\ No newline at end of file
+    sys.exit(app.exec_())
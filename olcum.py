@@ -0,0 +1,111 @@
+import bisect
+import functools
+import time
+
+# Süre kovaları: 1 µs'den ~10 s'ye, on katta dört kova (logaritmik).
+SURE_SINIRLARI = [10 ** (i / 4) * 1e-6 for i in range(29)]
+# Adet kovaları (kuyruk derinliği gibi): 0, 1, 2, 4, ... 8192
+ADET_SINIRLARI = [0] + [2 ** i for i in range(14)]
+
+
+class Histogram:
+    """Sabit kovalı histogram; ekleme bir bisect ve birkaç toplama kadardır.
+
+    Yüzdelikler değerin düştüğü kovanın üst sınırıyla (maksimumu aşmadan)
+    yaklaşık verilir, süre kovalarında en fazla %78 yukarı yuvarlanır;
+    ortalama ve maksimum kesindir.
+    """
+
+    def __init__(self, sinirlar=SURE_SINIRLARI):
+        self.sinirlar = sinirlar
+        self.kovalar = [0] * (len(sinirlar) + 1)  # son kova: en büyük sınırın üstü
+        self.adet = 0
+        self.toplam = 0.0
+        self.maks = 0.0
+
+    def ekle(self, deger):
+        self.kovalar[bisect.bisect_left(self.sinirlar, deger)] += 1
+        self.adet += 1
+        self.toplam += deger
+        if deger > self.maks:
+            self.maks = deger
+
+    def yuzdelik(self, oran):
+        if not self.adet:
+            return None
+        hedef = oran * self.adet
+        birikmis = 0
+        for i, sayi in enumerate(self.kovalar):
+            birikmis += sayi
+            if birikmis >= hedef:
+                return min(self.sinirlar[i], self.maks) if i < len(self.sinirlar) else self.maks
+        return self.maks
+
+    def ozet(self):
+        return {"adet": self.adet, "ort": self.toplam / self.adet if self.adet else None,
+                "p50": self.yuzdelik(0.5), "p90": self.yuzdelik(0.9), "p99": self.yuzdelik(0.99),
+                "maks": self.maks if self.adet else None}
+
+    def sozluk(self):
+        # boş kovalar atlanır: {üst sınır: adet}, son kova "inf"
+        kovalar = {(f"{self.sinirlar[i]:.6g}" if i < len(self.sinirlar) else "inf"): sayi
+                   for i, sayi in enumerate(list(self.kovalar)) if sayi}
+        return dict(self.ozet(), kovalar=kovalar)
+
+
+class Olcum:
+    """Tek bir thread'in yazdığı sayaç ve histogramlar.
+
+    Okuyucu thread'i kendi nesnesine kilitsiz yazar, tanılama sayfası GUI
+    thread'inden yalnızca okur; okunan anlık görüntü en fazla birkaç
+    güncelleme geride kalabilir. Süreler saniyedir.
+    """
+
+    def __init__(self):
+        self.sayaclar = {}
+        self.histogramlar = {}
+        self.baslangic = time.monotonic()
+
+    def say(self, ad, artis=1):
+        self.sayaclar[ad] = self.sayaclar.get(ad, 0) + artis
+
+    def ekle(self, ad, deger, sinirlar=SURE_SINIRLARI):
+        histogram = self.histogramlar.get(ad)
+        if histogram is None:
+            histogram = self.histogramlar[ad] = Histogram(sinirlar)
+        histogram.ekle(deger)
+
+    def sifirla(self):
+        # sözlükler değiştirilir, temizlenmez: yazan thread'in o anki güncellemesi en fazla kaybolur
+        self.sayaclar = {}
+        self.histogramlar = {}
+        self.baslangic = time.monotonic()
+
+    def sozluk(self):
+        # list() tek adımda kopyalar, yazan thread yeni anahtar eklerken de güvenlidir
+        return {"sure": time.monotonic() - self.baslangic,
+                "sayaclar": dict(list(self.sayaclar.items())),
+                "histogramlar": {ad: h.sozluk() for ad, h in list(self.histogramlar.items())}}
+
+
+# GUI thread'inin ölçümleri (veri gösterimi, kart ve grafik güncellemeleri)
+ARAYUZ_OLCUMU = Olcum()
+
+
+def olculur(ad, olcum=ARAYUZ_OLCUMU):
+    """Fonksiyonun her çağrısının süresini olcum'daki ad histogramına ekler.
+
+    Sarmalayıcı *argumanlar aldığından PyQt bir slota bağlandığında
+    sinyalin bütün argümanlarını geçirir; imzası sinyale uymayan bir
+    metot doğrudan değil, lambda ile bağlanmalıdır.
+    """
+    def dekorator(islev):
+        @functools.wraps(islev)
+        def sarmalayici(*argumanlar, **secenekler):
+            baslangic = time.perf_counter()
+            try:
+                return islev(*argumanlar, **secenekler)
+            finally:
+                olcum.ekle(ad, time.perf_counter() - baslangic)
+        return sarmalayici
+    return dekorator
@@ -0,0 +1,180 @@
+import json
+import struct
+from binascii import crc_hqx
+
+# İkili çerçeve düzeni (little endian):
+#   AA 55 | tip (u8) | sensor_id (u8) | float32 alanlar | CRC16 (u16)
+# CRC16-CCITT (poly 0x1021, başlangıç 0xFFFF) tip baytından son alana kadar
+# hesaplanır. Alan sayısı mesaj tipine göre sabittir.
+SYNC = b'\xAA\x55'
+CRC_BASLANGIC = 0xFFFF
+
+MESAJ_TIPLERI = {
+    0x01: ("BMP280", ("sicaklik", "basinc", "yukseklik")),
+    0x02: ("BNO055", ("yaw", "pitch", "roll")),
+    0x03: ("NEO-M8N", ("enlem", "boylam", "irtifa", "hiz")),
+    0x04: ("Strain Gage", ("gerinim",)),
+}
+
+# sync sonrası kısım: tip, sensor_id, alanlar, crc
+YAPILAR = {tip: struct.Struct(f"<BB{len(alanlar)}fH")
+           for tip, (_, alanlar) in MESAJ_TIPLERI.items()}
+SENSOR_TIPLERI = {sensor: tip for tip, (sensor, _) in MESAJ_TIPLERI.items()}
+# JSON çerçevede bulunduğunda sayı olması gereken alanlar
+SAYISAL_ALANLAR = frozenset(alan for _, alanlar in MESAJ_TIPLERI.values() for alan in alanlar)
+
+
+def cerceve_olustur(sensor, degerler, sensor_id=0):
+    """Verilen sensör değerlerini ikili çerçeveye çevirir (simülatör ve testler için)."""
+    tip = SENSOR_TIPLERI[sensor]
+    _, alanlar = MESAJ_TIPLERI[tip]
+    yapi = YAPILAR[tip]
+    govde = yapi.pack(tip, sensor_id, *(degerler[alan] for alan in alanlar), 0)[:-2]
+    return SYNC + govde + struct.pack("<H", crc_hqx(govde, CRC_BASLANGIC))
+
+
+class CerceveCozucu:
+    """JSON satırları ile ikili çerçeveleri aynı akıştan ayırıp çözer.
+
+    Gelen baytlar kalıcı bir tampona eklenir; tamamlanmamış son çerçeve bir
+    sonraki beslemeye kadar bekler. Tampondaki her konumda sync kelimesi
+    varsa ikili, yoksa satır sonuna kadar JSON çerçeve okunur. ASCII JSON
+    0xAA baytı içermediğinden iki biçim karışık gelse de ayrışır; ASCII
+    dışı UTF-8 metinde ise sync dizisi geçebilir ("ĪU" = C4 AA 55). Bu
+    durum dışlanmaz, bozulma sayılır: satır sync'te kesilir, ikili çerçeve
+    olarak çözülemeyen kısım aşağıdaki eşitleme yoluyla atlanır ve sonraki
+    satırdan devam edilir.
+
+    Bozulma hiçbir zaman paketin geri kalanını düşürmez: bozuk ikili
+    çerçevede sync'ten sonraki ilk sync'e, bozuk JSON satırında satırdaki
+    sonraki '{' konumuna atlanır. Atlanan her çerçeve hatalar sözlüğünde
+    türüne göre (crc, cozme, json, tasma) sayılır.
+    """
+
+    zaman_damgali = False  # örneklere zaman damgasını okuyucu ekler
+
+    def __init__(self, maks_uzunluk=4096):
+        self.maks_uzunluk = maks_uzunluk
+        self.tampon = bytearray()
+        self.hatalar = {"crc": 0, "cozme": 0, "json": 0, "tasma": 0}
+        self.son_hata = None
+        self.kurtarilan = 0  # bozuk satırdan ayrıştırılıp kurtarılan JSON çerçeveleri
+        self.esitleniyor = False  # bozuk ikili çerçeve sonrası çöp bir kez sayılsın
+
+    def sifirla(self):
+        self.tampon.clear()
+        self.esitleniyor = False
+
+    def toplam_hata(self):
+        return sum(self.hatalar.values())
+
+    def besle(self, veri):
+        """Yeni baytları ekler, çözülebilen tüm örnekleri ve ham JSON satırlarını döndürür."""
+        self.tampon += veri
+        tampon = self.tampon
+        n = len(tampon)
+        ornekler = []
+        satirlar = []
+        esitleniyor = self.esitleniyor
+        sync = -1  # bir sonraki sync konumu; her satırda tamponu baştan taramamak için saklanır
+        i = 0
+        while i < n:
+            if tampon[i] == 0xAA and (i + 1 == n or tampon[i + 1] == 0x55):
+                if n - i < 3:
+                    break
+                yapi = YAPILAR.get(tampon[i + 2])
+                if yapi is None:  # bilinmeyen tip, sync'i atlayıp yeniden eşitlen
+                    self._hata("cozme", f"Bilinmeyen mesaj tipi: {tampon[i + 2]:#04x}")
+                    esitleniyor = True
+                    i += 2
+                    continue
+                son = i + 2 + yapi.size
+                if son > n:
+                    break
+                alanlar = yapi.unpack_from(tampon, i + 2)
+                if crc_hqx(tampon[i + 2:son - 2], CRC_BASLANGIC) != alanlar[-1]:
+                    self._hata("crc", "CRC hatası")
+                    esitleniyor = True
+                    i += 2
+                    continue
+                sensor, isimler = MESAJ_TIPLERI[alanlar[0]]
+                ornek = dict(zip(isimler, alanlar[2:-1]))
+                ornek["sensor"] = sensor
+                ornek["sensor_id"] = alanlar[1]
+                ornekler.append(ornek)
+                esitleniyor = False
+                i = son
+                continue
+
+            satir_sonu = tampon.find(b'\n', i)
+            if sync < i and sync != n:
+                sync = tampon.find(SYNC, i)
+                if sync < 0:
+                    sync = n
+            if sync < n and (satir_sonu < 0 or sync < satir_sonu):
+                # satır sonu gelmeden ikili çerçeve başladı, aradaki baytlar çöp
+                if not esitleniyor and tampon[i:sync].strip():
+                    self._hata("cozme", "Çerçeve dışı veri atlandı")
+                i = sync
+                continue
+            if satir_sonu < 0:
+                break
+            satir = bytes(tampon[i:satir_sonu]).strip()
+            i = satir_sonu + 1
+            esitleniyor = False
+            if satir:
+                ornekler += self._json_coz(satir, satirlar)
+
+        self.esitleniyor = esitleniyor
+        del tampon[:i]
+        if len(tampon) > self.maks_uzunluk:
+            tampon.clear()
+            self._hata("tasma", "Çerçeve sonu bulunamadı, tampon temizlendi")
+        return ornekler, satirlar
+
+    def _json_coz(self, satir, satirlar):
+        satirlar.append(satir.decode(errors="replace"))
+        ornek, hata = self._json_dene(satir)
+        if hata is None:
+            return [ornek]
+        # bozulup satır sonunu yutan çerçeve bir sonrakiyle aynı satıra yapışır;
+        # satır her '{' konumundan bölünüp sağlam kalan çerçeveler kurtarılır
+        parcalar = satir.split(b'{')
+        if len(parcalar) < 3 and not parcalar[0].strip():
+            self._hata(*hata)
+            return []
+        ornekler = []
+        if parcalar[0].strip():
+            self._hata("cozme", "Çerçeve dışı veri atlandı")
+        for parca in parcalar[1:]:
+            ornek, hata = self._json_dene(b'{' + parca)
+            if hata is None:
+                ornekler.append(ornek)
+                self.kurtarilan += 1
+            else:
+                self._hata(*hata)
+        return ornekler
+
+    def _json_dene(self, satir):
+        try:
+            metin = satir.decode()
+        except UnicodeDecodeError as e:
+            return None, ("cozme", f"Geçersiz UTF-8: {str(e)}")
+        try:
+            ornek = json.loads(metin)
+        except json.JSONDecodeError as e:
+            return None, ("json", f"JSON çözümleme hatası: {str(e)}")
+        if not isinstance(ornek, dict):
+            return None, ("json", "JSON çözümleme hatası: nesne bekleniyordu")
+        ornek.setdefault("sensor", "BMP280")
+        if not isinstance(ornek["sensor"], str):
+            return None, ("json", "JSON çözümleme hatası: sensor metin olmalı")
+        for alan in SAYISAL_ALANLAR.intersection(ornek):
+            deger = ornek[alan]
+            if isinstance(deger, bool) or not isinstance(deger, (int, float)):
+                return None, ("json", f"JSON çözümleme hatası: {alan} sayı değil ({deger!r})")
+        return ornek, None
+
+    def _hata(self, tur, mesaj):
+        self.hatalar[tur] += 1
+        self.son_hata = mesaj
@@ -0,0 +1,268 @@
+import os
+import threading
+import time
+import serial
+from PyQt5.QtCore import QThread, pyqtSignal
+from protokol import CerceveCozucu
+from olcum import Olcum
+
+# Seri port adı dışındaki adres biçimleri (tasima.AsyncOkuyucu ile okunur):
+#   tcp://host:port   TCP istemcisi (ör. simülatör ya da seri-ağ köprüsü)
+#   udp://host:port   belirtilen adreste UDP datagramlarını dinler
+#   pipe:///yol       yerel FIFO ya da pty (ör. /dev/pts/3)
+#   unix:///yol       sunucu.py edinim sunucusunun yayın soketi (yayin.py)
+ADRES_ONEKLERI = ("tcp://", "udp://", "pipe://", "unix://")
+
+BAUD_HIZLARI = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600]
+
+# Bağlantı çubuğundaki hazır ayarlar. tik_ms=0 olay güdümlü okuma demektir:
+# okuyucu uyumak yerine ilk bayt gelene kadar read(1) içinde bekler.
+PROFILLER = {
+    "Standart": {"baudrate": 9600, "timeout": 1.0, "tik_ms": 20},
+    "Hızlı": {"baudrate": 115200, "timeout": 0.05, "tik_ms": 0},
+    "Yüksek hız": {"baudrate": 921600, "timeout": 0.02, "tik_ms": 0},
+}
+
+
+class SeriOkuyucu(QThread):
+    """Seri portu GUI thread'inden ayrı bir thread'de sürekli okur.
+
+    Okunan çerçeveler çözülür ve sinyal ile arayüze iletilir, böylece arayüz
+    hiçbir zaman serial.Serial çağrısında beklemez.
+
+    toplu_okuma açıkken her tikte in_waiting'deki tüm veri tek read() ile
+    alınır ve CerceveCozucu ile JSON ya da ikili çerçevelere ayrılır; satır
+    satır okuma yalnızca JSON destekler. Bir tikte maks_cerceve'den fazla
+    çerçeve birikmişse en eskileri atılır, böylece gecikme yüksek örnekleme hızlarında da sınırlı kalır.
+    tik_ms=0 ise tikler arasında uyunmaz, okuma veri geldiği anda uyanır.
+
+    olcum bu thread'in tanılama sayaç ve histogramlarını tutar: okuma
+    (toplu okumada bekleyen verinin read() süresi), cozme (paket başına),
+    yonlendirme (veri_geldi'ye doğrudan bağlı alıcıların süresi), bayt,
+    cerceve, paket, dusen ve hatali sayıları.
+    """
+    baglandi = pyqtSignal(str)
+    veri_geldi = pyqtSignal(list)  # çözümlenmiş örnekler (dict listesi)
+    ham_veri = pyqtSignal(list)  # çözülen JSON satırlarının metni
+    hata = pyqtSignal(str)
+    tik_istatistik = pyqtSignal(int, int)  # bu tikte işlenen, düşürülen çerçeve
+    hiz_istatistik = pyqtSignal(float, float)  # saniyedeki çerçeve, bayt
+    hata_istatistik = pyqtSignal(dict, int, str)  # türe göre toplam hatalar, son bildirimden beri yeni hata, son hata mesajı
+
+    def __init__(self, port, baudrate=9600, timeout=0.1, toplu_okuma=True,
+                 tik_ms=20, maks_cerceve=500, parent=None):
+        super().__init__(parent)
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.toplu_okuma = toplu_okuma
+        self.tik_ms = tik_ms
+        self.maks_cerceve = maks_cerceve
+        self.cozucu = CerceveCozucu()
+        self.ham_veri_acik = True  # kapalıyken ham satırlar için sinyal hiç gönderilmez
+        self.serial_port = None
+        self._calisiyor = True  # run başlamadan durdur() çağrılırsa da kaybolmasın
+        self._hiz_zaman = 0.0
+        self._hiz_cerceve = 0
+        self._hiz_bayt = 0
+        self._bekleyen_hata = 0  # son bildirimden beri çözme hatası sayısı
+        self.olcum = Olcum()
+
+    def run(self):
+        try:
+            self.serial_port = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+        except Exception as e:
+            self.hata.emit(f"Bağlantı hatası: {str(e)}")
+            return
+
+        self._hiz_zaman = time.monotonic()
+        self.baglandi.emit(self.port)
+        try:
+            if self.toplu_okuma:
+                self._toplu_oku()
+            else:
+                self._satir_satir_oku()
+        except Exception as e:
+            self.hata.emit(f"Veri okuma hatası: {str(e)}")
+        finally:
+            self.serial_port.close()
+            self.serial_port = None
+
+    def _satir_satir_oku(self):
+        self.cozucu.sifirla()
+        while self._calisiyor:
+            satir = self.serial_port.readline()  # en fazla timeout kadar bekler
+            if satir:
+                ornekler, _ = self._cozumle(satir)
+                if ornekler:
+                    self._ornekleri_gonder(ornekler)
+                self._hiz_kaydet(len(satir), len(ornekler))
+            else:
+                self._hiz_kaydet(0, 0)
+
+    def _toplu_oku(self):
+        self.cozucu.sifirla()
+        while self._calisiyor:
+            veri = self._bekleyeni_oku()
+            if not veri:
+                self._hiz_kaydet(0, 0)
+                continue
+            self._paket_isle(veri)
+            if self.tik_ms:
+                self.msleep(self.tik_ms)
+
+    def _paket_isle(self, veri):
+        ornekler, dusurulen = self._cozumle(veri)
+        if len(ornekler) > self.maks_cerceve:  # birikmiş eski çerçeveleri at
+            self.olcum.say("dusen", len(ornekler) - self.maks_cerceve)
+            dusurulen += len(ornekler) - self.maks_cerceve
+            ornekler = ornekler[-self.maks_cerceve:]
+        if ornekler:
+            self._ornekleri_gonder(ornekler)
+        if ornekler or dusurulen:
+            self.tik_istatistik.emit(len(ornekler), dusurulen)
+        self._hiz_kaydet(len(veri), len(ornekler))
+
+    def _ornekleri_gonder(self, ornekler):
+        # DirectConnection ile bağlı alıcılar (EdinimMerkezi._yonlendir) bu çağrının içinde çalışır
+        baslangic = time.perf_counter()
+        self.veri_geldi.emit(ornekler)
+        self.olcum.ekle("yonlendirme", time.perf_counter() - baslangic)
+        self.olcum.say("paket")
+
+    def _cozumle(self, veri):
+        zaman = time.monotonic()
+        hata = self.cozucu.toplam_hata()
+        baslangic = time.perf_counter()
+        ornekler, satirlar = self.cozucu.besle(veri)
+        self.olcum.ekle("cozme", time.perf_counter() - baslangic)
+        self.olcum.say("bayt", len(veri))
+        self.olcum.say("cerceve", len(ornekler))
+        if not self.cozucu.zaman_damgali:
+            for ornek in ornekler:
+                ornek["zaman"] = zaman
+        if satirlar and self.ham_veri_acik:
+            self.ham_veri.emit(satirlar)
+        hatali = self.cozucu.toplam_hata() - hata
+        if hatali:
+            self.olcum.say("hatali", hatali)
+        # gürültülü hatta her tikte log basmamak için hatalar saniyede bir özetlenir
+        self._bekleyen_hata += hatali
+        return ornekler, hatali
+
+    def _bekleyeni_oku(self):
+        bekleyen = self.serial_port.in_waiting
+        if bekleyen:
+            return self._oku(bekleyen)
+        if self.tik_ms:
+            self.msleep(self.tik_ms)
+            return b''
+        # olay güdümlü: ilk bayt gelene (veya timeout dolana) kadar bekle
+        ilk = self.serial_port.read(1)
+        if not ilk:
+            return b''
+        return ilk + self._oku(self.serial_port.in_waiting)
+
+    def _oku(self, bayt):
+        # yalnızca hazır verinin okunması ölçülür, verinin gelmesini beklemek değil
+        baslangic = time.perf_counter()
+        veri = self.serial_port.read(bayt)
+        self.olcum.ekle("okuma", time.perf_counter() - baslangic)
+        return veri
+
+    def _hiz_kaydet(self, bayt, cerceve):
+        self._hiz_bayt += bayt
+        self._hiz_cerceve += cerceve
+        simdi = time.monotonic()
+        gecen = simdi - self._hiz_zaman
+        if gecen >= 1.0:
+            self.hata_istatistik.emit(dict(self.cozucu.hatalar), self._bekleyen_hata,
+                                      self.cozucu.son_hata or "")
+            self._bekleyen_hata = 0
+            self.hiz_istatistik.emit(self._hiz_cerceve / gecen, self._hiz_bayt / gecen)
+            self._hiz_zaman = simdi
+            self._hiz_cerceve = 0
+            self._hiz_bayt = 0
+
+    def durdur(self):
+        # döngü bir sonraki readline zaman aşımında sonlanır
+        self._calisiyor = False
+
+
+class PortIzleyici(QThread):
+    """Seri aygıtların takılıp çıkarılmasını arka planda izler.
+
+    Linux'ta her turda yalnızca /sys/class/tty klasörü listelenir;
+    comports() (bazı sistemlerde yüzlerce milisaniye sürer) yalnızca bu
+    liste değiştiğinde ya da yenile() istendiğinde çağrılır ve sonucu
+    aygitlar önbelleğinde tutulur. sysfs olmayan sistemlerde her turda
+    comports() çağrılır. Önbellekle karşılaştırılan değişiklikler eklendi
+    ve cikarildi sinyalleriyle bildirilir; ilk tur bulunan tüm aygıtları
+    eklendi olarak gönderir.
+    """
+    eklendi = pyqtSignal(dict)  # aygıt adı -> kimlik
+    cikarildi = pyqtSignal(list)  # aygıt adları
+    hata = pyqtSignal(str)
+
+    SYSFS_TTY = "/sys/class/tty"
+
+    def __init__(self, aralik_ms=1000, parent=None):
+        super().__init__(parent)
+        self.aralik_ms = aralik_ms
+        self.aygitlar = {}
+        self._calisiyor = True
+        self._zorla = False
+        self._uyandir = threading.Event()
+
+    @staticmethod
+    def kimlik(port):
+        # USB aygıtları reset sonrası başka adla gelebilir (ttyUSB0 → ttyUSB1), VID:PID ve seri numarası
+        # değişmez. hwid'deki LOCATION= takıldığı USB portudur, bu yüzden yalnızca seri numarası
+        # olmayan aygıtlarda (ör. CH340) kullanılır: aynı modelden iki kart karışmasın, aynı porta
+        # yeniden takılan kart tanınsın
+        if port.vid is None:
+            return port.device
+        if port.serial_number:
+            return f"USB {port.vid:04X}:{port.pid:04X} SER={port.serial_number}"
+        return port.hwid
+
+    def run(self):
+        from serial.tools import list_ports
+        imza = None
+        while self._calisiyor:
+            yeni_imza = self._sysfs_imzasi()
+            if yeni_imza is None or yeni_imza != imza or self._zorla:
+                self._zorla = False
+                try:
+                    aygitlar = {port.device: self.kimlik(port) for port in list_ports.comports()}
+                except Exception as e:
+                    self.hata.emit(f"Port taraması başarısız: {e}")
+                else:
+                    imza = yeni_imza
+                    self._karsilastir(aygitlar)
+            self._uyandir.wait(self.aralik_ms / 1000)
+            self._uyandir.clear()
+
+    def _sysfs_imzasi(self):
+        try:
+            return frozenset(os.listdir(self.SYSFS_TTY))
+        except OSError:
+            return None
+
+    def _karsilastir(self, aygitlar):
+        eklenen = {ad: kimlik for ad, kimlik in aygitlar.items() if self.aygitlar.get(ad) != kimlik}
+        cikan = [ad for ad in self.aygitlar if ad not in aygitlar]
+        self.aygitlar = aygitlar
+        if cikan:
+            self.cikarildi.emit(cikan)
+        if eklenen:
+            self.eklendi.emit(eklenen)
+
+    def yenile(self):
+        # sysfs değişmemiş olsa da bir sonraki turu beklemeden comports() çağrılır
+        self._zorla = True
+        self._uyandir.set()
+
+    def durdur(self):
+        self._calisiyor = False
+        self._uyandir.set()
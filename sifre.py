@@ -0,0 +1,72 @@
+import hashlib
+import hmac
+import os
+
+# Maliyet parametreleri; benchmarks/bench_sifre.py hedef giriş süresine göre seçim yapar.
+# scrypt bellek kullanımı 128 * r * n bayttır (varsayılanla 32 MB, ~120 ms).
+SCRYPT_AYARLARI = {"n": 2 ** 15, "r": 8, "p": 1}
+PBKDF2_TEKRAR = 600000  # scrypt bulunmayan OpenSSL derlemeleri için
+TUZ_UZUNLUGU = 16
+ANAHTAR_UZUNLUGU = 32
+
+SCRYPT_VAR = hasattr(hashlib, "scrypt")
+
+
+def _scrypt(sifre, tuz, n, r, p):
+    return hashlib.scrypt(sifre.encode(), salt=tuz, n=n, r=r, p=p,
+                          maxmem=2 * 128 * r * n, dklen=ANAHTAR_UZUNLUGU)
+
+
+def _pbkdf2(sifre, tuz, tekrar):
+    return hashlib.pbkdf2_hmac("sha256", sifre.encode(), tuz, tekrar, ANAHTAR_UZUNLUGU)
+
+
+def sifre_ozeti(sifre, ayarlar=None, tekrar=None):
+    """Tuzlu özet üretir: "scrypt$n$r$p$tuz$özet" ya da "pbkdf2$tekrar$tuz$özet" (hex)."""
+    tuz = os.urandom(TUZ_UZUNLUGU)
+    if SCRYPT_VAR and tekrar is None:
+        a = ayarlar or SCRYPT_AYARLARI
+        ozet = _scrypt(sifre, tuz, a["n"], a["r"], a["p"])
+        return f"scrypt${a['n']}${a['r']}${a['p']}${tuz.hex()}${ozet.hex()}"
+    tekrar = tekrar or PBKDF2_TEKRAR
+    return f"pbkdf2${tekrar}${tuz.hex()}${_pbkdf2(sifre, tuz, tekrar).hex()}"
+
+
+def ozet_mi(deger):
+    return isinstance(deger, str) and deger.startswith(("scrypt$", "pbkdf2$"))
+
+
+def sifre_dogrula(sifre, kayitli):
+    """Şifreyi kayıtlı özetle sabit zamanlı karşılaştırır."""
+    if not ozet_mi(kayitli):
+        return False
+    parcalar = kayitli.split("$")
+    try:
+        if parcalar[0] == "scrypt":
+            _, n, r, p, tuz, ozet = parcalar
+            hesaplanan = _scrypt(sifre, bytes.fromhex(tuz), int(n), int(r), int(p))
+        else:
+            _, tekrar, tuz, ozet = parcalar
+            hesaplanan = _pbkdf2(sifre, bytes.fromhex(tuz), int(tekrar))
+    except (ValueError, MemoryError):
+        return False
+    return hmac.compare_digest(hesaplanan, bytes.fromhex(ozet))
+
+
+def yenilenmeli(kayitli, ayarlar=None):
+    """Özet güncel maliyet ayarlarıyla üretilmemişse True (girişte yeniden özetlenir)."""
+    if not SCRYPT_VAR:
+        return not kayitli.startswith(f"pbkdf2${PBKDF2_TEKRAR}$")
+    a = ayarlar or SCRYPT_AYARLARI
+    return not kayitli.startswith(f"scrypt${a['n']}${a['r']}${a['p']}$")
+
+
+# kullanıcı yoksa da aynı süre harcansın, yanıt süresinden kullanıcı adı anlaşılmasın
+_SAHTE_OZET = None
+
+
+def sahte_dogrula(sifre):
+    global _SAHTE_OZET
+    if _SAHTE_OZET is None:
+        _SAHTE_OZET = sifre_ozeti("")
+    sifre_dogrula(sifre, _SAHTE_OZET)
@@ -0,0 +1,133 @@
+"""BMP280 sensör simülatörü.
+
+Arduino yerine bir pseudo-terminal'e (ya da verilen bir dosyaya/FIFO'ya)
+BMP280 çerçeveleri yazar. Uygulama simülatörün yazdırdığı pty yolunu seri
+port gibi açabilir.
+
+Kullanım: python simulator.py [--hiz 100] [--titreme 0.2] [--bozuk 0.01] [--bicim json|ikili]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+from protokol import cerceve_olustur
+
+
+class SensorSimulatoru(threading.Thread):
+    """Verilen hızda, titreşim ve bozulma oranıyla çerçeve üreten thread.
+
+    JSON çerçevelerine gönderim anının time.monotonic() değeri ("t") ve
+    sıra numarası ("seq") eklenir; aynı makinedeki alıcı uçtan uca gecikmeyi
+    bununla ölçebilir. Bozulan çerçevelerde rastgele bir bayt değiştirilir
+    ya da çerçeve yarıda kesilir.
+    """
+
+    def __init__(self, fd, hiz=100.0, titreme=0.0, bozuk=0.0, bicim="json", sure=None, tohum=None):
+        super().__init__(daemon=True)
+        self.fd = fd
+        self.hiz = hiz
+        self.titreme = titreme  # periyodun oranı olarak, 0.2 = ±%20
+        self.bozuk = bozuk
+        self.bicim = bicim
+        self.sure = sure
+        self.rastgele = random.Random(tohum)
+        self.gonderilen = 0
+        self.bozulan = 0
+        self._dur = threading.Event()
+
+    def durdur(self):
+        self._dur.set()
+
+    def cerceve(self, sira, zaman):
+        faz = sira / max(self.hiz, 1.0)
+        degerler = {
+            "sicaklik": 25.0 + 2.0 * math.sin(faz / 10),
+            "basinc": 1013.25 + 0.5 * math.cos(faz / 30),
+            "yukseklik": 100.0 + 5.0 * math.sin(faz / 20),
+        }
+        if self.bicim == "ikili":
+            veri = cerceve_olustur("BMP280", degerler, sensor_id=sira & 0xFF)
+        else:
+            degerler["t"] = zaman
+            degerler["seq"] = sira
+            veri = (json.dumps(degerler) + "\n").encode()
+        if self.bozuk and self.rastgele.random() < self.bozuk:
+            self.bozulan += 1
+            veri = bytearray(veri)
+            if self.rastgele.random() < 0.5:
+                veri[self.rastgele.randrange(len(veri))] = self.rastgele.randrange(256)
+            else:
+                veri = veri[:self.rastgele.randrange(1, len(veri))]
+            veri = bytes(veri)
+        return veri
+
+    def run(self):
+        periyot = 1.0 / self.hiz
+        baslangic = time.monotonic()
+        sonraki = baslangic
+        while not self._dur.is_set():
+            simdi = time.monotonic()
+            if self.sure is not None and simdi - baslangic >= self.sure:
+                break
+            # zamanı gelmiş tüm çerçeveler tek write ile gönderilir
+            paket = bytearray()
+            while sonraki <= simdi:
+                paket += self.cerceve(self.gonderilen, simdi)
+                self.gonderilen += 1
+                sonraki += periyot * (1 + self.rastgele.uniform(-self.titreme, self.titreme))
+            if paket:
+                try:
+                    os.write(self.fd, paket)
+                except OSError:
+                    break
+            time.sleep(max(0.0, min(sonraki - time.monotonic(), 0.01)))
+
+
+def pty_ac():
+    """(master_fd, slave_yolu) döndürür; slave ucu uygulamada port olarak açılır."""
+    import pty
+    import tty
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    return master, slave, os.ttyname(slave)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hiz", type=float, default=100, help="çerçeve/s")
+    parser.add_argument("--titreme", type=float, default=0.0, help="periyot titremesi, ör. 0.2 = ±%%20")
+    parser.add_argument("--bozuk", type=float, default=0.0, help="bozuk çerçeve oranı (0-1)")
+    parser.add_argument("--bicim", choices=("json", "ikili"), default="json")
+    parser.add_argument("--sure", type=float, default=None, help="saniye, verilmezse Ctrl+C'ye kadar")
+    parser.add_argument("--cikis", help="pty yerine yazılacak dosya/FIFO yolu")
+    parser.add_argument("--bekle", action="store_true",
+                        help="göndermeye stdin'den bir satır gelince başla (ölçüm betikleri için)")
+    args = parser.parse_args()
+
+    if args.cikis:
+        fd = os.open(args.cikis, os.O_WRONLY | os.O_CREAT)
+        print(f"Yazılıyor: {args.cikis}")
+    else:
+        fd, _, yol = pty_ac()
+        print(f"Simülatör portu: {yol}  (uygulamada bu portu ya da pipe://{yol} adresini seçin)", flush=True)
+    if args.bekle:
+        sys.stdin.readline()
+
+    simulator = SensorSimulatoru(fd, args.hiz, args.titreme, args.bozuk, args.bicim, args.sure)
+    simulator.start()
+    try:
+        while simulator.is_alive():
+            simulator.join(1.0)
+    except KeyboardInterrupt:
+        simulator.durdur()
+        simulator.join()
+    print(f"{simulator.gonderilen} çerçeve gönderildi, {simulator.bozulan} bozuk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import numpy as np
+
+from veritabani import SENSOR_ALANLARI, COZUNURLUKLER, tablo_adi, ozet_tablosu
+
+
+def cozunurluk_sec(sure, nokta):
+    """Aralığı en fazla nokta kovayla kaplayan en ince özet çözünürlüğü."""
+    for cozunurluk, _ in COZUNURLUKLER:
+        if sure / cozunurluk <= nokta:
+            return cozunurluk
+    return COZUNURLUKLER[-1][0]
+
+
+def sorgula(conn, sensor, oturum, bas, son, nokta=1000):
+    """Kayıtlı bir oturumun [bas, son] aralığını yaklaşık nokta noktayla döndürür.
+
+    Aralıktaki ham örnek sayısı nokta'yı aşmıyorsa ham satırlar, aşıyorsa
+    uygun çözünürlükteki (1 sn, 1 dk, 1 sa) min/max/ortalama özetleri
+    okunur. Aralık nokta saniyeden kısaysa 1 sn özetleri nokta'dan az kova
+    vereceğinden ham satırlar SQLite içinde nokta kovaya min/max
+    seyreltilir. Her durumda (oturum, zaman) ya da (oturum, kova)
+    indeksiyle yalnızca aralıktaki satırlar okunur.
+
+    Dönen sözlük: "cozunurluk" (kova genişliği, s; ham satırlar için 0),
+    "zaman", "adet" ve her alan için "{alan}_min", "{alan}_max",
+    "{alan}_ort" NumPy dizileri. Özet satırlarında zaman kovanın ortasıdır.
+    """
+    alanlar = SENSOR_ALANLARI[sensor]
+    cozunurluk = cozunurluk_sec(max(son - bas, 0.0), nokta)
+    if cozunurluk == COZUNURLUKLER[0][0]:
+        adet, = conn.execute(
+            f"SELECT SUM(adet) FROM {ozet_tablosu(sensor, cozunurluk)} "
+            f"WHERE oturum=? AND kova>=? AND kova<=?",
+            (oturum, int(bas // cozunurluk), int(son // cozunurluk))).fetchone()
+        if (adet or 0) <= nokta:
+            return _ham_sorgu(conn, sensor, oturum, bas, son)
+        return _seyreltilmis_sorgu(conn, sensor, oturum, bas, son, nokta)
+
+    satirlar = conn.execute(
+        f"SELECT kova, adet, {', '.join(f'{alan}_min, {alan}_max, {alan}_toplam, {alan}_adet' for alan in alanlar)} "
+        f"FROM {ozet_tablosu(sensor, cozunurluk)} WHERE oturum=? AND kova>=? AND kova<=? ORDER BY kova",
+        (oturum, int(bas // cozunurluk), int(son // cozunurluk))).fetchall()
+    return _ozet_sonucu(satirlar, alanlar, cozunurluk)
+
+
+def _seyreltilmis_sorgu(conn, sensor, oturum, bas, son, nokta):
+    # özet tablolarıyla aynı sütunlar, kovalar bas'tan itibaren (son - bas) / nokta genişliğinde
+    alanlar = SENSOR_ALANLARI[sensor]
+    genislik = max(son - bas, 1e-9) / nokta
+    toplamlar = ", ".join(f"MIN({alan}), MAX({alan}), SUM({alan}), COUNT({alan})" for alan in alanlar)
+    satirlar = conn.execute(
+        f"SELECT CAST((zaman - ?) / ? AS INTEGER) AS k, COUNT(*), {toplamlar} FROM {tablo_adi(sensor)} "
+        f"WHERE oturum=? AND zaman>=? AND zaman<=? GROUP BY k ORDER BY k",
+        (bas, genislik, oturum, bas, son)).fetchall()
+    return _ozet_sonucu(satirlar, alanlar, genislik, bas)
+
+
+def _ozet_sonucu(satirlar, alanlar, cozunurluk, t0=0.0):
+    dizi = np.array(satirlar, dtype=np.float64).reshape(len(satirlar), 2 + 4 * len(alanlar))
+    sonuc = {"cozunurluk": cozunurluk, "zaman": t0 + (dizi[:, 0] + 0.5) * cozunurluk, "adet": dizi[:, 1]}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i, alan in enumerate(alanlar):
+            en, ek, toplam, adet = dizi[:, 2 + 4 * i:6 + 4 * i].T
+            sonuc[f"{alan}_min"] = en
+            sonuc[f"{alan}_max"] = ek
+            sonuc[f"{alan}_ort"] = np.where(adet > 0, toplam / adet, np.nan)
+    return sonuc
+
+
+def _ham_sorgu(conn, sensor, oturum, bas, son):
+    alanlar = SENSOR_ALANLARI[sensor]
+    satirlar = conn.execute(
+        f"SELECT zaman, {', '.join(alanlar)} FROM {tablo_adi(sensor)} "
+        f"WHERE oturum=? AND zaman>=? AND zaman<=? ORDER BY zaman", (oturum, bas, son)).fetchall()
+    dizi = np.array(satirlar, dtype=np.float64).reshape(len(satirlar), 1 + len(alanlar))
+    sonuc = {"cozunurluk": 0, "zaman": dizi[:, 0], "adet": np.ones(len(dizi))}
+    for i, alan in enumerate(alanlar):
+        sonuc[f"{alan}_min"] = sonuc[f"{alan}_max"] = sonuc[f"{alan}_ort"] = dizi[:, 1 + i]
+    return sonuc
+
+
+def zarf(sonuc, alan):
+    """Sorgu sonucunu çizim için (x, y) min/max zarfına çevirir.
+
+    Her kova için önce min, sonra max noktası üretilir; ham satırlarda
+    değerler olduğu gibi döner.
+    """
+    if sonuc["cozunurluk"] == 0:
+        return sonuc["zaman"], sonuc[f"{alan}_ort"]
+    x = np.repeat(sonuc["zaman"], 2)
+    y = np.empty(len(x))
+    y[0::2] = sonuc[f"{alan}_min"]
+    y[1::2] = sonuc[f"{alan}_max"]
+    return x, y
@@ -0,0 +1,140 @@
+"""Arayüzsüz edinim sunucusu.
+
+Kullanım: python sunucu.py --port /dev/ttyUSB0 [--port tcp://host:port] [--profil Hızlı] [--kayit]
+
+Seri okuma, çözümleme ve istenirse kayıt, pencere açılmadan QCoreApplication
+olay döngüsünde çalışır. Çözülen örnekler Unix soketinden (varsayılan
+yayin.YAYIN_SOKETI) yayınlanır. Arayüz, port kutusuna unix:// adresi
+yazılarak ya da listedeki adres seçilerek istemci olarak bağlanır. Birden
+fazla istemci aynı anda bağlanabilir, yavaş bir istemci edinimi
+yavaşlatmaz; arayüzün kapanması ya da oturumun kapatılması veri toplamayı
+durdurmaz. Kopan ya da açılamayan portlar birkaç saniyede bir yeniden
+denenir. Ctrl+C ya da SIGTERM ile kapanır.
+"""
+import argparse
+import signal
+import sys
+import time
+from functools import partial
+
+from PyQt5.QtCore import QCoreApplication, QTimer
+
+from edinim import EdinimMerkezi
+from kayit import TelemetriKaydedici
+from seri_okuyucu import PROFILLER
+from yayin import YayinSunucusu, YAYIN_SOKETI, yayin_adresi
+
+
+def log(mesaj):
+    print(f"[{time.strftime('%H:%M:%S')}] {mesaj}", flush=True)
+
+
+class EdinimSunucusu:
+    """Verilen portları okuyup örnekleri yayınlayan (ve isteğe bağlı kaydeden) sunucu."""
+
+    def __init__(self, portlar, secenekler, soket=YAYIN_SOKETI, kayit=False, aciklama="",
+                 yeniden_ms=2000, maks_tampon=4 << 20):
+        self.portlar = list(portlar)
+        self.secenekler = secenekler  # port_ac argümanları
+        self.yeniden_ms = yeniden_ms
+        self.kapaniyor = False
+        self.yayinci = YayinSunucusu(soket, maks_tampon)
+        self.kaydedici = TelemetriKaydedici(aciklama=aciklama) if kayit else None
+        self.merkez = EdinimMerkezi()
+        self.merkez.ham_veri_ayarla(False)
+        self.merkez.baglandi.connect(lambda port: log(f"{port} bağlandı"))
+        self.merkez.hata.connect(lambda port, mesaj: log(f"{port}: {mesaj}"))
+        self.merkez.kapandi.connect(self.port_kapandi)
+        self.durum_timer = QTimer()
+        self.durum_timer.timeout.connect(self.durum_yaz)
+
+    def baslat(self, durum_aralik=10):
+        self.yayinci.start()
+        self.merkez.alici_ekle(self.yayinci.ekle)
+        if self.kaydedici is not None:
+            self.kaydedici.start()
+            self.merkez.alici_ekle(self.kaydedici.ekle)
+        for port in self.portlar:
+            self.merkez.port_ac(port, **self.secenekler)
+        log(f"Yayın adresi: {yayin_adresi(self.yayinci.yol)}")
+        if durum_aralik:
+            self.durum_timer.start(int(durum_aralik * 1000))
+
+    def port_kapandi(self, port):
+        if self.kapaniyor or port not in self.portlar:
+            return
+        log(f"{port} kapandı, {self.yeniden_ms / 1000:g} s sonra yeniden denenecek")
+        QTimer.singleShot(self.yeniden_ms, partial(self.yeniden_ac, port))
+
+    def yeniden_ac(self, port):
+        if not self.kapaniyor:
+            self.merkez.port_ac(port, **self.secenekler)
+
+    def durum_yaz(self):
+        for durum in self.merkez.durumlar.values():
+            log(durum.ozet())
+        log(f"Yayın: {len(self.yayinci.istemciler)} istemci, {self.yayinci.gonderilen} paket gönderildi, "
+            f"{self.yayinci.dusurulen} paket yavaş istemciler için atıldı"
+            + (f", {self.yayinci.atlanan} örnek paketlenemedi" if self.yayinci.atlanan else "")
+            + (f", hata: {self.yayinci.hata}" if self.yayinci.hata else ""))
+        if self.kaydedici is not None:
+            log(f"Kayıt: oturum {self.kaydedici.oturum_id}, {self.kaydedici.kaydedilen} örnek"
+                + (f", hata: {self.kaydedici.hata}" if self.kaydedici.hata else ""))
+
+    def durdur(self):
+        self.kapaniyor = True
+        self.durum_timer.stop()
+        self.merkez.hepsini_kapat(bekle=True)
+        if self.kaydedici is not None:
+            self.kaydedici.durdur(bekle=True)
+        self.yayinci.durdur(bekle=True)
+        self.durum_yaz()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", action="append", required=True,
+                        help="seri port ya da tcp://, udp://, pipe:// adresi (birden fazla verilebilir)")
+    parser.add_argument("--profil", choices=list(PROFILLER), default="Standart")
+    parser.add_argument("--baud", type=int, help="profildeki baud hızının yerine")
+    parser.add_argument("--timeout", type=float, help="profildeki zaman aşımının yerine (s)")
+    parser.add_argument("--tik", type=int, help="profildeki okuma aralığının yerine (ms)")
+    parser.add_argument("--satir", action="store_true", help="toplu okuma yerine satır satır oku")
+    parser.add_argument("--asenkron", action="store_true", help="seri portları da asyncio motoruyla oku")
+    parser.add_argument("--soket", default=YAYIN_SOKETI, help="yayın soketinin yolu")
+    parser.add_argument("--tampon", type=int, default=4096,
+                        help="istemci başına gönderim tamponu (KB); aşılınca en eski paketler atılır")
+    parser.add_argument("--kayit", action="store_true", help="örnekleri telemetri.db'ye de kaydet")
+    parser.add_argument("--aciklama", default="sunucu", help="kayıt oturumunun açıklaması")
+    parser.add_argument("--durum", type=float, default=10, help="durum satırlarının aralığı (s), 0 kapatır")
+    args = parser.parse_args()
+
+    profil = PROFILLER[args.profil]
+    secenekler = {
+        "baudrate": args.baud or profil["baudrate"],
+        "timeout": profil["timeout"] if args.timeout is None else args.timeout,
+        "tik_ms": profil["tik_ms"] if args.tik is None else args.tik,
+        "toplu_okuma": not args.satir,
+        "asenkron": args.asenkron,
+    }
+
+    app = QCoreApplication(sys.argv)
+    try:
+        sunucu = EdinimSunucusu(args.port, secenekler, args.soket, args.kayit, args.aciklama,
+                                maks_tampon=args.tampon * 1024)
+    except OSError as e:
+        log(f"Yayın soketi açılamadı: {e}")
+        return 1
+    for sinyal in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sinyal, lambda *_: app.quit())
+    # Qt döngüsü beklerken de Python sinyal işleyicileri çalışabilsin
+    uyanik = QTimer()
+    uyanik.timeout.connect(lambda: None)
+    uyanik.start(200)
+    app.aboutToQuit.connect(sunucu.durdur)
+    sunucu.baslat(args.durum)
+    return app.exec_()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
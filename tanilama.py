@@ -0,0 +1,170 @@
+import json
+import time
+
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QAbstractItemView, QFileDialog)
+from PyQt5.QtCore import QTimer, Qt
+
+from olcum import ARAYUZ_OLCUMU
+
+PORT_SUTUNLARI = ["Port", "Çerçeve/s", "Bayt/s", "Düşen", "Hatalı", "Okuma (ms)", "Çözme (ms)",
+                  "Yönlendirme (ms)", "Kuyruk (paket)", "Gecikme (ms)"]
+ARAYUZ_SUTUNLARI = ["Ölçüm", "Adet", "Ort. (ms)", "p50 (ms)", "p99 (ms)", "Maks (ms)"]
+ARAYUZ_ADLARI = {
+    "veri_oku": "Örnek gösterimi",
+    "kartlar": "Kart güncelleme",
+    "grafik_ekle": "Grafik tamponu",
+    "grafik_hazirlama": "Grafik hazırlama",
+    "grafik_boyama": "Grafik boyama",
+}
+
+TABLO_STILI = """
+    QTableWidget {
+        background-color: #2C3E50;
+        gridline-color: #34495E;
+        border: 2px solid #3498DB;
+        border-radius: 5px;
+        font-size: 13px;
+    }
+    QHeaderView::section {
+        background-color: #34495E;
+        color: #BDC3C7;
+        border: none;
+        padding: 4px;
+    }
+"""
+
+
+def anlik_goruntu(merkez):
+    """Edinim yolunun bütün ölçümleri; json.dump ile yazılabilir."""
+    return {"zaman": time.time(), "portlar": merkez.olcumler(), "arayuz": ARAYUZ_OLCUMU.sozluk()}
+
+
+def _ms(saniye, basamak=2):
+    return "—" if saniye is None else f"{saniye * 1000:.{basamak}f}"
+
+
+def _yuzdelikler(histogramlar, ad, cevir=_ms):
+    # "p50 / p99"; yüzdelikler kova üst sınırıdır
+    histogram = histogramlar.get(ad)
+    if not histogram or not histogram["adet"]:
+        return "—"
+    return f"{cevir(histogram['p50'])} / {cevir(histogram['p99'])}"
+
+
+def _tablo(sutunlar):
+    tablo = QTableWidget(0, len(sutunlar))
+    tablo.setHorizontalHeaderLabels(sutunlar)
+    tablo.verticalHeader().setVisible(False)
+    tablo.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    tablo.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    tablo.setSelectionMode(QAbstractItemView.NoSelection)
+    tablo.setStyleSheet(TABLO_STILI)
+    return tablo
+
+
+def _satirlari_yaz(tablo, satirlar):
+    tablo.setRowCount(len(satirlar))
+    for i, satir in enumerate(satirlar):
+        for j, deger in enumerate(satir):
+            hucre = tablo.item(i, j)
+            if hucre is None:
+                hucre = QTableWidgetItem()
+                hucre.setTextAlignment(Qt.AlignCenter if j else Qt.AlignLeft | Qt.AlignVCenter)
+                tablo.setItem(i, j, hucre)
+            hucre.setText(str(deger))
+
+
+class TanilamaSayfasi(QWidget):
+    """Edinim yolunun sayaç ve süre dağılımlarını gösteren tanılama sayfası.
+
+    Port başına: hızlar, düşen ve hatalı çerçeveler, okuyucu thread'indeki
+    okuma, çözme ve yönlendirme süreleri, GUI kuyruğunda bekleyen paket
+    sayısı ve örneğin okunmasından gösterilmesine kadarki gecikme (p50 /
+    p99). Altta GUI thread'indeki güncelleme süreleri. Ölçümler sayfa açık
+    olmasa da toplanır; tablo yalnızca sayfa görünürken saniyede bir
+    yenilenir. "JSON'a kaydet" bütün sayaçları ve histogram kovalarını yazar.
+    """
+
+    def __init__(self, merkez):
+        super().__init__()
+        self.merkez = merkez
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        ust_layout = QHBoxLayout()
+        baslik = QLabel("🩺 Tanılama")
+        baslik.setStyleSheet("QLabel { color: white; font-size: 24px; font-weight: bold; }")
+        self.sifirla_button = QPushButton("Sıfırla")
+        self.sifirla_button.clicked.connect(self.sifirla)
+        self.kaydet_button = QPushButton("💾 JSON'a kaydet")
+        self.kaydet_button.clicked.connect(self.kaydet)
+        ust_layout.addWidget(baslik)
+        ust_layout.addStretch()
+        ust_layout.addWidget(self.sifirla_button)
+        ust_layout.addWidget(self.kaydet_button)
+        layout.addLayout(ust_layout)
+
+        self.ozet_label = QLabel()
+        layout.addWidget(self.ozet_label)
+        self.port_tablosu = _tablo(PORT_SUTUNLARI)
+        layout.addWidget(self.port_tablosu, 1)
+        layout.addWidget(QLabel("Arayüz thread'i"))
+        self.arayuz_tablosu = _tablo(ARAYUZ_SUTUNLARI)
+        layout.addWidget(self.arayuz_tablosu, 1)
+        self.durum_label = QLabel()
+        self.durum_label.setStyleSheet("QLabel { color: #BDC3C7; font-size: 12px; }")
+        layout.addWidget(self.durum_label)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.yenile)
+        self.timer.start(1000)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.yenile()
+
+    def yenile(self):
+        if not self.isVisible():
+            return
+        satirlar = []
+        for port, olcum in self.merkez.olcumler().items():
+            okuyucu = olcum["okuyucu"] or {"sayaclar": {}, "histogramlar": {}}
+            sayaclar, histogramlar = okuyucu["sayaclar"], okuyucu["histogramlar"]
+            arayuz = olcum["arayuz"]["histogramlar"]
+            kuyruk = arayuz.get("kuyruk")
+            satirlar.append([
+                port, f"{olcum['cerceve_hizi']:.0f}", f"{olcum['bayt_hizi']:.0f}",
+                sayaclar.get("dusen", 0), sayaclar.get("hatali", 0),
+                _yuzdelikler(histogramlar, "okuma"), _yuzdelikler(histogramlar, "cozme"),
+                _yuzdelikler(histogramlar, "yonlendirme"),
+                f"{kuyruk['p99']:g} / {kuyruk['maks']:g}" if kuyruk else "—",
+                _yuzdelikler(arayuz, "gecikme", lambda s: _ms(s, 1)),
+            ])
+        _satirlari_yaz(self.port_tablosu, satirlar)
+
+        satirlar = []
+        for ad, histogram in sorted(ARAYUZ_OLCUMU.sozluk()["histogramlar"].items()):
+            satirlar.append([ARAYUZ_ADLARI.get(ad, ad), histogram["adet"], _ms(histogram["ort"], 3),
+                             _ms(histogram["p50"], 3), _ms(histogram["p99"], 3), _ms(histogram["maks"], 3)])
+        _satirlari_yaz(self.arayuz_tablosu, satirlar)
+        self.ozet_label.setText(f"Portlar (son {time.monotonic() - ARAYUZ_OLCUMU.baslangic:.0f} s, "
+                                "süreler p50 / p99; yüzdelikler logaritmik kovaların üst sınırıdır)")
+
+    def sifirla(self):
+        self.merkez.olcumleri_sifirla()
+        ARAYUZ_OLCUMU.sifirla()
+        self.yenile()
+
+    def kaydet(self):
+        dosya, _ = QFileDialog.getSaveFileName(
+            self, "Tanılama verisini kaydet", time.strftime("tanilama_%Y%m%d_%H%M%S.json"), "JSON (*.json)")
+        if not dosya:
+            return
+        try:
+            with open(dosya, "w", encoding="utf-8") as f:
+                json.dump(anlik_goruntu(self.merkez), f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            self.durum_label.setText(f"Kaydedilemedi: {e}")
+            return
+        self.durum_label.setText(f"{dosya} dosyasına kaydedildi")
@@ -0,0 +1,271 @@
+import asyncio
+import os
+import sys
+import time
+
+import serial
+
+from seri_okuyucu import SeriOkuyucu
+from yayin import YAYIN_ONEKI, YayinCozucu
+
+
+async def okunabilir(fd):
+    """Dosya tanıtıcısı okunabilir olana kadar olay döngüsünde bekler."""
+    dongu = asyncio.get_running_loop()
+    hazir = dongu.create_future()
+    dongu.add_reader(fd, lambda: hazir.done() or hazir.set_result(None))
+    try:
+        await hazir
+    finally:
+        dongu.remove_reader(fd)
+
+
+class Tasima:
+    """Bağlan / oku / kapat arayüzü.
+
+    oku() en az bir bayt gelene kadar bekler ve o an mevcut olan tüm
+    veriyi döndürür; b'' bağlantının karşı taraftan kapandığını belirtir.
+    """
+    ad = ""
+
+    async def ac(self):
+        raise NotImplementedError
+
+    async def oku(self):
+        raise NotImplementedError
+
+    def kapat(self):
+        raise NotImplementedError
+
+
+class SeriTasima(Tasima):
+    def __init__(self, port, baudrate=9600, timeout=0.1):
+        self.ad = port
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.seri = None
+        self._fd = None
+
+    async def ac(self):
+        if sys.platform == "win32":
+            # Windows'ta seri port için fd yok, okuma executor'da bloklanarak yapılır
+            self.seri = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+        else:
+            self.seri = serial.Serial(self.port, self.baudrate, timeout=0)
+            self._fd = self.seri.fileno()
+
+    async def oku(self):
+        if self._fd is None:
+            dongu = asyncio.get_running_loop()
+            return await dongu.run_in_executor(None, self._bloklu_oku)
+        while True:
+            veri = self.seri.read(self.seri.in_waiting or 1)  # timeout=0: beklemez
+            if veri:
+                return veri
+            await okunabilir(self._fd)
+
+    def _bloklu_oku(self):
+        while True:
+            ilk = self.seri.read(1)  # en fazla timeout kadar bekler
+            if ilk:
+                return ilk + self.seri.read(self.seri.in_waiting)
+
+    def kapat(self):
+        if self.seri is not None:
+            self.seri.close()
+            self.seri = None
+
+
+class DosyaTasima(Tasima):
+    """Yerel FIFO ya da pty; bench simülatörü Arduino yerine buraya yazar."""
+
+    def __init__(self, yol):
+        self.ad = f"pipe://{yol}"
+        self.yol = yol
+        self._fd = None
+
+    async def ac(self):
+        self._fd = os.open(self.yol, os.O_RDONLY | os.O_NONBLOCK | getattr(os, "O_NOCTTY", 0))
+        if os.isatty(self._fd):
+            import tty
+            tty.setraw(self._fd)  # satır düzenleme ve yankı kapalı, baytlar olduğu gibi gelsin
+
+    async def oku(self):
+        while True:
+            try:
+                veri = os.read(self._fd, 65536)
+            except BlockingIOError:
+                await okunabilir(self._fd)
+                continue
+            if veri or not os.isatty(self._fd):
+                return veri
+            await okunabilir(self._fd)
+
+    def kapat(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class TcpTasima(Tasima):
+    def __init__(self, host, port):
+        self.ad = f"tcp://{host}:{port}"
+        self.host = host
+        self.port = port
+        self._okuyucu = None
+        self._yazici = None
+
+    async def ac(self):
+        self._okuyucu, self._yazici = await asyncio.open_connection(self.host, self.port)
+
+    async def oku(self):
+        return await self._okuyucu.read(65536)
+
+    def kapat(self):
+        if self._yazici is not None:
+            self._yazici.close()
+            self._yazici = None
+
+
+class UnixTasima(Tasima):
+    def __init__(self, yol):
+        self.ad = f"{YAYIN_ONEKI}{yol}"
+        self.yol = yol
+        self._okuyucu = None
+        self._yazici = None
+
+    async def ac(self):
+        self._okuyucu, self._yazici = await asyncio.open_unix_connection(self.yol)
+
+    async def oku(self):
+        return await self._okuyucu.read(65536)
+
+    def kapat(self):
+        if self._yazici is not None:
+            self._yazici.close()
+            self._yazici = None
+
+
+class _UdpProtokolu(asyncio.DatagramProtocol):
+    def __init__(self, kuyruk):
+        self.kuyruk = kuyruk
+
+    def datagram_received(self, veri, adres):
+        self.kuyruk.put_nowait(veri)
+
+
+class UdpTasima(Tasima):
+    def __init__(self, host, port):
+        self.ad = f"udp://{host}:{port}"
+        self.host = host
+        self.port = port
+        self._kuyruk = None
+        self._tasiyici = None
+
+    async def ac(self):
+        self._kuyruk = asyncio.Queue()
+        dongu = asyncio.get_running_loop()
+        self._tasiyici, _ = await dongu.create_datagram_endpoint(
+            lambda: _UdpProtokolu(self._kuyruk), local_addr=(self.host, self.port))
+
+    async def oku(self):
+        veri = await self._kuyruk.get()
+        # aynı anda gelmiş diğer datagramlar da tek pakette işlensin
+        while not self._kuyruk.empty():
+            veri += self._kuyruk.get_nowait()
+        return veri
+
+    def kapat(self):
+        if self._tasiyici is not None:
+            self._tasiyici.close()
+            self._tasiyici = None
+
+
+def _host_port(adres):
+    host, ayrac, port = adres.rpartition(":")
+    if not ayrac or not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Adres host:port biçiminde olmalı: {adres!r}")
+    return host or "0.0.0.0", int(port)
+
+
+def tasima_olustur(adres, baudrate=9600, timeout=0.1):
+    """Adres biçimine göre uygun taşımayı döndürür; önek yoksa seri port kabul edilir."""
+    if adres.startswith("tcp://"):
+        return TcpTasima(*_host_port(adres[len("tcp://"):]))
+    if adres.startswith("udp://"):
+        return UdpTasima(*_host_port(adres[len("udp://"):]))
+    if adres.startswith("pipe://"):
+        return DosyaTasima(adres[len("pipe://"):])
+    if adres.startswith(YAYIN_ONEKI):
+        return UnixTasima(adres[len(YAYIN_ONEKI):])
+    return SeriTasima(adres, baudrate, timeout)
+
+
+class AsyncOkuyucu(SeriOkuyucu):
+    """Taşıma katmanını kendi thread'indeki asyncio döngüsüyle okuyan okuyucu.
+
+    SeriOkuyucu ile aynı sinyalleri ve çözümleme yolunu kullanır, yalnızca
+    okuma bir zamanlayıcı yerine olaylarla (fd okunabilir, soket verisi)
+    uyanır. tik_ms > 0 ise her paketten sonra o kadar beklenir, böylece
+    çok sık gelen küçük paketler tek sinyalde toplanır.
+    """
+
+    def __init__(self, adres, baudrate=9600, timeout=0.1, toplu_okuma=True,
+                 tik_ms=0, maks_cerceve=500, parent=None):
+        super().__init__(adres, baudrate, timeout, toplu_okuma, tik_ms, maks_cerceve, parent)
+        self.tasima = tasima_olustur(adres, baudrate, timeout)
+        if adres.startswith(YAYIN_ONEKI):
+            self.cozucu = YayinCozucu()  # örnekler sunucunun zaman damgasıyla gelir
+        self._dongu = None
+        self._gorev = None
+
+    def run(self):
+        try:
+            asyncio.run(self._calis())
+        except Exception as e:
+            self.hata.emit(f"Veri okuma hatası: {str(e)}")
+
+    async def _calis(self):
+        self._dongu = asyncio.get_running_loop()
+        self._gorev = asyncio.current_task()
+        if not self._calisiyor:
+            return
+        try:
+            await self.tasima.ac()
+        except asyncio.CancelledError:
+            self.tasima.kapat()
+            return
+        except (OSError, ValueError, serial.SerialException) as e:
+            self.tasima.kapat()
+            self.hata.emit(f"Bağlantı hatası: {str(e)}")
+            return
+
+        self._hiz_zaman = time.monotonic()
+        self.baglandi.emit(self.port)
+        hiz_gorevi = asyncio.ensure_future(self._hiz_bildir())
+        try:
+            while self._calisiyor:
+                veri = await self.tasima.oku()
+                if not veri:
+                    self.hata.emit("Bağlantı karşı taraftan kapatıldı")
+                    break
+                self._paket_isle(veri)
+                if self.tik_ms:
+                    await asyncio.sleep(self.tik_ms / 1000)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            hiz_gorevi.cancel()
+            self.tasima.kapat()
+
+    async def _hiz_bildir(self):
+        # veri gelmezken de hız saniyede bir sıfır olarak bildirilsin
+        while True:
+            await asyncio.sleep(1.0)
+            self._hiz_kaydet(0, 0)
+
+    def durdur(self):
+        self._calisiyor = False
+        if self._dongu is not None and self._gorev is not None:
+            self._dongu.call_soon_threadsafe(self._gorev.cancel)
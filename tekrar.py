@@ -0,0 +1,151 @@
+import heapq
+import math
+import sqlite3
+import time
+from urllib.parse import urlsplit, parse_qs
+
+from PyQt5.QtCore import pyqtSignal
+
+from veritabani import KAYIT_DOSYASI, SENSOR_ALANLARI, tablo_adi, oturum_araligi
+from seri_okuyucu import SeriOkuyucu
+
+KAYIT_ONEKI = "kayit://"
+
+
+def kayit_adresi(dosya=KAYIT_DOSYASI, oturum=None, hiz=1.0):
+    adres = f"{KAYIT_ONEKI}{dosya}?hiz={hiz:g}"
+    if oturum is not None:
+        adres += f"&oturum={oturum}"
+    return adres
+
+
+class TekrarOynatici(SeriOkuyucu):
+    """Kaydedilmiş bir oturumu canlı veriyle aynı yoldan yeniden oynatır.
+
+    Adres biçimi: kayit://telemetri.db?oturum=3&hiz=10 (hiz=0 olabildiğince
+    hızlı, oturum verilmezse en son oturum). Her sensör tablosu
+    (oturum, zaman) indeksi üzerinden istenen konumdan itibaren tembel bir
+    imleçle okunur ve zamana göre birleştirilir; dosyanın tamamı hiçbir
+    zaman belleğe alınmaz. Satırlardan canlı çözücünün ürettiği biçimde
+    örnekler kurulur ve merkeze aynı yoldan gönderilir, böylece işleme →
+    gösterim → grafik yolu canlı veriyle aynıdır. Değerler kayıttaki REAL
+    (double) değerlerin kendisidir; ikili çerçevenin float32 alanlarına
+    çevrilmez. Örneklerin zamanı kayıttaki özgün zamandır.
+    """
+    konum_degisti = pyqtSignal(float, float)  # oturum başından itibaren konum, toplam süre (s)
+
+    def __init__(self, adres, tik_ms=20, maks_cerceve=5000, parent=None, **_):
+        super().__init__(adres, tik_ms=tik_ms, maks_cerceve=maks_cerceve, parent=parent)
+        parca = urlsplit(adres)
+        sorgu = parse_qs(parca.query)
+        self.dosya = (parca.netloc + parca.path) or KAYIT_DOSYASI
+        self.oturum = None
+        self.hiz = 1.0
+        self._adres_hatasi = None  # hata sinyali henüz bağlı değil, run'da bildirilir
+        try:
+            if "oturum" in sorgu:
+                self.oturum = int(sorgu["oturum"][0])
+            self.hiz = float(sorgu.get("hiz", ["1"])[0])
+            if not 0 <= self.hiz < math.inf:
+                raise ValueError(f"hiz sıfır ya da pozitif sonlu bir sayı olmalı, {self.hiz} verildi")
+        except ValueError as e:
+            self.hiz = 1.0
+            self._adres_hatasi = f"Geçersiz kayıt adresi {adres}: {str(e)}"
+        self._hedef_konum = None
+        self._konum_bildirim = 0.0
+
+    def hiz_ayarla(self, hiz):
+        self.hiz = hiz
+        self._hedef_konum = self._hedef_konum if self._hedef_konum is not None else -1.0
+
+    def konum_ayarla(self, saniye):
+        # herhangi bir thread'den çağrılabilir, okuma döngüsü bir sonraki tikte uygular
+        self._hedef_konum = saniye
+
+    def run(self):
+        if self._adres_hatasi is not None:
+            self.hata.emit(self._adres_hatasi)
+            return
+        try:
+            conn = sqlite3.connect(f"file:{self.dosya}?mode=ro", uri=True)
+        except sqlite3.Error as e:
+            self.hata.emit(f"Bağlantı hatası: {str(e)}")
+            return
+        try:
+            if self.oturum is None:
+                satir = conn.execute("SELECT MAX(id) FROM oturumlar").fetchone()
+                self.oturum = satir[0] if satir else None
+            bas, son = oturum_araligi(conn, self.oturum) if self.oturum is not None else (None, None)
+            if bas is None:
+                self.hata.emit(f"Bağlantı hatası: {self.dosya} içinde oynatılacak oturum yok")
+                return
+            self._hiz_zaman = time.monotonic()
+            self.baglandi.emit(self.port)
+            self._oynat(conn, bas, son)
+        except sqlite3.Error as e:
+            self.hata.emit(f"Veri okuma hatası: {str(e)}")
+        finally:
+            conn.close()
+
+    def _akis(self, conn, konum):
+        akislar = []
+        for sensor, alanlar in SENSOR_ALANLARI.items():
+            imlec = conn.execute(
+                f"SELECT zaman, sensor_id, {', '.join(alanlar)} FROM {tablo_adi(sensor)} "
+                f"WHERE oturum=? AND zaman>=? ORDER BY zaman", (self.oturum, konum))
+            akislar.append(self._etiketle(sensor, imlec))
+        return heapq.merge(*akislar, key=lambda kayit: kayit[0])
+
+    @staticmethod
+    def _etiketle(sensor, imlec):
+        for satir in imlec:
+            yield satir[0], sensor, satir
+
+    def _oynat(self, conn, bas, son):
+        konum = bas
+        akis = self._akis(conn, konum)
+        siradaki = next(akis, None)
+        duvar0, kayit0 = time.monotonic(), konum
+        while self._calisiyor and siradaki is not None:
+            if self._hedef_konum is not None:
+                hedef, self._hedef_konum = self._hedef_konum, None
+                if hedef >= 0:  # -1: yalnızca hız değişti, saat yeniden kurulur
+                    konum = bas + hedef
+                    akis = self._akis(conn, konum)
+                    siradaki = next(akis, None)
+                    if siradaki is None:
+                        break
+                duvar0, kayit0 = time.monotonic(), konum
+
+            sinir = kayit0 + (time.monotonic() - duvar0) * self.hiz if self.hiz > 0 else math.inf
+            paket = []
+            while siradaki is not None and siradaki[0] <= sinir and len(paket) < self.maks_cerceve:
+                paket.append(siradaki)
+                siradaki = next(akis, None)
+            if paket:
+                konum = paket[-1][0]
+                self._paket_gonder(paket)
+            self._konum_bildir(konum - bas, son - bas)
+            if self.hiz > 0:
+                self.msleep(self.tik_ms)
+        self._konum_bildir(konum - bas, son - bas, zorla=True)
+
+    def _paket_gonder(self, paket):
+        ornekler = []
+        for zaman, sensor, satir in paket:
+            ornek = {alan: math.nan if deger is None else deger
+                     for alan, deger in zip(SENSOR_ALANLARI[sensor], satir[2:])}
+            ornek["sensor"] = sensor
+            ornek["sensor_id"] = satir[1] or 0
+            ornek["zaman"] = zaman
+            ornekler.append(ornek)
+        self.olcum.say("cerceve", len(ornekler))
+        self._ornekleri_gonder(ornekler)
+        self.tik_istatistik.emit(len(ornekler), 0)
+        self._hiz_kaydet(0, len(ornekler))  # hatta bayt yok, yalnızca örnek hızı bildirilir
+
+    def _konum_bildir(self, konum, sure, zorla=False):
+        simdi = time.monotonic()
+        if zorla or simdi - self._konum_bildirim >= 0.2:
+            self._konum_bildirim = simdi
+            self.konum_degisti.emit(konum, sure)
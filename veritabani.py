@@ -0,0 +1,287 @@
+import queue
+import sqlite3
+import sys
+import threading
+import traceback
+from concurrent.futures import Future
+from functools import partial
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from protokol import MESAJ_TIPLERI
+from sifre import sifre_ozeti, sifre_dogrula, ozet_mi, yenilenmeli, sahte_dogrula
+
+KULLANICI_DOSYASI = 'users.db'
+KAYIT_DOSYASI = 'telemetri.db'
+
+
+def baglan(dosya, gocler=()):
+    """WAL modunda bağlantı açar ve eksik şema göçlerini uygular.
+
+    Göçler sırayla numaralıdır; uygulanan son göç PRAGMA user_version'da
+    saklanır, böylece her açılışta yalnızca yenileri çalışır. Aynı SQL
+    metinleri sqlite3'ün hazır ifade önbelleğinden yeniden kullanılır.
+    """
+    conn = sqlite3.connect(dosya, cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL'de her commit'te fsync gerekmez
+    surum = conn.execute("PRAGMA user_version").fetchone()[0]
+    for yeni_surum, goc in enumerate(gocler[surum:], surum + 1):
+        with conn:
+            goc(conn)
+            conn.execute(f"PRAGMA user_version={yeni_surum}")
+    return conn
+
+
+class Veritabani(QObject):
+    """Bir SQLite dosyasına tek ve kalıcı bağlantı tutan veritabanı thread'i.
+
+    İşler gonder(islev, *argumanlar, geri=...) ile kuyruğa atılır ve bu
+    thread'de aynı bağlantı üzerinde sırayla islev(conn, *argumanlar)
+    olarak çalışır. Sonuç geri çağrısı (ya da istisna hata çağrısı) Qt
+    sinyaliyle nesnenin sahibi olan thread'de, yani GUI thread'inde
+    çağrılır; GUI hiçbir zaman diski beklemez.
+    """
+    _bitti = pyqtSignal(object)
+
+    def __init__(self, dosya, gocler=(), parent=None):
+        super().__init__(parent)
+        self.dosya = dosya
+        self.gocler = gocler
+        self.kuyruk = queue.SimpleQueue()
+        self._bitti.connect(self._geri_cagir)
+        self._thread = threading.Thread(target=self._calis, daemon=True)
+        self._thread.start()
+
+    def gonder(self, islev, *argumanlar, geri=None, hata=None):
+        self.kuyruk.put((islev, argumanlar, geri, hata, None))
+
+    def bekle(self, islev, *argumanlar):
+        """İşi çalıştırıp sonucunu bekler; GUI thread'inden çağrılmamalıdır."""
+        sonuc = Future()
+        self.kuyruk.put((islev, argumanlar, None, None, sonuc))
+        return sonuc.result()
+
+    def kapat(self, bekle=True):
+        self.kuyruk.put(None)
+        if bekle:
+            self._thread.join()
+
+    def _calis(self):
+        try:
+            conn = baglan(self.dosya, self.gocler)
+            baglanti_hatasi = None
+        except sqlite3.Error as e:
+            conn, baglanti_hatasi = None, e
+        while True:
+            is_ = self.kuyruk.get()
+            if is_ is None:
+                break
+            islev, argumanlar, geri, hata_geri, sonuc = is_
+            try:
+                if conn is None:
+                    raise baglanti_hatasi
+                deger, hata = islev(conn, *argumanlar), None
+            except Exception as e:
+                if conn is not None and conn.in_transaction:
+                    conn.rollback()
+                deger, hata = None, e
+            if sonuc is not None:
+                if hata is None:
+                    sonuc.set_result(deger)
+                else:
+                    sonuc.set_exception(hata)
+            elif hata is not None:
+                self._bitti.emit(partial(hata_geri, hata) if hata_geri else partial(_hata_yaz, hata))
+            elif geri is not None:
+                self._bitti.emit(partial(geri, deger))
+        if conn is not None:
+            conn.close()
+
+    def _geri_cagir(self, cagri):
+        cagri()
+
+
+def _hata_yaz(hata):
+    traceback.print_exception(type(hata), hata, hata.__traceback__, file=sys.stderr)
+
+
+_ortak = {}
+
+
+def veritabani(dosya, gocler):
+    """Dosya başına tek bir Veritabani döndürür (ilk çağrıda GUI thread'inde oluşturulmalıdır)."""
+    if dosya not in _ortak:
+        _ortak[dosya] = Veritabani(dosya, gocler)
+    return _ortak[dosya]
+
+
+def kullanici_veritabani():
+    return veritabani(KULLANICI_DOSYASI, KULLANICI_GOCLERI)
+
+
+def telemetri_veritabani(dosya=KAYIT_DOSYASI):
+    return veritabani(dosya, TELEMETRI_GOCLERI)
+
+
+def hepsini_kapat():
+    for vt in _ortak.values():
+        vt.kapat()
+    _ortak.clear()
+
+
+# Kullanıcılar
+
+def _kullanici_v1(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS users
+                    (username TEXT PRIMARY KEY, password TEXT, remember_me INTEGER)''')
+
+
+def _kullanici_v2(conn):
+    # düz metin şifreler yerinde tuzlu özetle değiştirilir
+    for ad, sifre in conn.execute("SELECT username, password FROM users").fetchall():
+        if sifre is not None and not ozet_mi(sifre):
+            conn.execute("UPDATE users SET password=? WHERE username=?", (sifre_ozeti(sifre), ad))
+
+
+KULLANICI_GOCLERI = [_kullanici_v1, _kullanici_v2]
+
+
+def kullanici_dogrula(conn, ad, sifre, hatirla=False):
+    # özetleme veritabanı thread'inde yapılır, giriş penceresi beklemez
+    satir = conn.execute("SELECT password FROM users WHERE username=?", (ad,)).fetchone()
+    if satir is None:
+        sahte_dogrula(sifre)
+        return False
+    if not sifre_dogrula(sifre, satir[0]):
+        return False
+    with conn:
+        if yenilenmeli(satir[0]):  # maliyet ayarları değiştiyse
+            conn.execute("UPDATE users SET password=? WHERE username=?", (sifre_ozeti(sifre), ad))
+        if hatirla:
+            conn.execute("UPDATE users SET remember_me=0 WHERE remember_me=1")  # önce tümünü sıfırla
+            conn.execute("UPDATE users SET remember_me=1 WHERE username=?", (ad,))
+    return True
+
+
+def kullanici_ekle(conn, ad, sifre):
+    if conn.execute("SELECT 1 FROM users WHERE username=?", (ad,)).fetchone() is not None:
+        return False  # boşuna özetleme yapılmasın
+    try:
+        with conn:
+            conn.execute("INSERT INTO users (username, password, remember_me) VALUES (?, ?, 0)",
+                         (ad, sifre_ozeti(sifre)))
+    except sqlite3.IntegrityError:
+        return False
+    return True
+
+
+def hatirlanan_kullanici(conn):
+    satir = conn.execute("SELECT username FROM users WHERE remember_me=1").fetchone()
+    return satir[0] if satir else None
+
+
+def hatirlamayi_kaldir(conn):
+    with conn:
+        conn.execute("UPDATE users SET remember_me=0 WHERE remember_me=1")
+
+
+# Telemetri
+
+def tablo_adi(sensor):
+    # "NEO-M8N" -> "neo_m8n", "Strain Gage" -> "strain_gage"
+    return sensor.lower().replace('-', '_').replace(' ', '_')
+
+
+SENSOR_ALANLARI = {sensor: alanlar for sensor, alanlar in MESAJ_TIPLERI.values()}
+
+# özet çözünürlükleri (s) ve tablo ekleri; her seviye bir öncekinden hesaplanır
+COZUNURLUKLER = [(1, "1sn"), (60, "1dk"), (3600, "1sa")]
+
+
+def ozet_tablosu(sensor, cozunurluk):
+    return f"{tablo_adi(sensor)}_{dict(COZUNURLUKLER)[cozunurluk]}"
+
+
+def _telemetri_v1(conn):
+    conn.execute('''CREATE TABLE IF NOT EXISTS oturumlar
+                    (id INTEGER PRIMARY KEY, baslangic REAL, bitis REAL,
+                     baslangic_monotonic REAL, aciklama TEXT)''')
+    for sensor, alanlar in SENSOR_ALANLARI.items():
+        tablo = tablo_adi(sensor)
+        sutunlar = ", ".join(f"{alan} REAL" for alan in alanlar)
+        conn.execute(f'''CREATE TABLE IF NOT EXISTS {tablo}
+                         (oturum INTEGER, zaman REAL, sensor_id INTEGER, {sutunlar})''')
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {tablo}_zaman ON {tablo} (oturum, zaman)")
+
+
+def _telemetri_v2(conn):
+    # özet tabloları; önceden kaydedilmiş oturumların özetleri de üretilir
+    for sensor, alanlar in SENSOR_ALANLARI.items():
+        sutunlar = ", ".join(f"{alan}_min REAL, {alan}_max REAL, {alan}_toplam REAL, {alan}_adet INTEGER"
+                             for alan in alanlar)
+        for cozunurluk, _ in COZUNURLUKLER:
+            conn.execute(f'''CREATE TABLE IF NOT EXISTS {ozet_tablosu(sensor, cozunurluk)}
+                             (oturum INTEGER, kova INTEGER, adet INTEGER, {sutunlar},
+                              PRIMARY KEY (oturum, kova))''')
+        for oturum, bas, son in conn.execute(
+                f"SELECT oturum, MIN(zaman), MAX(zaman) FROM {tablo_adi(sensor)} GROUP BY oturum").fetchall():
+            ozetleri_guncelle(conn, sensor, oturum, bas, son)
+
+
+TELEMETRI_GOCLERI = [_telemetri_v1, _telemetri_v2]
+
+
+def ozetleri_guncelle(conn, sensor, oturum, bas, son):
+    """[bas, son] aralığına dokunan özet kovalarını yeniden hesaplar.
+
+    1 sn kovaları ham satırlardan, 1 dk kovaları 1 sn kovalarından, 1 sa
+    kovaları 1 dk kovalarından toplanır; böylece her seviyede en fazla
+    birkaç kova kadar satır okunur.
+    """
+    alanlar = SENSOR_ALANLARI[sensor]
+    sutunlar = ", ".join(f"{alan}_min, {alan}_max, {alan}_toplam, {alan}_adet" for alan in alanlar)
+    kaynak, kaynak_cozunurluk = tablo_adi(sensor), None
+    for cozunurluk, _ in COZUNURLUKLER:
+        ilk, son_kova = int(bas // cozunurluk), int(son // cozunurluk)
+        if kaynak_cozunurluk is None:
+            kova, sutun = f"CAST(zaman / {cozunurluk} AS INTEGER)", "zaman"
+            aralik = (ilk * cozunurluk, (son_kova + 1) * cozunurluk)
+            adet = "COUNT(*)"
+            toplamlar = ", ".join(f"MIN({alan}), MAX({alan}), SUM({alan}), COUNT({alan})" for alan in alanlar)
+        else:
+            oran = cozunurluk // kaynak_cozunurluk
+            kova, sutun = f"kova / {oran}", "kova"
+            aralik = (ilk * oran, (son_kova + 1) * oran)
+            adet = "SUM(adet)"
+            toplamlar = ", ".join(f"MIN({alan}_min), MAX({alan}_max), SUM({alan}_toplam), SUM({alan}_adet)"
+                                  for alan in alanlar)
+        hedef = ozet_tablosu(sensor, cozunurluk)
+        conn.execute(f"INSERT OR REPLACE INTO {hedef} (oturum, kova, adet, {sutunlar}) "
+                     f"SELECT oturum, {kova} AS k, {adet}, {toplamlar} FROM {kaynak} "
+                     f"WHERE oturum=? AND {sutun}>=? AND {sutun}<? GROUP BY k",
+                     (oturum,) + aralik)
+        kaynak, kaynak_cozunurluk = hedef, cozunurluk
+
+
+def oturum_araligi(conn, oturum, sensorler=SENSOR_ALANLARI):
+    """Oturumdaki ilk ve son örneğin zamanını (oturum, zaman) indeksiyle bulur."""
+    bas, son = None, None
+    for sensor in sensorler:
+        en, ek = conn.execute(f"SELECT MIN(zaman), MAX(zaman) FROM {tablo_adi(sensor)} WHERE oturum=?",
+                              (oturum,)).fetchone()
+        if en is not None:
+            bas = en if bas is None else min(bas, en)
+            son = ek if son is None else max(son, ek)
+    return bas, son
+
+
+def oturumlari_listele(conn):
+    """[(id, başlangıç zamanı, açıklama, süre)] listesini yeniden eskiye döndürür."""
+    oturumlar = []
+    for oturum, baslangic, aciklama in conn.execute(
+            "SELECT id, baslangic, aciklama FROM oturumlar ORDER BY id DESC").fetchall():
+        bas, son = oturum_araligi(conn, oturum)
+        if bas is not None:
+            oturumlar.append((oturum, baslangic, aciklama, son - bas))
+    return oturumlar
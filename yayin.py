@@ -0,0 +1,316 @@
+import collections
+import itertools
+import math
+import os
+import queue
+import selectors
+import socket
+import struct
+import tempfile
+import threading
+
+from protokol import MESAJ_TIPLERI, SENSOR_TIPLERI
+
+YAYIN_ONEKI = "unix://"
+YAYIN_SOKETI = os.path.join(tempfile.gettempdir(), "yer_istasyonu.sock")
+
+# Yayın akışı yerel ve güvenilir olduğundan sync/CRC yerine uzunluk önekli paketler kullanılır:
+#   paket : <I gövde uzunluğu> <B port uzunluğu> port (UTF-8) kayıt...
+#   kayıt : <d zaman> <B tip> <B sensor_id> tipin alanları (float32, protokol.MESAJ_TIPLERI sırasıyla)
+# Bir paket bir okuyucu tikindeki, aynı porttan gelen örnekleri taşır.
+UZUNLUK = struct.Struct("<I")
+KAYIT_YAPILARI = {tip: struct.Struct(f"<dBB{len(alanlar)}f")
+                  for tip, (_, alanlar) in MESAJ_TIPLERI.items()}
+MAKS_PAKET = 1 << 20
+
+
+def yayin_adresi(yol=YAYIN_SOKETI):
+    return f"{YAYIN_ONEKI}{yol}"
+
+
+def paket_olustur(port, ornekler):
+    """Örnekleri tek yayın paketine çevirir, (paket, atlanan) döndürür.
+
+    İkili protokolde tipi olmayan sensörler sessizce, paketlenemeyen
+    örnekler (zamanı yok, sayı olmayan alan, 255'ten büyük sensor_id)
+    atlanan sayılarak geçilir.
+    """
+    port = port.encode()[:255]
+    parcalar = [bytes([len(port)]), port]
+    atlanan = 0
+    for ornek in ornekler:
+        try:
+            tip = SENSOR_TIPLERI.get(ornek.get("sensor"))
+            if tip is None:
+                continue
+            _, alanlar = MESAJ_TIPLERI[tip]
+            degerler = (ornek.get(alan) for alan in alanlar)
+            parcalar.append(KAYIT_YAPILARI[tip].pack(
+                ornek["zaman"], tip, ornek.get("sensor_id", 0),
+                *(math.nan if deger is None else deger for deger in degerler)))
+        except (KeyError, TypeError, struct.error):
+            atlanan += 1
+    govde = b"".join(parcalar)
+    return UZUNLUK.pack(len(govde)) + govde, atlanan
+
+
+class YayinCozucu:
+    """Yayın akışını örneklere çözer; CerceveCozucu ile aynı arayüzü sunar.
+
+    Örnekler yayıncının okuma anındaki zaman damgasını ve okunduğu portu
+    ("kaynak") taşır, okuyucu bunları değiştirmez.
+    """
+    zaman_damgali = True
+
+    def __init__(self):
+        self.tampon = bytearray()
+        self.hatalar = {"cozme": 0, "tasma": 0}
+        self.son_hata = None
+        self.kurtarilan = 0
+
+    def sifirla(self):
+        self.tampon.clear()
+
+    def toplam_hata(self):
+        return sum(self.hatalar.values())
+
+    def besle(self, veri):
+        self.tampon += veri
+        tampon = self.tampon
+        ornekler = []
+        i = 0
+        while len(tampon) - i >= UZUNLUK.size:
+            uzunluk, = UZUNLUK.unpack_from(tampon, i)
+            if uzunluk > MAKS_PAKET:
+                # akış senkronu kaybedildi, eşitlenecek bir işaret olmadığından tampon bırakılır
+                self._hata("tasma", f"Yayın paketi çok uzun: {uzunluk} bayt")
+                tampon.clear()
+                return ornekler, []
+            son = i + UZUNLUK.size + uzunluk
+            if son > len(tampon):
+                break
+            self._paket_coz(memoryview(tampon)[i + UZUNLUK.size:son], ornekler)
+            i = son
+        del tampon[:i]
+        return ornekler, []
+
+    def _paket_coz(self, govde, ornekler):
+        port = bytes(govde[1:1 + govde[0]]).decode(errors="replace")
+        j = 1 + govde[0]
+        while j < len(govde):
+            yapi = KAYIT_YAPILARI.get(govde[j + 8]) if j + 8 < len(govde) else None
+            if yapi is None or j + yapi.size > len(govde):
+                self._hata("cozme", "Geçersiz yayın kaydı")
+                return
+            alanlar = yapi.unpack_from(govde, j)
+            sensor, isimler = MESAJ_TIPLERI[alanlar[1]]
+            ornek = dict(zip(isimler, alanlar[3:]))
+            ornek["sensor"] = sensor
+            ornek["sensor_id"] = alanlar[2]
+            ornek["zaman"] = alanlar[0]
+            ornek["kaynak"] = port
+            ornekler.append(ornek)
+            j += yapi.size
+
+    def _hata(self, tur, mesaj):
+        self.hatalar[tur] += 1
+        self.son_hata = mesaj
+
+
+class _Istemci:
+    def __init__(self, soket):
+        self.soket = soket
+        self.paketler = collections.deque()
+        self.bayt = 0
+        self.ofset = 0  # ilk paketin gönderilmiş kısmı
+        self.dusurulen = 0
+        self.yazma_bekliyor = False  # seçicide EVENT_WRITE kayıtlı mı
+
+
+class YayinSunucusu(threading.Thread):
+    """Canlı örnekleri Unix soketine bağlanan istemcilere yayınlar.
+
+    Örnekler okuyucu thread'lerinden ekle() ile kuyruğa atılır (kaydedici
+    gibi EdinimMerkezi alıcısı olarak eklenir); paketleme ve gönderim bu
+    thread'de, bloklamayan soketlerle yapılır. Her istemcinin kendi gönderim
+    tamponu vardır: okumaya yetişemeyen istemcinin tamponu maks_tampon'u
+    aşınca en eski paketleri atılır, edinim ve diğer istemciler beklemez.
+    Soket dosyası oluşturulamazsa (ör. başka bir sunucu çalışıyorsa) OSError
+    kurucudan yükselir. Thread bir hatayla biterse hata'ya yazılır ve ekle()
+    örnekleri kuyruğa atmayı bırakır, kuyruk sınırsız büyümez.
+    """
+
+    def __init__(self, yol=YAYIN_SOKETI, maks_tampon=4 << 20):
+        super().__init__(daemon=True)
+        self.yol = yol
+        self.maks_tampon = maks_tampon
+        self.kuyruk = queue.SimpleQueue()
+        self.istemciler = {}
+        self.gonderilen = 0  # paket
+        self.dusurulen = 0  # paket
+        self.atlanan = 0  # paketlenemeyen örnek
+        self.hata = None
+        self._dur = threading.Event()
+        self._uyandirildi = False
+        self._uyandir_okur, self._uyandir_yazar = socket.socketpair()
+        self._uyandir_okur.setblocking(False)
+        self._sunucu = self._dinle()
+
+    def _dinle(self):
+        if os.path.exists(self.yol):
+            deneme = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                deneme.connect(self.yol)
+            except OSError:
+                os.unlink(self.yol)  # önceki çalışmadan kalan soket dosyası
+            else:
+                raise OSError(f"{self.yol} üzerinde çalışan bir yayın sunucusu var")
+            finally:
+                deneme.close()
+        sunucu = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sunucu.bind(self.yol)
+        sunucu.listen()
+        sunucu.setblocking(False)
+        return sunucu
+
+    def ekle(self, ornekler):
+        if self._dur.is_set():  # durduruldu ya da thread bitti, okuyan kalmadı
+            return
+        self.kuyruk.put(ornekler)
+        if not self._uyandirildi:
+            self._uyandirildi = True
+            try:
+                self._uyandir_yazar.send(b"\0")
+            except OSError:  # tampon dolu ya da sunucu kapanmış
+                pass
+
+    def durdur(self, bekle=False):
+        self._dur.set()
+        try:
+            self._uyandir_yazar.send(b"\0")
+        except OSError:
+            pass
+        if bekle:
+            self.join()
+
+    def run(self):
+        secici = selectors.DefaultSelector()
+        secici.register(self._sunucu, selectors.EVENT_READ)
+        secici.register(self._uyandir_okur, selectors.EVENT_READ)
+        try:
+            while not self._dur.is_set():
+                for anahtar, olaylar in secici.select(timeout=1.0):
+                    if anahtar.fileobj is self._sunucu:
+                        self._kabul_et(secici)
+                    elif anahtar.fileobj is self._uyandir_okur:
+                        # önce boşaltılır: bayrak indikten sonra gelen uyandırma bir sonraki select'e kalmalı
+                        self._uyandirmalari_oku()
+                        self._uyandirildi = False
+                    else:
+                        istemci = anahtar.data
+                        if olaylar & selectors.EVENT_READ and not self._oku(istemci):
+                            self._birak(secici, istemci)
+                        elif olaylar & selectors.EVENT_WRITE:
+                            self._gonder(secici, istemci)
+                self._kuyrugu_bosalt(secici)
+        except Exception as e:
+            self.hata = str(e)
+        finally:
+            self._dur.set()
+            for istemci in list(self.istemciler.values()):
+                self._birak(secici, istemci)
+            secici.close()
+            self._sunucu.close()
+            self._uyandir_okur.close()
+            self._uyandir_yazar.close()
+            try:
+                os.unlink(self.yol)
+            except OSError:
+                pass
+
+    def _uyandirmalari_oku(self):
+        try:
+            while len(self._uyandir_okur.recv(4096)) == 4096:
+                pass
+        except BlockingIOError:
+            pass
+
+    def _kabul_et(self, secici):
+        try:
+            soket, _ = self._sunucu.accept()
+        except BlockingIOError:
+            return
+        soket.setblocking(False)
+        istemci = self.istemciler[soket] = _Istemci(soket)
+        secici.register(soket, selectors.EVENT_READ, istemci)
+
+    def _oku(self, istemci):
+        # istemciler veri göndermez, okunabilirlik yalnızca bağlantının kapandığını bildirir
+        try:
+            return bool(istemci.soket.recv(4096))
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    def _birak(self, secici, istemci):
+        if self.istemciler.pop(istemci.soket, None) is None:
+            return
+        secici.unregister(istemci.soket)
+        istemci.soket.close()
+
+    def _kuyrugu_bosalt(self, secici):
+        paketler = []
+        while True:
+            try:
+                ornekler = self.kuyruk.get_nowait()
+            except queue.Empty:
+                break
+            if ornekler:
+                paket, atlanan = paket_olustur(ornekler[0].get("port", ""), ornekler)
+                paketler.append(paket)
+                self.atlanan += atlanan
+        if not paketler:
+            return
+        for istemci in list(self.istemciler.values()):
+            bekliyordu = bool(istemci.paketler)
+            istemci.paketler.extend(paketler)
+            istemci.bayt += sum(map(len, paketler))
+            self._tasani_at(istemci)
+            if not bekliyordu:
+                self._gonder(secici, istemci)
+
+    def _tasani_at(self, istemci):
+        # yarım gönderilmiş ilk paket atılmaz, akış paket sınırında kalmalı
+        while istemci.bayt > self.maks_tampon and len(istemci.paketler) > 1:
+            if istemci.ofset:
+                ilk = istemci.paketler.popleft()
+                atilan = istemci.paketler.popleft()
+                istemci.paketler.appendleft(ilk)
+            else:
+                atilan = istemci.paketler.popleft()
+            istemci.bayt -= len(atilan)
+            istemci.dusurulen += 1
+            self.dusurulen += 1
+
+    def _gonder(self, secici, istemci):
+        while istemci.paketler:
+            tamponlar = [memoryview(istemci.paketler[0])[istemci.ofset:]]
+            tamponlar.extend(itertools.islice(istemci.paketler, 1, 256))
+            try:
+                gonderilen = istemci.soket.sendmsg(tamponlar)
+            except BlockingIOError:
+                break
+            except OSError:
+                self._birak(secici, istemci)
+                return
+            istemci.bayt -= gonderilen
+            gonderilen += istemci.ofset
+            while istemci.paketler and gonderilen >= len(istemci.paketler[0]):
+                gonderilen -= len(istemci.paketler.popleft())
+                self.gonderilen += 1
+            istemci.ofset = gonderilen
+        if istemci.yazma_bekliyor != bool(istemci.paketler):
+            istemci.yazma_bekliyor = bool(istemci.paketler)
+            olaylar = selectors.EVENT_READ | (selectors.EVENT_WRITE if istemci.yazma_bekliyor else 0)
+            secici.modify(istemci.soket, olaylar, istemci)